@@ -0,0 +1,99 @@
+// Loading BENCH_ASSET_COUNT small assets: one open+read per file versus
+// a single mapped asset pack with hash lookups.
+
+#include <neutrino/asset_pack.hh>
+
+#include <benchmark/benchmark.h>
+
+#include <cstdio>
+#include <string>
+#include <vector>
+
+namespace {
+
+std::vector<std::string> asset_names() {
+    std::vector<std::string> names;
+    names.reserve(BENCH_ASSET_COUNT);
+    for (int i = 0; i < BENCH_ASSET_COUNT; ++i) {
+        names.push_back("asset_" + std::to_string(i) + ".bin");
+    }
+    return names;
+}
+
+// Sum the bytes so that the data is actually touched
+std::size_t consume(const std::byte* data, std::size_t size) {
+    std::size_t sum = 0;
+    for (std::size_t i = 0; i < size; ++i) {
+        sum += static_cast<std::size_t>(data[i]);
+    }
+    return sum;
+}
+
+void BM_LooseFiles_OpenRead(benchmark::State& state) {
+    const auto names = asset_names();
+    std::vector<std::string> paths;
+    for (const auto& name : names) {
+        paths.push_back(std::string(BENCH_ASSET_DIR) + "/" + name);
+    }
+    std::vector<std::byte> buffer;
+    std::size_t bytes = 0;
+
+    for (auto _ : state) {
+        std::size_t sum = 0;
+        for (const auto& path : paths) {
+            std::FILE* f = std::fopen(path.c_str(), "rb");
+            if (f == nullptr) {
+                state.SkipWithError("cannot open asset");
+                return;
+            }
+            std::fseek(f, 0, SEEK_END);
+            const auto size = static_cast<std::size_t>(std::ftell(f));
+            std::fseek(f, 0, SEEK_SET);
+            buffer.resize(size);
+            const std::size_t got = std::fread(buffer.data(), 1, size, f);
+            std::fclose(f);
+            sum += consume(buffer.data(), got);
+            bytes += got;
+        }
+        benchmark::DoNotOptimize(sum);
+    }
+    state.SetItemsProcessed(state.iterations() * BENCH_ASSET_COUNT);
+    state.SetBytesProcessed(static_cast<std::int64_t>(bytes));
+}
+BENCHMARK(BM_LooseFiles_OpenRead)->Unit(benchmark::kMicrosecond);
+
+void BM_AssetPack_OpenLookup(benchmark::State& state) {
+    const auto names = asset_names();
+    std::size_t bytes = 0;
+
+    for (auto _ : state) {
+        const neutrino::asset_pack pack{BENCH_ASSET_PACK};
+        std::size_t sum = 0;
+        for (const auto& name : names) {
+            const auto data = pack.get(name);
+            sum += consume(data.data(), data.size());
+            bytes += data.size();
+        }
+        benchmark::DoNotOptimize(sum);
+    }
+    state.SetItemsProcessed(state.iterations() * BENCH_ASSET_COUNT);
+    state.SetBytesProcessed(static_cast<std::int64_t>(bytes));
+}
+BENCHMARK(BM_AssetPack_OpenLookup)->Unit(benchmark::kMicrosecond);
+
+void BM_AssetPack_Lookup(benchmark::State& state) {
+    const auto names = asset_names();
+    const neutrino::asset_pack pack{BENCH_ASSET_PACK};
+
+    for (auto _ : state) {
+        for (const auto& name : names) {
+            benchmark::DoNotOptimize(pack.find(name));
+        }
+    }
+    state.SetItemsProcessed(state.iterations() * BENCH_ASSET_COUNT);
+}
+BENCHMARK(BM_AssetPack_Lookup);
+
+}  // namespace
+
+BENCHMARK_MAIN();
@@ -0,0 +1,108 @@
+# =============================================================================
+# NeutrinoAllocator.cmake
+# =============================================================================
+# Pluggable process allocator for the Neutrino ecosystem.
+#
+# Selects the malloc/operator new implementation linked into executables
+# (applications, tests, benchmarks) so that allocation-heavy code can be
+# measured and shipped with mimalloc or jemalloc instead of the C runtime.
+# =============================================================================
+
+include_guard(GLOBAL)
+
+# -----------------------------------------------------------------------------
+# Allocator Options
+# -----------------------------------------------------------------------------
+
+set(NEUTRINO_ALLOCATOR "system" CACHE STRING
+    "Allocator linked into executables (system, mimalloc, jemalloc)"
+)
+set_property(CACHE NEUTRINO_ALLOCATOR PROPERTY STRINGS system mimalloc jemalloc)
+
+if(NOT NEUTRINO_ALLOCATOR MATCHES "^(system|mimalloc|jemalloc)$")
+    message(FATAL_ERROR
+        "[Neutrino] Invalid NEUTRINO_ALLOCATOR '${NEUTRINO_ALLOCATOR}'. "
+        "Expected one of: system, mimalloc, jemalloc."
+    )
+endif()
+
+# -----------------------------------------------------------------------------
+# Effective Allocator
+# -----------------------------------------------------------------------------
+# The requested allocator falls back to the system one where replacing malloc
+# would break the build or its diagnostics.
+
+set(_allocator "${NEUTRINO_ALLOCATOR}")
+set(_allocator_reason "")
+
+if(NOT _allocator STREQUAL "system")
+    if(NEUTRINO_ENABLE_ASAN OR NEUTRINO_ENABLE_MSAN OR NEUTRINO_ENABLE_TSAN)
+        # Sanitizer runtimes intercept malloc themselves
+        set(_allocator_reason "sanitizers enabled")
+    elseif(NEUTRINO_PLATFORM_EMSCRIPTEN)
+        set(_allocator_reason "not supported on Emscripten")
+    elseif(NEUTRINO_PLATFORM_WINDOWS)
+        # Overriding the CRT allocator requires a redirect DLL
+        set(_allocator_reason "static override not supported on Windows")
+    endif()
+
+    if(_allocator_reason)
+        set(_allocator "system")
+    endif()
+endif()
+
+set(NEUTRINO_ALLOCATOR_ACTIVE "${_allocator}" CACHE INTERNAL
+    "Allocator actually linked into executables"
+)
+
+# -----------------------------------------------------------------------------
+# Allocator Functions
+# -----------------------------------------------------------------------------
+
+#[=============================================================================[
+neutrino_target_allocator(<target>)
+
+Link the active allocator into an executable, replacing malloc/free and
+operator new/delete for the whole process. Use it on applications, test
+runners and benchmarks alike so that measurements match production.
+
+The recipe for the selected allocator is fetched on first use. Defines
+NEUTRINO_ALLOCATOR_NAME (e.g. "mimalloc") for the target so programs can
+report which allocator they run with.
+
+Does nothing beyond the definition when the active allocator is "system".
+#]=============================================================================]
+function(neutrino_target_allocator TARGET)
+    get_target_property(_type ${TARGET} TYPE)
+    if(NOT _type STREQUAL "EXECUTABLE")
+        message(FATAL_ERROR
+            "[Neutrino] neutrino_target_allocator(${TARGET}): "
+            "allocators can only be linked into executables"
+        )
+    endif()
+
+    if(NEUTRINO_ALLOCATOR_ACTIVE STREQUAL "mimalloc")
+        include("${NEUTRINO_CMAKE_DIR}/deps/mimalloc.cmake")
+        neutrino_fetch_mimalloc()
+        target_link_libraries(${TARGET} PRIVATE mimalloc::override)
+    elseif(NEUTRINO_ALLOCATOR_ACTIVE STREQUAL "jemalloc")
+        include("${NEUTRINO_CMAKE_DIR}/deps/jemalloc.cmake")
+        neutrino_fetch_jemalloc()
+        target_link_libraries(${TARGET} PRIVATE jemalloc::jemalloc)
+    endif()
+
+    target_compile_definitions(${TARGET} PRIVATE
+        NEUTRINO_ALLOCATOR_NAME="${NEUTRINO_ALLOCATOR_ACTIVE}"
+    )
+    set_target_properties(${TARGET} PROPERTIES NEUTRINO_ALLOCATOR "${NEUTRINO_ALLOCATOR_ACTIVE}")
+endfunction()
+
+# -----------------------------------------------------------------------------
+# Status Output
+# -----------------------------------------------------------------------------
+
+if(_allocator_reason)
+    message(STATUS "[Neutrino] Allocator: system (${NEUTRINO_ALLOCATOR} disabled: ${_allocator_reason})")
+elseif(NOT NEUTRINO_ALLOCATOR_ACTIVE STREQUAL "system")
+    message(STATUS "[Neutrino] Allocator: ${NEUTRINO_ALLOCATOR_ACTIVE}")
+endif()
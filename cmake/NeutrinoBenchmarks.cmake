@@ -0,0 +1,356 @@
+# =============================================================================
+# NeutrinoBenchmarks.cmake
+# =============================================================================
+# Performance regression tests for the Neutrino ecosystem.
+#
+# Registers ctest tests that measure a program instead of only running it:
+# memory budgets that fail when a measurement exceeds its limit, and startup
+# latency benchmarks, so regressions are caught on the build machine rather
+# than on device.
+# =============================================================================
+
+include_guard(GLOBAL)
+
+# -----------------------------------------------------------------------------
+# Memory Budget Options
+# -----------------------------------------------------------------------------
+
+set(NEUTRINO_MEMORY_TOOL "auto" CACHE STRING
+    "Measurement used by neutrino_add_memory_budget() (auto, rusage, massif, heaptrack)"
+)
+set_property(CACHE NEUTRINO_MEMORY_TOOL PROPERTY STRINGS auto rusage massif heaptrack)
+
+if(NOT NEUTRINO_MEMORY_TOOL MATCHES "^(auto|rusage|massif|heaptrack)$")
+    message(FATAL_ERROR
+        "[Neutrino] Invalid NEUTRINO_MEMORY_TOOL '${NEUTRINO_MEMORY_TOOL}'. "
+        "Expected one of: auto, rusage, massif, heaptrack."
+    )
+endif()
+
+set(NEUTRINO_MEMWATCH_SOURCE "${CMAKE_CURRENT_LIST_DIR}/support/neutrino_memwatch.cc" CACHE INTERNAL
+    "Test driver behind neutrino_add_memory_budget()"
+)
+set(NEUTRINO_MEMCOUNT_SOURCE "${CMAKE_CURRENT_LIST_DIR}/support/neutrino_memcount.cc" CACHE INTERNAL
+    "LD_PRELOAD allocation counter used by neutrino_add_memory_budget()"
+)
+set(NEUTRINO_MEMORY_BUDGET_SCRIPT "${CMAKE_CURRENT_LIST_DIR}/support/neutrino_memory_budget.cmake" CACHE INTERNAL
+    "Test-time script behind neutrino_add_memory_budget() for existing tests"
+)
+
+# -----------------------------------------------------------------------------
+# Effective Memory Tool
+# -----------------------------------------------------------------------------
+# auto means the in-process counter: it is cheap enough to run on every ctest
+# invocation. massif and heaptrack are opt-in and fall back when not found.
+
+set(_memory_tool "${NEUTRINO_MEMORY_TOOL}")
+set(_memory_tool_reason "")
+
+if(_memory_tool STREQUAL "auto")
+    set(_memory_tool "rusage")
+elseif(_memory_tool STREQUAL "massif")
+    find_program(NEUTRINO_VALGRIND_EXECUTABLE valgrind)
+    if(NOT NEUTRINO_VALGRIND_EXECUTABLE)
+        set(_memory_tool_reason "valgrind not found")
+    endif()
+elseif(_memory_tool STREQUAL "heaptrack")
+    find_program(NEUTRINO_HEAPTRACK_EXECUTABLE heaptrack)
+    find_program(NEUTRINO_HEAPTRACK_PRINT_EXECUTABLE heaptrack_print)
+    if(NOT NEUTRINO_HEAPTRACK_EXECUTABLE OR NOT NEUTRINO_HEAPTRACK_PRINT_EXECUTABLE)
+        set(_memory_tool_reason "heaptrack not found")
+    endif()
+endif()
+
+if(_memory_tool_reason)
+    set(_memory_tool "rusage")
+endif()
+
+set(NEUTRINO_MEMORY_TOOL_ACTIVE "${_memory_tool}" CACHE INTERNAL
+    "Measurement actually used by neutrino_add_memory_budget()"
+)
+
+# Budgets are meaningless under sanitizer runtimes (shadow memory, quarantine)
+set(_memory_skip_reason "")
+if(NEUTRINO_ENABLE_ASAN OR NEUTRINO_ENABLE_MSAN OR NEUTRINO_ENABLE_TSAN)
+    set(_memory_skip_reason "sanitizers enabled")
+elseif(NEUTRINO_CROSS_COMPILING)
+    set(_memory_skip_reason "cross-compiling")
+elseif(NOT UNIX OR NEUTRINO_PLATFORM_EMSCRIPTEN)
+    set(_memory_skip_reason "requires a POSIX host")
+endif()
+
+set(NEUTRINO_MEMORY_BUDGET_SKIP_REASON "${_memory_skip_reason}" CACHE INTERNAL
+    "Why neutrino_add_memory_budget() tests are disabled (empty when enabled)"
+)
+
+# -----------------------------------------------------------------------------
+# Memory Budget Functions
+# -----------------------------------------------------------------------------
+
+# Build the measurement helpers once per build tree
+function(_neutrino_memory_tools)
+    if(NOT TARGET neutrino_memwatch)
+        add_executable(neutrino_memwatch "${NEUTRINO_MEMWATCH_SOURCE}")
+        target_compile_features(neutrino_memwatch PRIVATE cxx_std_17)
+        set_target_properties(neutrino_memwatch PROPERTIES
+            RUNTIME_OUTPUT_DIRECTORY "${CMAKE_BINARY_DIR}/neutrino-tools"
+        )
+    endif()
+    if(NEUTRINO_PLATFORM_LINUX AND NOT TARGET neutrino_memcount)
+        add_library(neutrino_memcount SHARED "${NEUTRINO_MEMCOUNT_SOURCE}")
+        target_compile_features(neutrino_memcount PRIVATE cxx_std_17)
+        set_target_properties(neutrino_memcount PROPERTIES
+            LIBRARY_OUTPUT_DIRECTORY "${CMAKE_BINARY_DIR}/neutrino-tools"
+        )
+    endif()
+endfunction()
+
+#[=============================================================================[
+neutrino_add_memory_budget(<name>
+    [COMMAND <command> [<arg>...]]
+    [MAX_RSS <bytes>]
+    [MAX_HEAP <bytes>]
+    [MAX_ALLOCS <count>]
+    [WORKING_DIRECTORY <dir>]
+    [LABELS <label>...]
+)
+
+With COMMAND, add a ctest test <name> that runs <command> under a
+lightweight memory measurement and fails when a budget is exceeded (or the
+command fails). If <command> is a target, its output file is used.
+
+Without COMMAND, <name> is an existing test added earlier in the same
+directory. A test <name>_memory is added that looks the test's command,
+working directory and environment up with ctest --show-only=json-v1 and
+runs it under the same measurement; the original test is left as it is.
+
+At least one budget is required. Sizes accept K, M and G suffixes (e.g.
+MAX_RSS 64M).
+
+The measurement follows NEUTRINO_MEMORY_TOOL:
+
+- rusage (auto)  peak RSS from wait4(); on Linux/glibc, peak heap and the
+                 allocation count from an LD_PRELOAD malloc counter
+- massif         peak heap from valgrind --tool=massif
+- heaptrack      peak heap and allocation count from heaptrack
+
+Results are written to ${CMAKE_CURRENT_BINARY_DIR}/<name>.memory.json.
+Budgets the active tool does not measure are reported but not checked.
+The test is labelled "memory" in addition to LABELS.
+
+Under ASan/MSan/TSan, when cross-compiling and on non-POSIX hosts the test
+is registered but disabled.
+#]=============================================================================]
+function(neutrino_add_memory_budget NAME)
+    cmake_parse_arguments(ARG "" "MAX_RSS;MAX_HEAP;MAX_ALLOCS;WORKING_DIRECTORY" "COMMAND;LABELS" ${ARGN})
+
+    if(NOT ARG_COMMAND AND NOT TEST ${NAME})
+        message(FATAL_ERROR
+            "[Neutrino] neutrino_add_memory_budget(${NAME}): "
+            "no COMMAND given and no test ${NAME} in this directory"
+        )
+    endif()
+    if(NOT DEFINED ARG_MAX_RSS AND NOT DEFINED ARG_MAX_HEAP AND NOT DEFINED ARG_MAX_ALLOCS)
+        message(FATAL_ERROR
+            "[Neutrino] neutrino_add_memory_budget(${NAME}): "
+            "at least one of MAX_RSS, MAX_HEAP or MAX_ALLOCS is required"
+        )
+    endif()
+    foreach(_budget MAX_RSS MAX_HEAP)
+        if(DEFINED ARG_${_budget} AND NOT ARG_${_budget} MATCHES "^[0-9]+(\\.[0-9]+)?[KMGkmg]?$")
+            message(FATAL_ERROR
+                "[Neutrino] neutrino_add_memory_budget(${NAME}): "
+                "invalid ${_budget} '${ARG_${_budget}}' (expected bytes with optional K/M/G suffix)"
+            )
+        endif()
+    endforeach()
+    if(DEFINED ARG_MAX_ALLOCS AND NOT ARG_MAX_ALLOCS MATCHES "^[0-9]+$")
+        message(FATAL_ERROR
+            "[Neutrino] neutrino_add_memory_budget(${NAME}): invalid MAX_ALLOCS '${ARG_MAX_ALLOCS}'"
+        )
+    endif()
+    if(NOT ARG_WORKING_DIRECTORY)
+        set(ARG_WORKING_DIRECTORY "${CMAKE_CURRENT_BINARY_DIR}")
+    endif()
+
+    set(_labels memory ${ARG_LABELS})
+
+    if(NOT ARG_COMMAND)
+        set(_test ${NAME}_memory)
+        set(_program "")
+    else()
+        set(_test ${NAME})
+        list(POP_FRONT ARG_COMMAND _program)
+    endif()
+    if(_program AND TARGET ${_program})
+        get_target_property(_allocator ${_program} NEUTRINO_ALLOCATOR)
+        if(_allocator AND NOT _allocator STREQUAL "system"
+           AND NEUTRINO_MEMORY_TOOL_ACTIVE STREQUAL "rusage"
+           AND (DEFINED ARG_MAX_HEAP OR DEFINED ARG_MAX_ALLOCS))
+            message(WARNING
+                "[Neutrino] neutrino_add_memory_budget(${NAME}): ${_program} links ${_allocator}, "
+                "which bypasses the malloc counter; only MAX_RSS is meaningful"
+            )
+        endif()
+        set(_program "$<TARGET_FILE:${_program}>")
+    endif()
+
+    if(NEUTRINO_MEMORY_BUDGET_SKIP_REASON)
+        # Keep the test visible in ctest -N, but never run it
+        if(_program)
+            add_test(NAME ${_test} COMMAND ${_program} ${ARG_COMMAND})
+        else()
+            add_test(NAME ${_test} COMMAND ${CMAKE_COMMAND} -E true)
+        endif()
+        set_tests_properties(${_test} PROPERTIES DISABLED ON LABELS "${_labels}")
+        return()
+    endif()
+
+    _neutrino_memory_tools()
+
+    set(_args
+        --name "${NAME}"
+        --output "${CMAKE_CURRENT_BINARY_DIR}/${NAME}.memory.json"
+        --tool "${NEUTRINO_MEMORY_TOOL_ACTIVE}"
+    )
+    if(DEFINED ARG_MAX_RSS)
+        list(APPEND _args --max-rss "${ARG_MAX_RSS}")
+    endif()
+    if(DEFINED ARG_MAX_HEAP)
+        list(APPEND _args --max-heap "${ARG_MAX_HEAP}")
+    endif()
+    if(DEFINED ARG_MAX_ALLOCS)
+        list(APPEND _args --max-allocs "${ARG_MAX_ALLOCS}")
+    endif()
+    if(NEUTRINO_MEMORY_TOOL_ACTIVE STREQUAL "rusage" AND TARGET neutrino_memcount)
+        list(APPEND _args --preload "$<TARGET_FILE:neutrino_memcount>")
+    elseif(NEUTRINO_MEMORY_TOOL_ACTIVE STREQUAL "massif")
+        list(APPEND _args --valgrind "${NEUTRINO_VALGRIND_EXECUTABLE}")
+    elseif(NEUTRINO_MEMORY_TOOL_ACTIVE STREQUAL "heaptrack")
+        list(APPEND _args
+            --heaptrack "${NEUTRINO_HEAPTRACK_EXECUTABLE}"
+            --heaptrack-print "${NEUTRINO_HEAPTRACK_PRINT_EXECUTABLE}"
+        )
+    endif()
+
+    if(_program)
+        add_test(NAME ${_test}
+            COMMAND $<TARGET_FILE:neutrino_memwatch> ${_args} -- ${_program} ${ARG_COMMAND}
+            WORKING_DIRECTORY "${ARG_WORKING_DIRECTORY}"
+        )
+    else()
+        # The measured command is only known to ctest; resolve it at test time
+        string(REPLACE ";" "|" _args "${_args}")
+        add_test(NAME ${_test}
+            COMMAND ${CMAKE_COMMAND}
+                -DCTEST=${CMAKE_CTEST_COMMAND}
+                -DTEST=${NAME}
+                -DCONFIG=$<CONFIG>
+                -DTEST_DIR=${CMAKE_CURRENT_BINARY_DIR}
+                -DMEMWATCH=$<TARGET_FILE:neutrino_memwatch>
+                "-DMEMWATCH_ARGS=${_args}"
+                -P "${NEUTRINO_MEMORY_BUDGET_SCRIPT}"
+        )
+    endif()
+    set_tests_properties(${_test} PROPERTIES LABELS "${_labels}")
+endfunction()
+
+# -----------------------------------------------------------------------------
+# Startup Benchmarks
+# -----------------------------------------------------------------------------
+
+#[=============================================================================[
+neutrino_add_startup_benchmark(<target>
+    [ARGS <arg>...]
+    [READY_MARKER <string>]
+    [RUNS <n>]
+    [TIMEOUT <seconds>]
+    [LABELS <label>...]
+)
+
+Add a ctest test <target>_startup that launches the executable RUNS times
+(default 10) cold and RUNS times warm, and measures the wall time until it
+exits or, with READY_MARKER, until the marker appears on its stdout (the
+program is then terminated). The test fails when the program fails, or does
+not exit (or print the marker) within TIMEOUT seconds (default 60).
+
+Cold runs drop the page cache when permitted (root), and otherwise evict
+the executable and its shared libraries with posix_fadvise(); on hosts
+without either, only warm runs are measured. Dynamic loader statistics
+(LD_DEBUG=statistics, glibc) are recorded as counters.
+
+Results are written to ${CMAKE_CURRENT_BINARY_DIR}/<target>.startup.json in
+Google Benchmark's JSON format (benchmarks startup/<target>/cold and
+startup/<target>/warm), so they can be compared with the same tools as the
+benchmark::benchmark suites. The test is labelled "benchmark" and "startup"
+in addition to LABELS, and runs serially.
+
+When cross-compiling and on non-POSIX hosts the test is registered but
+disabled. Requires a Python 3 interpreter.
+#]=============================================================================]
+function(neutrino_add_startup_benchmark TARGET)
+    cmake_parse_arguments(ARG "" "READY_MARKER;RUNS;TIMEOUT" "ARGS;LABELS" ${ARGN})
+
+    get_target_property(_type ${TARGET} TYPE)
+    if(NOT _type STREQUAL "EXECUTABLE")
+        message(FATAL_ERROR "[Neutrino] neutrino_add_startup_benchmark: ${TARGET} is not an executable")
+    endif()
+    if(NOT ARG_RUNS)
+        set(ARG_RUNS 10)
+    endif()
+    if(NOT ARG_RUNS MATCHES "^[1-9][0-9]*$")
+        message(FATAL_ERROR "[Neutrino] neutrino_add_startup_benchmark(${TARGET}): invalid RUNS '${ARG_RUNS}'")
+    endif()
+    if(NOT ARG_TIMEOUT)
+        set(ARG_TIMEOUT 60)
+    endif()
+
+    set(_name ${TARGET}_startup)
+    set(_labels benchmark startup ${ARG_LABELS})
+
+    if(NEUTRINO_CROSS_COMPILING OR NOT UNIX OR NEUTRINO_PLATFORM_EMSCRIPTEN)
+        add_test(NAME ${_name} COMMAND ${TARGET} ${ARG_ARGS})
+        set_tests_properties(${_name} PROPERTIES DISABLED ON LABELS "${_labels}")
+        return()
+    endif()
+
+    find_package(Python3 COMPONENTS Interpreter QUIET)
+    if(NOT Python3_Interpreter_FOUND)
+        message(WARNING "[Neutrino] neutrino_add_startup_benchmark(${TARGET}): Python 3 not found; no test added")
+        return()
+    endif()
+
+    set(_args
+        --name ${TARGET}
+        --output "${CMAKE_CURRENT_BINARY_DIR}/${TARGET}.startup.json"
+        --runs ${ARG_RUNS}
+        --timeout ${ARG_TIMEOUT}
+    )
+    if(DEFINED ARG_READY_MARKER)
+        list(APPEND _args --ready-marker "${ARG_READY_MARKER}")
+    endif()
+
+    add_test(NAME ${_name}
+        COMMAND "${Python3_EXECUTABLE}" "${NEUTRINO_SCRIPTS_DIR}/neutrino-startup-bench.py" ${_args}
+            -- $<TARGET_FILE:${TARGET}> ${ARG_ARGS}
+    )
+    # Each run may time out; leave room for all of them
+    math(EXPR _timeout "${ARG_TIMEOUT} * (2 * ${ARG_RUNS} + 2)")
+    set_tests_properties(${_name} PROPERTIES
+        LABELS "${_labels}"
+        RUN_SERIAL ON
+        TIMEOUT ${_timeout}
+    )
+endfunction()
+
+# -----------------------------------------------------------------------------
+# Status Output
+# -----------------------------------------------------------------------------
+
+if(_memory_tool_reason)
+    message(STATUS "[Neutrino] Memory budgets: rusage (${NEUTRINO_MEMORY_TOOL} disabled: ${_memory_tool_reason})")
+elseif(_memory_skip_reason)
+    message(STATUS "[Neutrino] Memory budgets: disabled (${_memory_skip_reason})")
+elseif(NOT NEUTRINO_MEMORY_TOOL STREQUAL "auto")
+    message(STATUS "[Neutrino] Memory budgets: ${NEUTRINO_MEMORY_TOOL_ACTIVE}")
+endif()
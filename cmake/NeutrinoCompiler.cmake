@@ -182,22 +182,272 @@ endif()
 unset(_is_multi_config)
 
 # -----------------------------------------------------------------------------
-# Compiler Feature Detection
+# Probe Cache
+# -----------------------------------------------------------------------------
+# Every try_compile-based probe stores its result in a NEUTRINO_PROBE_* cache
+# entry. The cache is shared by all projects in the build tree (including
+# FetchContent sub-projects) and survives reconfigures, so an unchanged tree
+# reconfigures without a single try_compile.
+#
+# The entries are keyed on the compiler path, compiler version, toolchain
+# file and the C++ compile and executable link flags (which can select
+# another linker, e.g. -fuse-ld=): when any of them changes the whole probe
+# cache is discarded.
 # -----------------------------------------------------------------------------
 
-# Check for specific compiler features we might need
-include(CheckCXXCompilerFlag)
+# Bump when the meaning of a cached probe changes
+set(_neutrino_probe_cache_version 1)
+
+option(NEUTRINO_RESET_PROBE_CACHE "Discard cached compiler probe results on the next configure" OFF)
+
+string(SHA1 _neutrino_probe_key
+    "${_neutrino_probe_cache_version}|${CMAKE_CXX_COMPILER}|${CMAKE_CXX_COMPILER_VERSION}|${CMAKE_TOOLCHAIN_FILE}|${CMAKE_CXX_COMPILER_TARGET}|${CMAKE_OSX_ARCHITECTURES}|${CMAKE_CXX_FLAGS}|${CMAKE_EXE_LINKER_FLAGS}"
+)
+
+if(NEUTRINO_RESET_PROBE_CACHE OR NOT "${NEUTRINO_PROBE_CACHE_KEY}" STREQUAL "${_neutrino_probe_key}")
+    if(DEFINED CACHE{NEUTRINO_PROBE_CACHE_KEY})
+        message(STATUS "[Neutrino] Compiler, toolchain or flags changed, discarding probe cache")
+    endif()
+    get_cmake_property(_cache_vars CACHE_VARIABLES)
+    foreach(_var IN LISTS _cache_vars)
+        if(_var MATCHES "^NEUTRINO_PROBE_")
+            unset(${_var} CACHE)
+        endif()
+    endforeach()
+    unset(_cache_vars)
+    set(NEUTRINO_PROBE_CACHE_KEY "${_neutrino_probe_key}" CACHE INTERNAL "Compiler probe cache key")
+    # One-shot option
+    set(NEUTRINO_RESET_PROBE_CACHE OFF CACHE BOOL
+        "Discard cached compiler probe results on the next configure" FORCE)
+endif()
+unset(_neutrino_probe_key)
+
+#[=============================================================================[
+_neutrino_probe_ran(<name>)
+
+Internal: record that a probe actually ran (reported in the configure summary).
+#]=============================================================================]
+function(_neutrino_probe_ran NAME)
+    set_property(GLOBAL APPEND PROPERTY NEUTRINO_PROBES_RUN "${NAME}")
+endfunction()
+
+#[=============================================================================[
+neutrino_probe_cxx_flag(<flag> <output_var>)
+
+Check whether the C++ compiler accepts <flag>. The result is cached in
+NEUTRINO_PROBE_CXX_FLAG_<flag> and reused across reconfigures and projects.
+Sets <output_var> to ON or OFF in the caller's scope.
+#]=============================================================================]
+function(neutrino_probe_cxx_flag FLAG OUTPUT_VAR)
+    string(MAKE_C_IDENTIFIER "${FLAG}" _id)
+    string(TOUPPER "${_id}" _id)
+    set(_var "NEUTRINO_PROBE_CXX_FLAG${_id}")
+
+    if(NOT DEFINED CACHE{${_var}})
+        include(CheckCXXCompilerFlag)
+        set(CMAKE_REQUIRED_QUIET ON)
+        # check_* results are cache entries of their own; use a throwaway name
+        check_cxx_compiler_flag("${FLAG}" _NEUTRINO_CHECK_CXX${_id})
+        _neutrino_probe_ran("${FLAG}")
+        set(_supported ${_NEUTRINO_CHECK_CXX${_id}})
+        unset(_NEUTRINO_CHECK_CXX${_id} CACHE)
+        if(_supported)
+            set(${_var} ON CACHE INTERNAL "C++ compiler accepts ${FLAG}")
+        else()
+            set(${_var} OFF CACHE INTERNAL "C++ compiler accepts ${FLAG}")
+        endif()
+    endif()
+
+    set(${OUTPUT_VAR} ${${_var}} PARENT_SCOPE)
+endfunction()
+
+#[=============================================================================[
+neutrino_probe_linker_flag(<flag> <output_var>)
+
+Check whether the linker accepts <flag> (as passed through the compiler
+driver, e.g. "-Wl,--as-needed"). Cached like neutrino_probe_cxx_flag.
+#]=============================================================================]
+function(neutrino_probe_linker_flag FLAG OUTPUT_VAR)
+    string(MAKE_C_IDENTIFIER "${FLAG}" _id)
+    string(TOUPPER "${_id}" _id)
+    set(_var "NEUTRINO_PROBE_LINKER_FLAG${_id}")
+
+    if(NOT DEFINED CACHE{${_var}})
+        include(CheckLinkerFlag)
+        set(CMAKE_REQUIRED_QUIET ON)
+        check_linker_flag(CXX "${FLAG}" _NEUTRINO_CHECK_LD${_id})
+        _neutrino_probe_ran("${FLAG}")
+        set(_supported ${_NEUTRINO_CHECK_LD${_id}})
+        unset(_NEUTRINO_CHECK_LD${_id} CACHE)
+        if(_supported)
+            set(${_var} ON CACHE INTERNAL "Linker accepts ${FLAG}")
+        else()
+            set(${_var} OFF CACHE INTERNAL "Linker accepts ${FLAG}")
+        endif()
+    endif()
+
+    set(${OUTPUT_VAR} ${${_var}} PARENT_SCOPE)
+endfunction()
+
+#[=============================================================================[
+neutrino_probe_isa(<isa> <output_var>)
+
+Check whether the compiler can target an instruction set extension.
+<isa> is one of: sse4.2, avx, avx2, avx512, neon. Sets <output_var> to the
+flag enabling it ("" if none is needed) or to "NOTFOUND" when unsupported.
+
+    neutrino_probe_isa(avx2 _avx2_flag)
+    if(_avx2_flag)
+        set_source_files_properties(simd_avx2.cc PROPERTIES COMPILE_OPTIONS "${_avx2_flag}")
+    endif()
+#]=============================================================================]
+function(neutrino_probe_isa ISA OUTPUT_VAR)
+    if(NEUTRINO_COMPILER_IS_MSVC)
+        set(_flags_sse4.2 "")
+        set(_flags_avx "/arch:AVX")
+        set(_flags_avx2 "/arch:AVX2")
+        set(_flags_avx512 "/arch:AVX512")
+    else()
+        set(_flags_sse4.2 "-msse4.2")
+        set(_flags_avx "-mavx")
+        set(_flags_avx2 "-mavx2;-mfma")
+        set(_flags_avx512 "-mavx512f;-mavx512bw;-mavx512vl")
+    endif()
+    if(NEUTRINO_ARCH_ARM64)
+        set(_flags_neon "")
+    elseif(NEUTRINO_ARCH_ARM AND NOT NEUTRINO_COMPILER_IS_MSVC)
+        set(_flags_neon "-mfpu=neon")
+    endif()
+
+    if(NOT DEFINED _flags_${ISA})
+        message(FATAL_ERROR "[Neutrino] neutrino_probe_isa: unknown or unavailable ISA '${ISA}'")
+    endif()
+
+    # ISA flags only make sense for matching architectures
+    set(_arch_ok OFF)
+    if(ISA STREQUAL "neon")
+        if(NEUTRINO_ARCH_ARM OR NEUTRINO_ARCH_ARM64)
+            set(_arch_ok ON)
+        endif()
+    elseif(NEUTRINO_ARCH_X86 OR NEUTRINO_ARCH_X64)
+        set(_arch_ok ON)
+    endif()
+
+    string(MAKE_C_IDENTIFIER "${ISA}" _id)
+    string(TOUPPER "${_id}" _id)
+    set(_var "NEUTRINO_PROBE_ISA_${_id}")
+
+    if(NOT DEFINED CACHE{${_var}})
+        set(_supported OFF)
+        if(_arch_ok)
+            set(_flags ${_flags_${ISA}})
+            if(_flags)
+                include(CheckCXXSourceCompiles)
+                set(CMAKE_REQUIRED_QUIET ON)
+                list(JOIN _flags " " CMAKE_REQUIRED_FLAGS)
+                check_cxx_source_compiles("int main() { return 0; }" _NEUTRINO_CHECK_ISA_${_id})
+                _neutrino_probe_ran("${ISA}")
+                set(_supported ${_NEUTRINO_CHECK_ISA_${_id}})
+                unset(_NEUTRINO_CHECK_ISA_${_id} CACHE)
+            else()
+                set(_supported ON)
+            endif()
+        endif()
+        if(_supported)
+            set(${_var} "${_flags_${ISA}}" CACHE INTERNAL "Flags enabling ${ISA}")
+        else()
+            set(${_var} "NOTFOUND" CACHE INTERNAL "Flags enabling ${ISA}")
+        endif()
+    endif()
+
+    set(${OUTPUT_VAR} "${${_var}}" PARENT_SCOPE)
+endfunction()
+
+# -----------------------------------------------------------------------------
+# Compiler Feature Detection
+# -----------------------------------------------------------------------------
 
 # LTO (Link Time Optimization) support
-set(NEUTRINO_LTO_SUPPORTED OFF)
-if(NOT NEUTRINO_PLATFORM_EMSCRIPTEN)
-    include(CheckIPOSupported OPTIONAL RESULT_VARIABLE _ipo_module_found)
-    if(_ipo_module_found)
-        check_ipo_supported(RESULT NEUTRINO_LTO_SUPPORTED LANGUAGES CXX)
+if(NEUTRINO_PLATFORM_EMSCRIPTEN)
+    set(NEUTRINO_LTO_SUPPORTED OFF)
+else()
+    if(NOT DEFINED CACHE{NEUTRINO_PROBE_IPO_CXX})
+        include(CheckIPOSupported)
+        check_ipo_supported(RESULT _ipo_supported LANGUAGES CXX)
+        _neutrino_probe_ran("IPO")
+        if(_ipo_supported)
+            set(NEUTRINO_PROBE_IPO_CXX ON CACHE INTERNAL "C++ toolchain supports IPO/LTO")
+        else()
+            set(NEUTRINO_PROBE_IPO_CXX OFF CACHE INTERNAL "C++ toolchain supports IPO/LTO")
+        endif()
+        unset(_ipo_supported)
     endif()
-    unset(_ipo_module_found)
+    set(NEUTRINO_LTO_SUPPORTED ${NEUTRINO_PROBE_IPO_CXX})
 endif()
 
+# Linker identification (GNU, gold, lld, mold, Apple, MSVC)
+if(NOT DEFINED CACHE{NEUTRINO_PROBE_LINKER_ID})
+    set(_linker_id "Unknown")
+    if(NEUTRINO_COMPILER_IS_MSVC)
+        set(_linker_id "MSVC")
+    elseif(NEUTRINO_PLATFORM_EMSCRIPTEN)
+        set(_linker_id "wasm-ld")
+    else()
+        if(APPLE)
+            set(_version_flag "-Wl,-v")
+        else()
+            set(_version_flag "-Wl,--version")
+        endif()
+        # The flag strings hold several space-separated arguments each
+        separate_arguments(_cxx_flags NATIVE_COMMAND "${CMAKE_CXX_FLAGS}")
+        separate_arguments(_linker_flags NATIVE_COMMAND "${CMAKE_EXE_LINKER_FLAGS}")
+        execute_process(
+            COMMAND ${CMAKE_CXX_COMPILER} ${_cxx_flags} ${_linker_flags} ${_version_flag}
+            OUTPUT_VARIABLE _linker_out
+            ERROR_VARIABLE _linker_out
+            RESULT_VARIABLE _linker_result
+        )
+        _neutrino_probe_ran("linker")
+        if(_linker_out MATCHES "mold")
+            set(_linker_id "mold")
+        elseif(_linker_out MATCHES "LLD")
+            set(_linker_id "lld")
+        elseif(_linker_out MATCHES "GNU gold")
+            set(_linker_id "gold")
+        elseif(_linker_out MATCHES "GNU ld")
+            set(_linker_id "GNU")
+        elseif(_linker_out MATCHES "PROJECT:(ld|dyld)")
+            set(_linker_id "Apple")
+        endif()
+        unset(_version_flag)
+        unset(_cxx_flags)
+        unset(_linker_flags)
+        unset(_linker_out)
+        unset(_linker_result)
+    endif()
+    set(NEUTRINO_PROBE_LINKER_ID "${_linker_id}" CACHE INTERNAL "Linker used by the C++ compiler driver")
+    unset(_linker_id)
+endif()
+set(NEUTRINO_LINKER_ID "${NEUTRINO_PROBE_LINKER_ID}")
+
+# Report probe activity once, after the top-level project has configured
+get_property(_probe_report_scheduled GLOBAL PROPERTY NEUTRINO_PROBES_REPORT_SCHEDULED)
+if(NOT _probe_report_scheduled)
+    set_property(GLOBAL PROPERTY NEUTRINO_PROBES_REPORT_SCHEDULED ON)
+    function(_neutrino_report_probes)
+        get_property(_ran GLOBAL PROPERTY NEUTRINO_PROBES_RUN)
+        list(LENGTH _ran _ran_count)
+        get_cmake_property(_cache_vars CACHE_VARIABLES)
+        list(FILTER _cache_vars INCLUDE REGEX "^NEUTRINO_PROBE_")
+        list(REMOVE_ITEM _cache_vars NEUTRINO_PROBE_CACHE_KEY)
+        list(LENGTH _cache_vars _cached_count)
+        math(EXPR _reused "${_cached_count} - ${_ran_count}")
+        message(STATUS "[Neutrino] Compiler probes: ${_ran_count} run, ${_reused} cached")
+    endfunction()
+    cmake_language(DEFER DIRECTORY "${CMAKE_SOURCE_DIR}" CALL _neutrino_report_probes)
+endif()
+unset(_probe_report_scheduled)
+
 # -----------------------------------------------------------------------------
 # Utility Functions
 # -----------------------------------------------------------------------------
@@ -217,25 +467,540 @@ function(neutrino_target_compile_features TARGET)
     endif()
 endfunction()
 
+# -----------------------------------------------------------------------------
+# LTO Mode
+# -----------------------------------------------------------------------------
+# Options:
+#   NEUTRINO_LTO_MODE         (default "default") - "default" enables LTO only
+#                             for targets passed to neutrino_enable_lto();
+#                             "full"/"thin" enable it for every target of the
+#                             build, dependencies included; "off" disables it
+#   NEUTRINO_LTO_CACHE_DIR    ThinLTO cache directory (Clang)
+#   NEUTRINO_LTO_CACHE_POLICY ThinLTO cache pruning policy (lld syntax)
+#   NEUTRINO_LTO_JOBS         Parallel LTO backend jobs (empty: all cores)
+# -----------------------------------------------------------------------------
+
+set(NEUTRINO_LTO_MODE "default" CACHE STRING "LTO mode: default, off, full or thin")
+set_property(CACHE NEUTRINO_LTO_MODE PROPERTY STRINGS default off full thin)
+if(NOT NEUTRINO_LTO_MODE MATCHES "^(default|off|full|thin)$")
+    message(FATAL_ERROR "[Neutrino] NEUTRINO_LTO_MODE must be default, off, full or thin, got '${NEUTRINO_LTO_MODE}'")
+endif()
+
+set(NEUTRINO_LTO_CACHE_DIR "${CMAKE_BINARY_DIR}/lto-cache" CACHE PATH "ThinLTO cache directory")
+set(NEUTRINO_LTO_CACHE_POLICY "prune_after=168h:cache_size_bytes=4g" CACHE STRING
+    "ThinLTO cache pruning policy (lld syntax)"
+)
+set(NEUTRINO_LTO_JOBS "" CACHE STRING "Parallel LTO backend jobs (empty: all cores)")
+
+set(_lto_mode "${NEUTRINO_LTO_MODE}")
+set(_lto_reason "")
+if(_lto_mode MATCHES "^(full|thin)$" AND NOT NEUTRINO_LTO_SUPPORTED)
+    set(_lto_mode "off")
+    set(_lto_reason "not supported by the toolchain")
+endif()
+set(NEUTRINO_LTO_MODE_ACTIVE "${_lto_mode}" CACHE INTERNAL "LTO mode actually in effect")
+
+if(_lto_mode MATCHES "^(full|thin)$")
+    set(_lto_jobs "${NEUTRINO_LTO_JOBS}")
+    if(NOT _lto_jobs)
+        cmake_host_system_information(RESULT _lto_jobs QUERY NUMBER_OF_LOGICAL_CORES)
+    endif()
+
+    set(_lto_compile "")
+    set(_lto_link "")
+    if(NEUTRINO_COMPILER_IS_CLANG AND NOT NEUTRINO_COMPILER_IS_MSVC)
+        list(APPEND _lto_compile "-flto=${_lto_mode}")
+        list(APPEND _lto_link "-flto=${_lto_mode}")
+        if(_lto_mode STREQUAL "thin")
+            file(MAKE_DIRECTORY "${NEUTRINO_LTO_CACHE_DIR}")
+            if(NEUTRINO_LINKER_ID STREQUAL "lld")
+                list(APPEND _lto_link
+                    "-Wl,--thinlto-cache-dir=${NEUTRINO_LTO_CACHE_DIR}"
+                    "-Wl,--thinlto-cache-policy=${NEUTRINO_LTO_CACHE_POLICY}"
+                    "-Wl,--thinlto-jobs=${_lto_jobs}"
+                )
+            elseif(NEUTRINO_LINKER_ID MATCHES "^(GNU|gold|mold)$")
+                # Through the LLVM gold plugin
+                list(APPEND _lto_link
+                    "-Wl,-plugin-opt,cache-dir=${NEUTRINO_LTO_CACHE_DIR}"
+                    "-Wl,-plugin-opt,cache-policy=${NEUTRINO_LTO_CACHE_POLICY}"
+                    "-Wl,-plugin-opt,jobs=${_lto_jobs}"
+                )
+            elseif(NEUTRINO_LINKER_ID STREQUAL "Apple")
+                list(APPEND _lto_link
+                    "-Wl,-cache_path_lto,${NEUTRINO_LTO_CACHE_DIR}"
+                    "-Wl,-mllvm,-threads=${_lto_jobs}"
+                )
+            endif()
+        endif()
+    elseif(NEUTRINO_COMPILER_IS_GCC)
+        # GCC has no ThinLTO; "thin" keeps WHOPR's parallel partitions,
+        # "full" optimizes the whole program as one partition
+        list(APPEND _lto_compile "-flto=auto" "-fno-fat-lto-objects")
+        list(APPEND _lto_link "-flto=${_lto_jobs}")
+        if(_lto_mode STREQUAL "thin")
+            list(APPEND _lto_link "-flto-partition=balanced")
+        else()
+            list(APPEND _lto_link "-flto-partition=one")
+        endif()
+    elseif(NEUTRINO_COMPILER_IS_MSVC)
+        list(APPEND _lto_compile "/GL")
+        if(_lto_mode STREQUAL "thin")
+            list(APPEND _lto_link "/INCREMENTAL:NO" "/LTCG:INCREMENTAL")
+        else()
+            list(APPEND _lto_link "/INCREMENTAL:NO" "/LTCG")
+        endif()
+    endif()
+
+    # Directory scope: every target created from here on, FetchContent
+    # dependencies included, is built the same way, and CMake keeps using
+    # the LTO-aware archiver for static libraries
+    set(CMAKE_INTERPROCEDURAL_OPTIMIZATION ON)
+    foreach(_lang C CXX)
+        if(_lto_compile)
+            set(CMAKE_${_lang}_COMPILE_OPTIONS_IPO ${_lto_compile})
+        endif()
+        if(_lto_link)
+            set(CMAKE_${_lang}_LINK_OPTIONS_IPO ${_lto_link})
+        endif()
+    endforeach()
+    unset(_lang)
+    unset(_lto_compile)
+    unset(_lto_link)
+elseif(_lto_mode STREQUAL "off")
+    set(CMAKE_INTERPROCEDURAL_OPTIMIZATION OFF)
+endif()
+
 #[=============================================================================[
 neutrino_enable_lto(<target>)
 
-Enable Link Time Optimization for a target if supported.
+Enable Link Time Optimization for a target if supported. With
+NEUTRINO_LTO_MODE full or thin every target already uses LTO; with off this
+does nothing.
 #]=============================================================================]
 function(neutrino_enable_lto TARGET)
-    if(NEUTRINO_LTO_SUPPORTED)
+    if(NEUTRINO_LTO_SUPPORTED AND NOT NEUTRINO_LTO_MODE_ACTIVE STREQUAL "off")
         set_target_properties(${TARGET} PROPERTIES
             INTERPROCEDURAL_OPTIMIZATION ON
         )
     endif()
 endfunction()
 
+# -----------------------------------------------------------------------------
+# Dependency Optimization
+# -----------------------------------------------------------------------------
+# Options:
+#   NEUTRINO_OPTIMIZE_DEPS (default OFF) - in Debug builds, compile the
+#                          targets of FetchContent dependencies with -O2 so
+#                          only the project's own code runs unoptimized
+# -----------------------------------------------------------------------------
+
+option(NEUTRINO_OPTIMIZE_DEPS "Compile FetchContent dependencies with optimization in Debug builds" OFF)
+
+# Compiled targets of every directory below DIR whose build directory is
+# under FETCHCONTENT_BASE_DIR
+function(_neutrino_dependency_targets DIR OUTPUT_VAR)
+    set(_targets "")
+    get_property(_binary_dir DIRECTORY "${DIR}" PROPERTY BINARY_DIR)
+    string(FIND "${_binary_dir}/" "${_neutrino_deps_dir}/" _pos)
+    if(_pos EQUAL 0)
+        get_property(_dir_targets DIRECTORY "${DIR}" PROPERTY BUILDSYSTEM_TARGETS)
+        foreach(_target IN LISTS _dir_targets)
+            get_target_property(_type ${_target} TYPE)
+            if(_type MATCHES "^(STATIC_LIBRARY|SHARED_LIBRARY|MODULE_LIBRARY|OBJECT_LIBRARY|EXECUTABLE)$")
+                list(APPEND _targets ${_target})
+            endif()
+        endforeach()
+    endif()
+    get_property(_subdirs DIRECTORY "${DIR}" PROPERTY SUBDIRECTORIES)
+    foreach(_subdir IN LISTS _subdirs)
+        _neutrino_dependency_targets("${_subdir}" _sub_targets)
+        list(APPEND _targets ${_sub_targets})
+    endforeach()
+    set(${OUTPUT_VAR} ${_targets} PARENT_SCOPE)
+endfunction()
+
+# Target options follow CMAKE_CXX_FLAGS_DEBUG on the command line, so -O2
+# overrides its -O0/-Og. MSVC rejects /O2 together with the Debug /RTC1.
+if(NEUTRINO_OPTIMIZE_DEPS AND NOT NEUTRINO_COMPILER_IS_MSVC)
+    function(_neutrino_optimize_deps)
+        if(FETCHCONTENT_BASE_DIR)
+            get_filename_component(_neutrino_deps_dir "${FETCHCONTENT_BASE_DIR}" ABSOLUTE BASE_DIR "${CMAKE_BINARY_DIR}")
+        else()
+            set(_neutrino_deps_dir "${CMAKE_BINARY_DIR}/_deps")
+        endif()
+        _neutrino_dependency_targets("${CMAKE_SOURCE_DIR}" _targets)
+        foreach(_target IN LISTS _targets)
+            target_compile_options(${_target} PRIVATE $<$<CONFIG:Debug>:-O2>)
+        endforeach()
+        list(LENGTH _targets _count)
+        message(STATUS "[Neutrino] Debug builds optimize ${_count} dependency target(s)")
+    endfunction()
+    cmake_language(DEFER DIRECTORY "${CMAKE_SOURCE_DIR}" CALL _neutrino_optimize_deps)
+endif()
+
+# -----------------------------------------------------------------------------
+# Link Profile
+# -----------------------------------------------------------------------------
+# Options:
+#   NEUTRINO_LINK_PROFILE     (default "default") - "fast-startup" trims the
+#                             work the dynamic loader does at program start
+#   NEUTRINO_LINK_BINDING     (default "auto") - lazy/now symbol binding;
+#                             "auto" keeps the toolchain default
+#   NEUTRINO_LINK_STATIC_DEPS (default OFF) - build Neutrino dependencies as
+#                             static libraries (see neutrino_library_type)
+# -----------------------------------------------------------------------------
+
+set(NEUTRINO_LINK_PROFILE "default" CACHE STRING "Link profile for executables and shared libraries")
+set_property(CACHE NEUTRINO_LINK_PROFILE PROPERTY STRINGS default fast-startup)
+if(NOT NEUTRINO_LINK_PROFILE MATCHES "^(default|fast-startup)$")
+    message(FATAL_ERROR "[Neutrino] NEUTRINO_LINK_PROFILE must be default or fast-startup, got '${NEUTRINO_LINK_PROFILE}'")
+endif()
+
+set(NEUTRINO_LINK_BINDING "auto" CACHE STRING "Dynamic symbol binding: auto, lazy or now")
+set_property(CACHE NEUTRINO_LINK_BINDING PROPERTY STRINGS auto lazy now)
+if(NOT NEUTRINO_LINK_BINDING MATCHES "^(auto|lazy|now)$")
+    message(FATAL_ERROR "[Neutrino] NEUTRINO_LINK_BINDING must be auto, lazy or now, got '${NEUTRINO_LINK_BINDING}'")
+endif()
+
+option(NEUTRINO_LINK_STATIC_DEPS "Build Neutrino dependencies as static libraries" OFF)
+
+set(NEUTRINO_LOADER_STATS_SCRIPT "${CMAKE_CURRENT_LIST_DIR}/support/neutrino_loader_stats.cmake" CACHE INTERNAL
+    "Build-time script behind neutrino_add_loader_stats()"
+)
+
+#[=============================================================================[
+neutrino_target_link_profile(<target> [NO_SYMBOLIC])
+
+Apply NEUTRINO_LINK_PROFILE and NEUTRINO_LINK_BINDING to an executable or
+shared library. With fast-startup, on ELF linkers:
+
+- -Wl,--as-needed      drop DT_NEEDED entries for unused libraries
+- -Wl,-O1              optimize the dynamic string/hash tables
+- -Wl,--hash-style=gnu faster symbol lookup than SysV hash
+- -Wl,-Bsymbolic-functions (shared libraries) bind calls to the library's
+                       own functions at link time instead of through the PLT
+
+On Apple linkers, -dead_strip_dylibs replaces --as-needed. Every flag is
+probed first. Pass NO_SYMBOLIC for libraries whose functions must stay
+interposable (e.g. ones that are overridden via LD_PRELOAD, or that rely on
+function pointer identity across libraries).
+
+Other target types are ignored.
+#]=============================================================================]
+function(neutrino_target_link_profile TARGET)
+    cmake_parse_arguments(ARG "NO_SYMBOLIC" "" "" ${ARGN})
+
+    get_target_property(_type ${TARGET} TYPE)
+    if(NOT _type MATCHES "^(EXECUTABLE|SHARED_LIBRARY|MODULE_LIBRARY)$")
+        return()
+    endif()
+    if(NEUTRINO_COMPILER_IS_MSVC OR NEUTRINO_PLATFORM_EMSCRIPTEN)
+        return()
+    endif()
+
+    set(_candidates "")
+    if(NEUTRINO_LINK_PROFILE STREQUAL "fast-startup")
+        if(NEUTRINO_LINKER_ID STREQUAL "Apple")
+            list(APPEND _candidates "-Wl,-dead_strip_dylibs")
+        else()
+            list(APPEND _candidates "-Wl,--as-needed" "-Wl,-O1" "-Wl,--hash-style=gnu")
+            if(NOT _type STREQUAL "EXECUTABLE" AND NOT ARG_NO_SYMBOLIC)
+                list(APPEND _candidates "-Wl,-Bsymbolic-functions")
+            endif()
+        endif()
+    endif()
+    if(NOT NEUTRINO_LINK_BINDING STREQUAL "auto" AND NOT NEUTRINO_LINKER_ID STREQUAL "Apple")
+        list(APPEND _candidates "-Wl,-z,${NEUTRINO_LINK_BINDING}")
+    endif()
+
+    foreach(_flag IN LISTS _candidates)
+        neutrino_probe_linker_flag(${_flag} _supported)
+        if(_supported)
+            target_link_options(${TARGET} PRIVATE ${_flag})
+        endif()
+    endforeach()
+endfunction()
+
+#[=============================================================================[
+neutrino_add_loader_stats(<target> [ARGS <arg>...] [RUNS <n>])
+
+Add a <target>_loader_stats custom target that runs the executable with
+LD_DEBUG=statistics and prints the number of shared objects loaded, the
+relocation counts and the median time spent in the dynamic loader.
+
+Only available with glibc on the build host; elsewhere (and when
+cross-compiling) no target is created.
+#]=============================================================================]
+function(neutrino_add_loader_stats TARGET)
+    cmake_parse_arguments(ARG "" "RUNS" "ARGS" ${ARGN})
+
+    get_target_property(_type ${TARGET} TYPE)
+    if(NOT _type STREQUAL "EXECUTABLE")
+        message(FATAL_ERROR "[Neutrino] neutrino_add_loader_stats: ${TARGET} is not an executable")
+    endif()
+    if(NOT NEUTRINO_PLATFORM_LINUX OR NEUTRINO_CROSS_COMPILING)
+        return()
+    endif()
+    if(NOT ARG_RUNS)
+        set(ARG_RUNS 5)
+    endif()
+
+    add_custom_target(${TARGET}_loader_stats
+        COMMAND ${CMAKE_COMMAND}
+            -DEXECUTABLE=$<TARGET_FILE:${TARGET}>
+            "-DARGS=${ARG_ARGS}"
+            -DRUNS=${ARG_RUNS}
+            -P "${NEUTRINO_LOADER_STATS_SCRIPT}"
+        DEPENDS ${TARGET}
+        COMMENT "Measuring dynamic loader work for ${TARGET}"
+        VERBATIM
+    )
+endfunction()
+
+# -----------------------------------------------------------------------------
+# Symbol Visibility
+# -----------------------------------------------------------------------------
+
+set(NEUTRINO_SYMBOL_REPORT_SCRIPT "${CMAKE_CURRENT_LIST_DIR}/support/neutrino_symbol_report.cmake" CACHE INTERNAL
+    "Build-time script behind neutrino_target_visibility(REPORT)"
+)
+
+# ELF linkers that understand --version-script
+if(NEUTRINO_LINKER_ID MATCHES "^(GNU|gold|lld|mold)$")
+    set(NEUTRINO_VERSION_SCRIPT_SUPPORTED ON)
+else()
+    set(NEUTRINO_VERSION_SCRIPT_SUPPORTED OFF)
+endif()
+
+#[=============================================================================[
+neutrino_target_visibility(<target>
+    [VERSION_SCRIPT <file>]
+    [EXPORT_PATTERNS <pattern>...]
+    [REPORT]
+)
+
+Export only the symbols marked for export (e.g. with the macros from
+generate_export_header) instead of everything:
+
+- CXX/C_VISIBILITY_PRESET hidden and VISIBILITY_INLINES_HIDDEN
+- -fno-semantic-interposition, so calls within a shared library can be
+  inlined instead of going through the PLT (GCC; implied by Clang)
+
+Arguments:
+    VERSION_SCRIPT  - Linker version script for shared libraries (ELF only)
+    EXPORT_PATTERNS - Generate a version script instead: C++ symbols matching
+                      these patterns (e.g. "mylib::*") are global, the rest -
+                      including default-visibility symbols of statically
+                      linked dependencies - become local
+    REPORT          - After each link, print the number of exported symbols,
+                      the number default visibility would have exported and
+                      the count from the previous build
+
+Interface libraries are ignored.
+#]=============================================================================]
+function(neutrino_target_visibility TARGET)
+    cmake_parse_arguments(ARG
+        "REPORT"
+        "VERSION_SCRIPT"
+        "EXPORT_PATTERNS"
+        ${ARGN}
+    )
+
+    get_target_property(_type ${TARGET} TYPE)
+    if(_type STREQUAL "INTERFACE_LIBRARY")
+        return()
+    endif()
+
+    set_target_properties(${TARGET} PROPERTIES
+        C_VISIBILITY_PRESET hidden
+        CXX_VISIBILITY_PRESET hidden
+        VISIBILITY_INLINES_HIDDEN ON
+    )
+
+    if(NOT NEUTRINO_COMPILER_IS_MSVC AND NOT NEUTRINO_PLATFORM_EMSCRIPTEN)
+        neutrino_probe_cxx_flag(-fno-semantic-interposition _has_fnsi)
+        if(_has_fnsi)
+            target_compile_options(${TARGET} PRIVATE $<$<COMPILE_LANGUAGE:C,CXX>:-fno-semantic-interposition>)
+        endif()
+    endif()
+
+    if(NOT _type MATCHES "^(SHARED|MODULE)_LIBRARY$")
+        return()
+    endif()
+
+    if(ARG_VERSION_SCRIPT AND ARG_EXPORT_PATTERNS)
+        message(FATAL_ERROR "[Neutrino] neutrino_target_visibility: VERSION_SCRIPT and EXPORT_PATTERNS are mutually exclusive")
+    endif()
+
+    if(ARG_EXPORT_PATTERNS)
+        string(TOUPPER "${TARGET}" _node)
+        string(MAKE_C_IDENTIFIER "${_node}" _node)
+        if(PROJECT_VERSION_MAJOR)
+            string(APPEND _node "_${PROJECT_VERSION_MAJOR}")
+        endif()
+        set(_script "${_node} {\n  global:\n    extern \"C++\" {\n")
+        foreach(_pattern IN LISTS ARG_EXPORT_PATTERNS)
+            string(APPEND _script "      ${_pattern};\n")
+        endforeach()
+        string(APPEND _script "    };\n  local: *;\n};\n")
+        set(ARG_VERSION_SCRIPT "${CMAKE_CURRENT_BINARY_DIR}/${TARGET}.map")
+        file(CONFIGURE OUTPUT "${ARG_VERSION_SCRIPT}" CONTENT "${_script}")
+    endif()
+
+    if(ARG_VERSION_SCRIPT)
+        if(NEUTRINO_VERSION_SCRIPT_SUPPORTED)
+            get_filename_component(ARG_VERSION_SCRIPT "${ARG_VERSION_SCRIPT}" ABSOLUTE)
+            target_link_options(${TARGET} PRIVATE "LINKER:--version-script=${ARG_VERSION_SCRIPT}")
+            set_property(TARGET ${TARGET} APPEND PROPERTY LINK_DEPENDS "${ARG_VERSION_SCRIPT}")
+        else()
+            message(STATUS "[Neutrino] ${TARGET}: version script ignored (linker: ${NEUTRINO_LINKER_ID})")
+        endif()
+    endif()
+
+    if(ARG_REPORT AND CMAKE_NM AND NOT NEUTRINO_COMPILER_IS_MSVC)
+        add_custom_command(TARGET ${TARGET} POST_BUILD
+            COMMAND ${CMAKE_COMMAND}
+                -DLIBRARY=$<TARGET_FILE:${TARGET}>
+                -DSTATE=${CMAKE_CURRENT_BINARY_DIR}/${TARGET}.exported-symbols
+                -DNM=${CMAKE_NM}
+                "-DOBJECTS=$<TARGET_OBJECTS:${TARGET}>"
+                -DAPPLE=${APPLE}
+                -P "${NEUTRINO_SYMBOL_REPORT_SCRIPT}"
+            VERBATIM
+        )
+    endif()
+endfunction()
+
+# -----------------------------------------------------------------------------
+# C++20 Modules
+# -----------------------------------------------------------------------------
+# Named modules need CMake's dependency scanning (CMake 3.28, Ninja or Visual
+# Studio 2022) and a compiler that can emit module dependency info.
+
+set(NEUTRINO_MODULES_MIN_GCC "14.0")
+set(NEUTRINO_MODULES_MIN_CLANG "16.0")
+set(NEUTRINO_MODULES_MIN_MSVC "19.34")
+
+set(_modules_reason "")
+if(CMAKE_VERSION VERSION_LESS 3.28)
+    set(_modules_reason "requires CMake 3.28, have ${CMAKE_VERSION}")
+elseif(NOT CMAKE_GENERATOR MATCHES "^Ninja" AND NOT CMAKE_GENERATOR MATCHES "^Visual Studio (1[7-9]|[2-9][0-9])")
+    set(_modules_reason "generator '${CMAKE_GENERATOR}' cannot scan modules (use Ninja)")
+elseif(NEUTRINO_COMPILER_IS_APPLECLANG)
+    set(_modules_reason "AppleClang has no module dependency scanner")
+elseif(NEUTRINO_COMPILER_IS_GCC)
+    if(NEUTRINO_COMPILER_VERSION VERSION_LESS NEUTRINO_MODULES_MIN_GCC)
+        set(_modules_reason "requires GCC ${NEUTRINO_MODULES_MIN_GCC}")
+    endif()
+elseif(NEUTRINO_COMPILER_IS_CLANG)
+    if(NEUTRINO_COMPILER_VERSION VERSION_LESS NEUTRINO_MODULES_MIN_CLANG)
+        set(_modules_reason "requires Clang ${NEUTRINO_MODULES_MIN_CLANG}")
+    elseif(NOT CMAKE_CXX_COMPILER_CLANG_SCAN_DEPS)
+        set(_modules_reason "clang-scan-deps not found")
+    endif()
+elseif(NEUTRINO_COMPILER_IS_MSVC)
+    if(NEUTRINO_COMPILER_VERSION VERSION_LESS NEUTRINO_MODULES_MIN_MSVC)
+        set(_modules_reason "requires MSVC ${NEUTRINO_MODULES_MIN_MSVC} (Visual Studio 17.4)")
+    endif()
+else()
+    set(_modules_reason "not supported with ${NEUTRINO_COMPILER_NAME}")
+endif()
+
+if(_modules_reason)
+    set(NEUTRINO_MODULES_SUPPORTED OFF)
+else()
+    set(NEUTRINO_MODULES_SUPPORTED ON)
+endif()
+set(NEUTRINO_MODULES_UNSUPPORTED_REASON "${_modules_reason}")
+
+#[=============================================================================[
+neutrino_target_modules(<target>
+    [FILES <file>...]
+    [BASE_DIRS <dir>...]
+    [PUBLIC | PRIVATE]
+)
+
+Add C++20 module interface units to a target as a CXX_MODULES file set.
+The target is scanned for module dependencies and requires C++20. Without
+FILES, only scanning is enabled: use that for targets that import modules
+from other targets but define none themselves.
+
+Arguments:
+    FILES     - Module interface units (e.g. mylib.cppm)
+    BASE_DIRS - Base directories of FILES (default: current source dir)
+    PUBLIC    - Importable by consumers; the default for libraries.
+                neutrino_install_library() installs the interface units and
+                exports them so downstream builds compile their own BMIs.
+    PRIVATE   - Only importable inside the target; the default for
+                executables
+
+Fails with the reason when NEUTRINO_MODULES_SUPPORTED is OFF.
+#]=============================================================================]
+function(neutrino_target_modules TARGET)
+    cmake_parse_arguments(ARG "PUBLIC;PRIVATE" "" "FILES;BASE_DIRS" ${ARGN})
+
+    if(NOT NEUTRINO_MODULES_SUPPORTED)
+        message(FATAL_ERROR
+            "[Neutrino] neutrino_target_modules(${TARGET}): "
+            "C++20 modules are not available: ${NEUTRINO_MODULES_UNSUPPORTED_REASON}"
+        )
+    endif()
+    if(ARG_PUBLIC AND ARG_PRIVATE)
+        message(FATAL_ERROR "[Neutrino] neutrino_target_modules(${TARGET}): PUBLIC and PRIVATE are mutually exclusive")
+    endif()
+
+    get_target_property(_type ${TARGET} TYPE)
+    if(_type STREQUAL "INTERFACE_LIBRARY")
+        message(FATAL_ERROR
+            "[Neutrino] neutrino_target_modules(${TARGET}): "
+            "module interface units must be compiled; use a STATIC or SHARED library"
+        )
+    endif()
+
+    if(ARG_PRIVATE OR (_type STREQUAL "EXECUTABLE" AND NOT ARG_PUBLIC))
+        set(_scope PRIVATE)
+    else()
+        set(_scope PUBLIC)
+    endif()
+    if(NOT ARG_BASE_DIRS)
+        set(ARG_BASE_DIRS "${CMAKE_CURRENT_SOURCE_DIR}")
+    endif()
+
+    target_compile_features(${TARGET} ${_scope} cxx_std_20)
+    set_target_properties(${TARGET} PROPERTIES CXX_SCAN_FOR_MODULES ON)
+    if(NOT ARG_FILES)
+        return()
+    endif()
+
+    target_sources(${TARGET} ${_scope}
+        FILE_SET CXX_MODULES
+        BASE_DIRS ${ARG_BASE_DIRS}
+        FILES ${ARG_FILES}
+    )
+    set_target_properties(${TARGET} PROPERTIES NEUTRINO_CXX_MODULES ${_scope})
+endfunction()
+
 # -----------------------------------------------------------------------------
 # Status Output
 # -----------------------------------------------------------------------------
 
 message(STATUS "[Neutrino] Compiler: ${NEUTRINO_COMPILER_NAME} ${NEUTRINO_COMPILER_VERSION}")
 message(STATUS "[Neutrino] Platform: ${NEUTRINO_PLATFORM_NAME} (${NEUTRINO_ARCH_NAME})")
+message(STATUS "[Neutrino] Linker: ${NEUTRINO_LINKER_ID}")
+if(NOT NEUTRINO_LINK_PROFILE STREQUAL "default" OR NOT NEUTRINO_LINK_BINDING STREQUAL "auto")
+    message(STATUS "[Neutrino] Link profile: ${NEUTRINO_LINK_PROFILE} (binding: ${NEUTRINO_LINK_BINDING})")
+endif()
+if(_lto_reason)
+    message(STATUS "[Neutrino] LTO: off (${NEUTRINO_LTO_MODE} disabled: ${_lto_reason})")
+elseif(NEUTRINO_LTO_MODE_ACTIVE STREQUAL "thin" AND NEUTRINO_COMPILER_IS_CLANG)
+    message(STATUS "[Neutrino] LTO: thin (${_lto_jobs} jobs, cache: ${NEUTRINO_LTO_CACHE_DIR})")
+elseif(NEUTRINO_LTO_MODE_ACTIVE MATCHES "^(full|thin)$")
+    message(STATUS "[Neutrino] LTO: ${NEUTRINO_LTO_MODE_ACTIVE}")
+endif()
+if(NEUTRINO_MODULES_SUPPORTED)
+    message(STATUS "[Neutrino] C++20 modules: supported")
+endif()
 if(NEUTRINO_CROSS_COMPILING)
     message(STATUS "[Neutrino] Cross-compiling: YES")
 endif()
@@ -33,6 +33,16 @@ set(NEUTRINO_CMAKE_DIR "${NEUTRINO_CMAKE_DIR}" CACHE INTERNAL
     "Path to neutrino-cmake modules"
 )
 
+# Helper scripts: scripts/ next to cmake/ in a checkout, cmake/scripts when installed
+if(EXISTS "${NEUTRINO_CMAKE_DIR}/../scripts")
+    get_filename_component(_neutrino_scripts_dir "${NEUTRINO_CMAKE_DIR}/../scripts" ABSOLUTE)
+else()
+    set(_neutrino_scripts_dir "${NEUTRINO_CMAKE_DIR}/scripts")
+endif()
+set(NEUTRINO_SCRIPTS_DIR "${_neutrino_scripts_dir}" CACHE INTERNAL
+    "Path to neutrino-cmake helper scripts"
+)
+
 # Version of neutrino-cmake
 set(NEUTRINO_CMAKE_VERSION "1.0.0")
 
@@ -57,10 +67,25 @@ include("${NEUTRINO_CMAKE_DIR}/NeutrinoWarnings.cmake")
 # 5. Sanitizers - depends on compiler detection
 include("${NEUTRINO_CMAKE_DIR}/NeutrinoSanitizers.cmake")
 
-# 6. Host tools - for cross-compilation support
+# 6. Allocator - depends on sanitizer options
+include("${NEUTRINO_CMAKE_DIR}/NeutrinoAllocator.cmake")
+
+# 7. Tracing - depends on compiler detection
+include("${NEUTRINO_CMAKE_DIR}/NeutrinoTracing.cmake")
+
+# 8. Resources - depends on compiler detection
+include("${NEUTRINO_CMAKE_DIR}/NeutrinoResources.cmake")
+
+# 9. Benchmarks - depends on sanitizer options
+include("${NEUTRINO_CMAKE_DIR}/NeutrinoBenchmarks.cmake")
+
+# 10. Reports - depends on compiler detection
+include("${NEUTRINO_CMAKE_DIR}/NeutrinoReports.cmake")
+
+# 11. Host tools - for cross-compilation support
 include("${NEUTRINO_CMAKE_DIR}/NeutrinoHostTools.cmake")
 
-# 7. Installation helpers
+# 12. Installation helpers
 include("${NEUTRINO_CMAKE_DIR}/NeutrinoInstall.cmake")
 
 # -----------------------------------------------------------------------------
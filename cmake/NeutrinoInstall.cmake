@@ -69,6 +69,7 @@ neutrino_install_library(<target>
     [EXPORT_NAME <name>]
     [CONFIG_TEMPLATE <template>]
     [SKIP_EXPORT]
+    [NO_VISIBILITY]
 )
 
 Install a library with package configuration files.
@@ -82,10 +83,22 @@ Arguments:
     CONFIG_TEMPLATE - Custom Config.cmake.in template
     SKIP_EXPORT     - Skip install(EXPORT), create IMPORTED target manually.
                       Use this when dependencies come from FetchContent.
+    NO_VISIBILITY   - Keep default symbol visibility. Otherwise
+                      neutrino_target_visibility() is applied, so shared
+                      builds export only symbols marked with export macros.
+
+Targets instrumented with neutrino_target_tracing() also install
+<neutrino/trace.hh> so their public headers keep compiling downstream.
+
+Module interface units added with neutrino_target_modules() are installed
+to include/<target>/modules and recorded in the export, so consumers can
+import them (BMIs are rebuilt downstream with the consumer's flags). This
+requires the install(EXPORT) path; with SKIP_EXPORT the units are installed
+but the generated IMPORTED target does not provide them.
 #]=============================================================================]
 function(neutrino_install_library TARGET)
     cmake_parse_arguments(ARG
-        "SKIP_EXPORT"
+        "SKIP_EXPORT;NO_VISIBILITY"
         "NAMESPACE;COMPATIBILITY;EXPORT_NAME;CONFIG_TEMPLATE"
         "DEPENDENCIES"
         ${ARGN}
@@ -111,6 +124,25 @@ function(neutrino_install_library TARGET)
     # Get target type
     get_target_property(_type ${TARGET} TYPE)
 
+    if(NOT ARG_NO_VISIBILITY)
+        neutrino_target_visibility(${TARGET})
+    endif()
+
+    # C++20 module interface units (neutrino_target_modules)
+    set(_module_args "")
+    set(_export_module_args "")
+    get_target_property(_modules ${TARGET} NEUTRINO_CXX_MODULES)
+    if(_modules)
+        set(_module_args FILE_SET CXX_MODULES DESTINATION "${_include_dir}/${TARGET}/modules")
+        set(_export_module_args CXX_MODULES_DIRECTORY "cxx-modules")
+        if(ARG_SKIP_EXPORT)
+            message(WARNING
+                "[Neutrino] neutrino_install_library(${TARGET}): SKIP_EXPORT cannot describe C++20 modules; "
+                "installed consumers will not be able to import them"
+            )
+        endif()
+    endif()
+
     if(ARG_SKIP_EXPORT)
         # Install without EXPORT - for projects using FetchContent dependencies
         if(_type STREQUAL "INTERFACE_LIBRARY")
@@ -122,6 +154,7 @@ function(neutrino_install_library TARGET)
                 RUNTIME DESTINATION "${CMAKE_INSTALL_BINDIR}"
                 LIBRARY DESTINATION "${_lib_dir}"
                 ARCHIVE DESTINATION "${_lib_dir}"
+                ${_module_args}
                 INCLUDES DESTINATION "${_include_dir}"
             )
         endif()
@@ -183,6 +216,7 @@ function(neutrino_install_library TARGET)
                 RUNTIME DESTINATION "${CMAKE_INSTALL_BINDIR}"
                 LIBRARY DESTINATION "${_lib_dir}"
                 ARCHIVE DESTINATION "${_lib_dir}"
+                ${_module_args}
                 INCLUDES DESTINATION "${_include_dir}"
             )
         endif()
@@ -192,6 +226,7 @@ function(neutrino_install_library TARGET)
             FILE ${ARG_EXPORT_NAME}.cmake
             NAMESPACE ${ARG_NAMESPACE}
             DESTINATION "${_cmake_dir}"
+            ${_export_module_args}
         )
 
         # Generate and install package config files
@@ -242,6 +277,14 @@ function(neutrino_install_library TARGET)
         "${CMAKE_CURRENT_BINARY_DIR}/${TARGET}ConfigVersion.cmake"
         DESTINATION "${_cmake_dir}"
     )
+
+    # Ship <neutrino/trace.hh> with libraries instrumented via neutrino_target_tracing()
+    get_target_property(_tracing ${TARGET} NEUTRINO_TRACING)
+    if(_tracing)
+        install(FILES "${NEUTRINO_TRACING_INCLUDE_DIR}/neutrino/trace.hh"
+            DESTINATION "${_include_dir}/neutrino"
+        )
+    endif()
 endfunction()
 
 #[=============================================================================[
@@ -278,6 +278,15 @@ function(neutrino_print_options COMPONENT_NAME)
     if(DEFINED ${PREFIX}_INSTALL)
         message(STATUS "  Install:          ${${PREFIX}_INSTALL}")
     endif()
+    if(DEFINED NEUTRINO_ALLOCATOR_ACTIVE)
+        message(STATUS "  Allocator:        ${NEUTRINO_ALLOCATOR_ACTIVE}")
+    endif()
+    if(DEFINED NEUTRINO_LINK_PROFILE)
+        message(STATUS "  Link profile:     ${NEUTRINO_LINK_PROFILE} (binding: ${NEUTRINO_LINK_BINDING})")
+    endif()
+    if(DEFINED NEUTRINO_LTO_MODE)
+        message(STATUS "  LTO mode:         ${NEUTRINO_LTO_MODE_ACTIVE}")
+    endif()
 
     message(STATUS "")
 endfunction()
@@ -286,13 +295,17 @@ endfunction()
 neutrino_library_type(<component_name> <output_var>)
 
 Returns SHARED or STATIC based on the component's BUILD_SHARED option.
+With NEUTRINO_LINK_STATIC_DEPS, components pulled in as dependencies (i.e.
+not the top-level project) are always STATIC.
 #]=============================================================================]
 function(neutrino_library_type COMPONENT_NAME OUTPUT_VAR)
     string(TOUPPER "${COMPONENT_NAME}" COMP_UPPER)
     string(REPLACE "-" "_" COMP_UPPER "${COMP_UPPER}")
     set(PREFIX "NEUTRINO_${COMP_UPPER}")
 
-    if(${PREFIX}_BUILD_SHARED)
+    if(NEUTRINO_LINK_STATIC_DEPS AND NOT PROJECT_SOURCE_DIR STREQUAL CMAKE_SOURCE_DIR)
+        set(${OUTPUT_VAR} STATIC PARENT_SCOPE)
+    elseif(${PREFIX}_BUILD_SHARED)
         set(${OUTPUT_VAR} SHARED PARENT_SCOPE)
     else()
         set(${OUTPUT_VAR} STATIC PARENT_SCOPE)
@@ -0,0 +1,461 @@
+# =============================================================================
+# NeutrinoReports.cmake
+# =============================================================================
+# Per-target build reports for the Neutrino ecosystem.
+#
+# Collects what the toolchain decided about a target (optimizations applied
+# or missed, where the bytes of a binary come from, what including each
+# public header costs) into JSON next to the build, with summaries and diffs
+# provided by the Python helpers in scripts/.
+# =============================================================================
+
+include_guard(GLOBAL)
+
+# -----------------------------------------------------------------------------
+# Optimization Reports
+# -----------------------------------------------------------------------------
+
+#[=============================================================================[
+neutrino_target_optimization_report(<target>
+    [FILTER vectorize|inline|all]
+    [REMARKS]
+)
+
+Record the compiler's optimization decisions for a target and collect them
+into ${CMAKE_CURRENT_BINARY_DIR}/<target>.opt-report.json after each build.
+
+Arguments:
+    FILTER  - Remarks to keep: vectorize (default), inline or all
+    REMARKS - Also print missed-optimization remarks in the build output
+              (-fopt-info-*-missed on GCC, -Rpass-missed on Clang)
+
+GCC and Clang write -fsave-optimization-record files next to the objects;
+Clang additionally gets -gline-tables-only in configurations without debug
+info, so remarks carry source locations. Adds a <target>_opt_report target
+that prints missed optimizations by location and reason. Reports from two
+builds can be compared with:
+
+    neutrino-opt-report.py diff old.opt-report.json new.opt-report.json
+
+Not supported with MSVC; requires a Python 3 interpreter to collect.
+#]=============================================================================]
+function(neutrino_target_optimization_report TARGET)
+    cmake_parse_arguments(ARG "REMARKS" "FILTER" "" ${ARGN})
+
+    if(NOT ARG_FILTER)
+        set(ARG_FILTER "vectorize")
+    endif()
+    if(NOT ARG_FILTER MATCHES "^(vectorize|inline|all)$")
+        message(FATAL_ERROR
+            "[Neutrino] neutrino_target_optimization_report(${TARGET}): "
+            "invalid FILTER '${ARG_FILTER}'. Expected one of: vectorize, inline, all."
+        )
+    endif()
+
+    if(NEUTRINO_COMPILER_IS_GCC)
+        target_compile_options(${TARGET} PRIVATE -fsave-optimization-record)
+        if(ARG_REMARKS)
+            if(ARG_FILTER STREQUAL "vectorize")
+                target_compile_options(${TARGET} PRIVATE -fopt-info-vec-missed)
+            elseif(ARG_FILTER STREQUAL "inline")
+                target_compile_options(${TARGET} PRIVATE -fopt-info-inline-missed)
+            else()
+                target_compile_options(${TARGET} PRIVATE -fopt-info-missed)
+            endif()
+        endif()
+    elseif(NEUTRINO_COMPILER_IS_CLANG AND NOT NEUTRINO_COMPILER_IS_MSVC)
+        if(ARG_FILTER STREQUAL "vectorize")
+            set(_passes "loop-vectorize|slp-vectorizer")
+        elseif(ARG_FILTER STREQUAL "inline")
+            set(_passes "inline")
+        else()
+            set(_passes ".*")
+        endif()
+        target_compile_options(${TARGET} PRIVATE
+            -fsave-optimization-record
+            "-foptimization-record-passes=${_passes}"
+            $<$<NOT:$<CONFIG:Debug,RelWithDebInfo>>:-gline-tables-only>
+        )
+        if(ARG_REMARKS)
+            target_compile_options(${TARGET} PRIVATE "-Rpass-missed=${_passes}")
+        endif()
+    else()
+        message(STATUS
+            "[Neutrino] neutrino_target_optimization_report(${TARGET}): "
+            "not supported with ${NEUTRINO_COMPILER_NAME}"
+        )
+        return()
+    endif()
+
+    find_package(Python3 COMPONENTS Interpreter QUIET)
+    if(NOT Python3_Interpreter_FOUND)
+        message(WARNING
+            "[Neutrino] neutrino_target_optimization_report(${TARGET}): "
+            "Python 3 not found; records are written but not collected"
+        )
+        return()
+    endif()
+
+    set(_script "${NEUTRINO_SCRIPTS_DIR}/neutrino-opt-report.py")
+    set(_report "${CMAKE_CURRENT_BINARY_DIR}/${TARGET}.opt-report.json")
+
+    add_custom_command(TARGET ${TARGET} POST_BUILD
+        COMMAND "${Python3_EXECUTABLE}" "${_script}" collect
+            --target ${TARGET}
+            --filter ${ARG_FILTER}
+            --output "${_report}"
+            "$<TARGET_OBJECTS:${TARGET}>"
+        COMMAND_EXPAND_LISTS
+        VERBATIM
+    )
+
+    add_custom_target(${TARGET}_opt_report
+        COMMAND "${Python3_EXECUTABLE}" "${_script}" summary "${_report}"
+        DEPENDS ${TARGET}
+        COMMENT "Optimization report for ${TARGET}"
+        VERBATIM
+    )
+    set_target_properties(${TARGET} PROPERTIES NEUTRINO_OPT_REPORT "${_report}")
+endfunction()
+
+# -----------------------------------------------------------------------------
+# Size Reports
+# -----------------------------------------------------------------------------
+
+#[=============================================================================[
+neutrino_target_size_report(<target>
+    [BUDGET <size>]
+    [MAP]
+)
+
+Break down the size of an executable or shared library after each build and
+write it to ${CMAKE_CURRENT_BINARY_DIR}/<target>.size-report.json.
+
+Arguments:
+    BUDGET - Image size limit in bytes (K, M and G suffixes accepted); adds
+             a ctest test <target>_size_budget, labelled "size", that fails
+             when the image exceeds it
+    MAP    - Also write a linker map (<target>.map) and attribute size to
+             dependencies from it, which covers system and runtime libraries
+
+Size is attributed by dependency (the static libraries the target links,
+directly or transitively), by namespace and by template, from nm and readelf
+output. The image size is what the loader maps from the file, so debug info
+does not count against the budget. Adds a <target>_size_report target that
+prints the breakdown. Reports from two builds can be compared with:
+
+    neutrino-size-report.py diff old.size-report.json new.size-report.json
+
+Dependencies are collected at the end of the calling directory, so links
+added after this call are included. Not supported with MSVC; requires nm
+and a Python 3 interpreter.
+#]=============================================================================]
+function(neutrino_target_size_report TARGET)
+    cmake_parse_arguments(ARG "MAP" "BUDGET" "" ${ARGN})
+
+    get_target_property(_type ${TARGET} TYPE)
+    if(NOT _type MATCHES "^(EXECUTABLE|SHARED_LIBRARY|MODULE_LIBRARY)$")
+        message(FATAL_ERROR
+            "[Neutrino] neutrino_target_size_report(${TARGET}): "
+            "expected an executable or shared library, got ${_type}"
+        )
+    endif()
+    if(DEFINED ARG_BUDGET AND NOT ARG_BUDGET MATCHES "^[0-9]+(\\.[0-9]+)?[KMGkmg]?$")
+        message(FATAL_ERROR
+            "[Neutrino] neutrino_target_size_report(${TARGET}): "
+            "invalid BUDGET '${ARG_BUDGET}' (expected bytes with optional K/M/G suffix)"
+        )
+    endif()
+
+    if(NEUTRINO_COMPILER_IS_MSVC OR NEUTRINO_PLATFORM_EMSCRIPTEN OR NOT CMAKE_NM)
+        message(STATUS
+            "[Neutrino] neutrino_target_size_report(${TARGET}): "
+            "not supported with ${NEUTRINO_COMPILER_NAME} on ${NEUTRINO_PLATFORM_NAME}"
+        )
+        return()
+    endif()
+
+    find_package(Python3 COMPONENTS Interpreter QUIET)
+    if(NOT Python3_Interpreter_FOUND)
+        message(WARNING
+            "[Neutrino] neutrino_target_size_report(${TARGET}): "
+            "Python 3 not found; no size report"
+        )
+        return()
+    endif()
+
+    set(_map "")
+    if(ARG_MAP)
+        set(_map "${CMAKE_CURRENT_BINARY_DIR}/${TARGET}.map")
+        if(NEUTRINO_LINKER_ID MATCHES "^(GNU|gold|lld|mold)$")
+            target_link_options(${TARGET} PRIVATE "LINKER:-Map=${_map}")
+        elseif(NEUTRINO_LINKER_ID STREQUAL "Apple")
+            target_link_options(${TARGET} PRIVATE "LINKER:-map,${_map}")
+        else()
+            message(STATUS
+                "[Neutrino] neutrino_target_size_report(${TARGET}): "
+                "no linker map with the ${NEUTRINO_LINKER_ID} linker"
+            )
+            set(_map "")
+        endif()
+    endif()
+
+    set(_script "${NEUTRINO_SCRIPTS_DIR}/neutrino-size-report.py")
+    set(_report "${CMAKE_CURRENT_BINARY_DIR}/${TARGET}.size-report.json")
+
+    set(_args
+        --target ${TARGET}
+        --binary "$<TARGET_FILE:${TARGET}>"
+        --output "${_report}"
+        --nm "${CMAKE_NM}"
+    )
+    if(CMAKE_READELF)
+        list(APPEND _args --readelf "${CMAKE_READELF}")
+    endif()
+    if(_map)
+        list(APPEND _args --map "${_map}")
+    endif()
+    if(DEFINED ARG_BUDGET)
+        list(APPEND _args --budget ${ARG_BUDGET})
+    endif()
+    set_target_properties(${TARGET} PROPERTIES
+        NEUTRINO_SIZE_REPORT "${_report}"
+        NEUTRINO_SIZE_REPORT_ARGS "${_args}"
+    )
+    # The static libraries are only known once the directory is done
+    cmake_language(EVAL CODE
+        "cmake_language(DEFER CALL _neutrino_size_report_collect [[${TARGET}]])"
+    )
+
+    add_custom_target(${TARGET}_size_report
+        COMMAND "${Python3_EXECUTABLE}" "${_script}" summary "${_report}"
+        DEPENDS ${TARGET}
+        COMMENT "Size report for ${TARGET}"
+        VERBATIM
+    )
+
+    if(DEFINED ARG_BUDGET)
+        add_test(NAME ${TARGET}_size_budget
+            COMMAND "${Python3_EXECUTABLE}" "${_script}" check "${_report}"
+        )
+        set_tests_properties(${TARGET}_size_budget PROPERTIES LABELS size)
+    endif()
+endfunction()
+
+# Static libraries linked into <target>, following transitive usage requirements
+function(_neutrino_static_dependencies TARGET OUTPUT_VAR)
+    set(_pending ${TARGET})
+    set(_seen "")
+    set(_result "")
+    while(_pending)
+        list(POP_FRONT _pending _current)
+        # Private links of static libraries show up as $<LINK_ONLY:...>
+        if(_current STREQUAL TARGET)
+            get_target_property(_links ${_current} LINK_LIBRARIES)
+        else()
+            get_target_property(_links ${_current} INTERFACE_LINK_LIBRARIES)
+        endif()
+        if(NOT _links)
+            continue()
+        endif()
+        foreach(_link IN LISTS _links)
+            if(_link MATCHES "^\\$<LINK_ONLY:([^>]+)>$")
+                set(_link "${CMAKE_MATCH_1}")
+            endif()
+            if(NOT TARGET "${_link}" OR _link IN_LIST _seen)
+                continue()
+            endif()
+            list(APPEND _seen ${_link})
+            get_target_property(_aliased ${_link} ALIASED_TARGET)
+            if(_aliased)
+                set(_link ${_aliased})
+            endif()
+            get_target_property(_link_type ${_link} TYPE)
+            get_target_property(_imported ${_link} IMPORTED)
+            if(_link_type STREQUAL "STATIC_LIBRARY" AND NOT _imported AND NOT _link IN_LIST _result)
+                list(APPEND _result ${_link})
+            endif()
+            list(APPEND _pending ${_link})
+        endforeach()
+    endwhile()
+    set(${OUTPUT_VAR} ${_result} PARENT_SCOPE)
+endfunction()
+
+function(_neutrino_size_report_collect TARGET)
+    get_target_property(_args ${TARGET} NEUTRINO_SIZE_REPORT_ARGS)
+    _neutrino_static_dependencies(${TARGET} _deps)
+    foreach(_dep IN LISTS _deps)
+        list(APPEND _args --library "${_dep}=$<TARGET_FILE:${_dep}>")
+    endforeach()
+
+    find_package(Python3 COMPONENTS Interpreter QUIET)
+    add_custom_command(TARGET ${TARGET} POST_BUILD
+        COMMAND "${Python3_EXECUTABLE}" "${NEUTRINO_SCRIPTS_DIR}/neutrino-size-report.py" collect
+            ${_args}
+            "$<TARGET_OBJECTS:${TARGET}>"
+        COMMAND_EXPAND_LISTS
+        VERBATIM
+    )
+endfunction()
+
+# -----------------------------------------------------------------------------
+# Header Cost
+# -----------------------------------------------------------------------------
+
+#[=============================================================================[
+neutrino_add_header_cost_check(<target>
+    [BUDGET_MS <ms>]
+    [BUDGET_LINES <lines>]
+    [BASELINE <report.json>]
+    [THRESHOLD <fraction>]
+    [DIRECTORY <dir>]
+    [EXCLUDE <regex>...]
+)
+
+Compile each public header of a library in a translation unit of its own
+and record what including it costs: compiler CPU time, preprocessed lines
+and the number of files pulled in. Results are collected into
+${CMAKE_CURRENT_BINARY_DIR}/<target>.header-cost.json by a ctest test
+<target>_header_cost, labelled "headers".
+
+Arguments:
+    BUDGET_MS    - Compile time limit per header, in CPU milliseconds
+    BUDGET_LINES - Preprocessed line limit per header
+    BASELINE     - Earlier report; the test fails when a header grows by
+                   more than THRESHOLD (lines) or THRESHOLD + 50 ms (time)
+    THRESHOLD    - Allowed relative growth over the baseline (default 0.1)
+    DIRECTORY    - Headers to check (default ${PROJECT_SOURCE_DIR}/include/
+                   ${PROJECT_NAME}); they are included relative to its parent
+    EXCLUDE      - Regular expressions for headers to skip (e.g. "detail/")
+
+Each translation unit includes its header twice and nothing else, so the
+build of <target>_header_cost fails for a header that is not self-contained
+or lacks an include guard. The units get the usage requirements of <target>
+and are compiled in the current configuration. Commit a report as BASELINE
+to catch a header that starts pulling in <regex> or a whole SDK.
+
+Not supported with MSVC; requires a Python 3 interpreter.
+#]=============================================================================]
+function(neutrino_add_header_cost_check TARGET)
+    cmake_parse_arguments(ARG
+        ""
+        "BUDGET_MS;BUDGET_LINES;BASELINE;THRESHOLD;DIRECTORY"
+        "EXCLUDE"
+        ${ARGN}
+    )
+
+    if(NOT TARGET ${TARGET})
+        message(FATAL_ERROR "[Neutrino] neutrino_add_header_cost_check: ${TARGET} is not a target")
+    endif()
+    foreach(_budget BUDGET_MS BUDGET_LINES)
+        if(DEFINED ARG_${_budget} AND NOT ARG_${_budget} MATCHES "^[0-9]+$")
+            message(FATAL_ERROR
+                "[Neutrino] neutrino_add_header_cost_check(${TARGET}): "
+                "invalid ${_budget} '${ARG_${_budget}}'"
+            )
+        endif()
+    endforeach()
+    if(DEFINED ARG_THRESHOLD AND NOT ARG_THRESHOLD MATCHES "^[0-9]*\\.?[0-9]+$")
+        message(FATAL_ERROR
+            "[Neutrino] neutrino_add_header_cost_check(${TARGET}): "
+            "invalid THRESHOLD '${ARG_THRESHOLD}' (expected a fraction such as 0.1)"
+        )
+    endif()
+    if(NOT ARG_DIRECTORY)
+        set(ARG_DIRECTORY "${PROJECT_SOURCE_DIR}/include/${PROJECT_NAME}")
+    endif()
+    get_filename_component(ARG_DIRECTORY "${ARG_DIRECTORY}" ABSOLUTE)
+    if(NOT IS_DIRECTORY "${ARG_DIRECTORY}")
+        message(FATAL_ERROR
+            "[Neutrino] neutrino_add_header_cost_check(${TARGET}): "
+            "header directory ${ARG_DIRECTORY} does not exist"
+        )
+    endif()
+
+    if(NEUTRINO_COMPILER_IS_MSVC OR NOT (NEUTRINO_COMPILER_IS_GCC OR NEUTRINO_COMPILER_IS_CLANG))
+        message(STATUS
+            "[Neutrino] neutrino_add_header_cost_check(${TARGET}): "
+            "not supported with ${NEUTRINO_COMPILER_NAME}"
+        )
+        return()
+    endif()
+
+    find_package(Python3 COMPONENTS Interpreter QUIET)
+    if(NOT Python3_Interpreter_FOUND)
+        message(WARNING
+            "[Neutrino] neutrino_add_header_cost_check(${TARGET}): "
+            "Python 3 not found; no header cost check"
+        )
+        return()
+    endif()
+
+    get_filename_component(_include_root "${ARG_DIRECTORY}" DIRECTORY)
+    file(GLOB_RECURSE _headers RELATIVE "${_include_root}"
+        "${ARG_DIRECTORY}/*.h" "${ARG_DIRECTORY}/*.hh" "${ARG_DIRECTORY}/*.hpp"
+    )
+    list(SORT _headers)
+    foreach(_regex IN LISTS ARG_EXCLUDE)
+        list(FILTER _headers EXCLUDE REGEX "${_regex}")
+    endforeach()
+    if(NOT _headers)
+        message(FATAL_ERROR
+            "[Neutrino] neutrino_add_header_cost_check(${TARGET}): "
+            "no headers under ${ARG_DIRECTORY}"
+        )
+    endif()
+
+    # One translation unit per header; unchanged units are not rewritten,
+    # so reconfiguring does not recompile them
+    set(_dir "${CMAKE_CURRENT_BINARY_DIR}/${TARGET}_header_cost")
+    set(_sources "")
+    foreach(_header IN LISTS _headers)
+        string(MAKE_C_IDENTIFIER "${_header}" _id)
+        set(_source "${_dir}/${_id}.cc")
+        file(CONFIGURE OUTPUT "${_source}" CONTENT
+            "// Generated by neutrino_add_header_cost_check(); do not edit.\n#include <${_header}>\n#include <${_header}>\n"
+        )
+        list(APPEND _sources "${_source}")
+    endforeach()
+    # Drop units (and results) of headers that were removed or excluded
+    file(GLOB _stale "${_dir}/*.cc")
+    foreach(_source IN LISTS _stale)
+        if(NOT _source IN_LIST _sources)
+            get_filename_component(_stem "${_source}" NAME_WE)
+            file(REMOVE "${_source}" "${_dir}/${_stem}.json")
+        endif()
+    endforeach()
+
+    set(_script "${NEUTRINO_SCRIPTS_DIR}/neutrino-header-cost.py")
+    add_library(${TARGET}_header_cost OBJECT ${_sources})
+    target_link_libraries(${TARGET}_header_cost PRIVATE ${TARGET})
+    # Replaces a project-wide launcher such as ccache, which would hide the cost
+    set_target_properties(${TARGET}_header_cost PROPERTIES
+        CXX_COMPILER_LAUNCHER "${Python3_EXECUTABLE};${_script};measure;--results-dir;${_dir};--"
+    )
+
+    set(_report "${CMAKE_CURRENT_BINARY_DIR}/${TARGET}.header-cost.json")
+    set(_args
+        --results-dir "${_dir}"
+        --output "${_report}"
+        --target ${TARGET}
+    )
+    if(DEFINED ARG_BUDGET_MS)
+        list(APPEND _args --budget-ms ${ARG_BUDGET_MS})
+    endif()
+    if(DEFINED ARG_BUDGET_LINES)
+        list(APPEND _args --budget-lines ${ARG_BUDGET_LINES})
+    endif()
+    if(DEFINED ARG_BASELINE)
+        get_filename_component(_baseline "${ARG_BASELINE}" ABSOLUTE)
+        list(APPEND _args --baseline "${_baseline}")
+    endif()
+    if(DEFINED ARG_THRESHOLD)
+        list(APPEND _args --threshold ${ARG_THRESHOLD})
+    endif()
+
+    add_test(NAME ${TARGET}_header_cost
+        COMMAND "${Python3_EXECUTABLE}" "${_script}" check ${_args}
+    )
+    set_tests_properties(${TARGET}_header_cost PROPERTIES LABELS headers)
+    set_target_properties(${TARGET} PROPERTIES NEUTRINO_HEADER_COST_REPORT "${_report}")
+endfunction()
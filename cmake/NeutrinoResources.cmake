@@ -0,0 +1,410 @@
+# =============================================================================
+# NeutrinoResources.cmake
+# =============================================================================
+# Binary asset embedding for the Neutrino ecosystem.
+#
+# Fonts, palettes, sprite sheets and other assets are linked into a target
+# without being turned into C++ array initializers: each asset becomes its own
+# object file via the assembler's .incbin directive, so embedding tens of
+# megabytes costs seconds of build time and no debug info. A generated header
+# exposes every asset as std::span<const std::byte>.
+#
+# Assets loaded at run time can instead be packed into one memory-mappable
+# archive with an O(1) hash index (neutrino_add_asset_pack).
+# =============================================================================
+
+include_guard(GLOBAL)
+
+# Script used by the array fallback (MSVC, Emscripten)
+set(NEUTRINO_EMBED_ARRAY_SCRIPT "${CMAKE_CURRENT_LIST_DIR}/support/neutrino_embed_array.cmake" CACHE INTERNAL
+    "Build-time script converting a file to a C++ array"
+)
+
+# -----------------------------------------------------------------------------
+# Resource Functions
+# -----------------------------------------------------------------------------
+
+#[=============================================================================[
+neutrino_embed_resources(<target>
+    NAMESPACE <namespace>
+    FILES <file>...
+    [BASE_DIR <dir>]
+    [HEADER <name>]
+    [MODE <auto|incbin|array>]
+)
+
+Embed binary files into a target and generate an accessor header.
+
+Each file gets an accessor named after its path relative to BASE_DIR
+(default: CMAKE_CURRENT_SOURCE_DIR), turned into a C identifier:
+
+    neutrino_embed_resources(onyx_font
+        NAMESPACE onyx::font::assets
+        BASE_DIR ${CMAKE_CURRENT_SOURCE_DIR}/data
+        FILES data/topaz.fnt data/palettes/amiga.pal
+    )
+
+    #include <onyx_font_resources.hh>
+    std::span<const std::byte> fnt = onyx::font::assets::topaz_fnt();
+    std::span<const std::byte> pal = onyx::font::assets::get("palettes/amiga.pal");
+
+The header (default: <target>_resources.hh) is added to the target's
+private include path and requires C++20. Asset data is followed by a NUL
+byte that is not part of the span, so text assets can be used as C strings.
+
+MODE selects how assets are compiled:
+  incbin - one object per asset via .incbin (GCC, Clang, MinGW)
+  array  - generated array initializer, produced at build time
+  auto   - incbin where supported, array on MSVC and Emscripten (default)
+
+Only the object for a modified asset is rebuilt.
+#]=============================================================================]
+function(neutrino_embed_resources TARGET)
+    cmake_parse_arguments(PARSE_ARGV 1 ARG "" "NAMESPACE;BASE_DIR;HEADER;MODE" "FILES")
+
+    if(NOT TARGET ${TARGET})
+        message(FATAL_ERROR "[Neutrino] neutrino_embed_resources: target '${TARGET}' does not exist")
+    endif()
+    get_target_property(_type ${TARGET} TYPE)
+    if(_type STREQUAL "INTERFACE_LIBRARY")
+        message(FATAL_ERROR "[Neutrino] neutrino_embed_resources(${TARGET}): cannot embed into an INTERFACE library")
+    endif()
+    if(NOT ARG_NAMESPACE)
+        message(FATAL_ERROR "[Neutrino] neutrino_embed_resources(${TARGET}): NAMESPACE is required")
+    endif()
+    if(NOT ARG_FILES)
+        message(FATAL_ERROR "[Neutrino] neutrino_embed_resources(${TARGET}): FILES is required")
+    endif()
+    if(NOT ARG_BASE_DIR)
+        set(ARG_BASE_DIR "${CMAKE_CURRENT_SOURCE_DIR}")
+    endif()
+    get_filename_component(ARG_BASE_DIR "${ARG_BASE_DIR}" ABSOLUTE BASE_DIR "${CMAKE_CURRENT_SOURCE_DIR}")
+    if(NOT ARG_HEADER)
+        set(ARG_HEADER "${TARGET}_resources.hh")
+    endif()
+    if(NOT ARG_MODE)
+        set(ARG_MODE "auto")
+    endif()
+
+    if(ARG_MODE STREQUAL "auto")
+        if(NEUTRINO_COMPILER_IS_MSVC OR NEUTRINO_PLATFORM_EMSCRIPTEN)
+            set(ARG_MODE "array")
+        else()
+            set(ARG_MODE "incbin")
+        endif()
+    elseif(NOT ARG_MODE MATCHES "^(incbin|array)$")
+        message(FATAL_ERROR "[Neutrino] neutrino_embed_resources(${TARGET}): invalid MODE '${ARG_MODE}'")
+    endif()
+
+    set(_gen_dir "${CMAKE_CURRENT_BINARY_DIR}/neutrino_resources/${TARGET}")
+    string(REPLACE "::" "_" _ns_id "${ARG_NAMESPACE}")
+    string(MAKE_C_IDENTIFIER "${_ns_id}" _ns_id)
+
+    set(_decls "")
+    set(_accessors "")
+    set(_table "")
+    set(_ids "")
+    set(_sources "")
+
+    foreach(_file IN LISTS ARG_FILES)
+        get_filename_component(_abs "${_file}" ABSOLUTE BASE_DIR "${CMAKE_CURRENT_SOURCE_DIR}")
+        if(NOT EXISTS "${_abs}")
+            message(FATAL_ERROR "[Neutrino] neutrino_embed_resources(${TARGET}): '${_abs}' does not exist")
+        endif()
+        if(_abs MATCHES "[\"\\\\]")
+            message(FATAL_ERROR "[Neutrino] neutrino_embed_resources(${TARGET}): unsupported characters in '${_abs}'")
+        endif()
+
+        file(RELATIVE_PATH _rel "${ARG_BASE_DIR}" "${_abs}")
+        string(MAKE_C_IDENTIFIER "${_rel}" _id)
+        if(_id IN_LIST _ids)
+            message(FATAL_ERROR
+                "[Neutrino] neutrino_embed_resources(${TARGET}): '${_rel}' maps to accessor "
+                "'${_id}' which is already used by another file"
+            )
+        endif()
+        list(APPEND _ids "${_id}")
+
+        set(_sym "neutrino_res_${_ns_id}_${_id}")
+        set(_src "${_gen_dir}/${_id}.cc")
+
+        if(ARG_MODE STREQUAL "incbin")
+            if(CMAKE_SIZEOF_VOID_P EQUAL 8)
+                set(_word ".quad")
+            else()
+                set(_word ".long")
+            endif()
+            file(GENERATE OUTPUT "${_src}" CONTENT
+"// Generated by neutrino_embed_resources() - do not edit.
+// Source: ${_abs}
+
+#if defined(__APPLE__) || (defined(_WIN32) && !defined(_WIN64))
+#define NEUTRINO_RES_SYM(name) \"_\" #name
+#else
+#define NEUTRINO_RES_SYM(name) #name
+#endif
+
+#if defined(__APPLE__)
+#define NEUTRINO_RES_SECTION \"__TEXT,__const\"
+#define NEUTRINO_RES_TYPE(name) \"\"
+#elif defined(_WIN32)
+#define NEUTRINO_RES_SECTION \".rdata,\\\"dr\\\"\"
+#define NEUTRINO_RES_TYPE(name) \"\"
+#else
+#define NEUTRINO_RES_SECTION \".rodata.${_sym},\\\"a\\\",%progbits\"
+#define NEUTRINO_RES_TYPE(name) \".type \" NEUTRINO_RES_SYM(name) \", %object\\n\"
+#endif
+
+__asm__(
+    \".pushsection \" NEUTRINO_RES_SECTION \"\\n\"
+    \".balign 16\\n\"
+    \".globl \" NEUTRINO_RES_SYM(${_sym}_data) \"\\n\"
+    NEUTRINO_RES_TYPE(${_sym}_data)
+    NEUTRINO_RES_SYM(${_sym}_data) \":\\n\"
+    \".incbin \\\"${_abs}\\\"\\n\"
+    NEUTRINO_RES_SYM(${_sym}_end) \":\\n\"
+    \".byte 0\\n\"
+    \".balign 8\\n\"
+    \".globl \" NEUTRINO_RES_SYM(${_sym}_size) \"\\n\"
+    NEUTRINO_RES_TYPE(${_sym}_size)
+    NEUTRINO_RES_SYM(${_sym}_size) \":\\n\"
+    \"${_word} \" NEUTRINO_RES_SYM(${_sym}_end) \" - \" NEUTRINO_RES_SYM(${_sym}_data) \"\\n\"
+    \".popsection\\n\"
+);
+"
+            )
+            set_source_files_properties("${_src}" PROPERTIES
+                GENERATED ON
+                OBJECT_DEPENDS "${_abs}"
+                SKIP_PRECOMPILE_HEADERS ON
+                SKIP_UNITY_BUILD_INCLUSION ON
+            )
+        else()
+            add_custom_command(
+                OUTPUT "${_src}"
+                COMMAND ${CMAKE_COMMAND}
+                    -DINPUT=${_abs}
+                    -DOUTPUT=${_src}
+                    -DSYMBOL=${_sym}
+                    -P "${NEUTRINO_EMBED_ARRAY_SCRIPT}"
+                DEPENDS "${_abs}" "${NEUTRINO_EMBED_ARRAY_SCRIPT}"
+                COMMENT "Embedding ${_rel}"
+                VERBATIM
+            )
+            set_source_files_properties("${_src}" PROPERTIES
+                SKIP_PRECOMPILE_HEADERS ON
+                SKIP_UNITY_BUILD_INCLUSION ON
+            )
+        endif()
+        list(APPEND _sources "${_src}")
+
+        string(APPEND _decls
+            "extern const unsigned char ${_sym}_data[];\n"
+            "extern const std::size_t ${_sym}_size;\n"
+        )
+        string(APPEND _accessors
+            "// ${_rel}\n"
+            "inline std::span<const std::byte> ${_id}() noexcept {\n"
+            "    return {reinterpret_cast<const std::byte*>(${_sym}_data), ${_sym}_size};\n"
+            "}\n\n"
+        )
+        string(APPEND _table "        {\"${_rel}\", &${_id}},\n")
+    endforeach()
+
+    string(MAKE_C_IDENTIFIER "NEUTRINO_RESOURCES_${TARGET}_${ARG_HEADER}" _guard)
+    string(TOUPPER "${_guard}" _guard)
+
+    file(GENERATE OUTPUT "${_gen_dir}/include/${ARG_HEADER}" CONTENT
+"// Generated by neutrino_embed_resources() - do not edit.
+
+#ifndef ${_guard}_
+#define ${_guard}_
+
+#include <cstddef>
+#include <span>
+#include <string_view>
+
+extern \"C\" {
+${_decls}}
+
+namespace ${ARG_NAMESPACE} {
+
+${_accessors}// Look up an asset by its path relative to the embedding base directory.
+// Returns an empty span if there is no such asset.
+inline std::span<const std::byte> get(std::string_view path) noexcept {
+    struct entry {
+        std::string_view path;
+        std::span<const std::byte> (*data)() noexcept;
+    };
+    static constexpr entry entries[] = {
+${_table}    };
+    for (const entry& e : entries) {
+        if (e.path == path) {
+            return e.data();
+        }
+    }
+    return {};
+}
+
+}  // namespace ${ARG_NAMESPACE}
+
+#endif  // ${_guard}_
+"
+    )
+
+    target_sources(${TARGET} PRIVATE ${_sources})
+    target_include_directories(${TARGET} PRIVATE "${_gen_dir}/include")
+    target_compile_features(${TARGET} PRIVATE cxx_std_20)
+endfunction()
+
+# -----------------------------------------------------------------------------
+# Asset Packs
+# -----------------------------------------------------------------------------
+
+set(NEUTRINO_ASSET_PACK_TOOL_SOURCE "${CMAKE_CURRENT_LIST_DIR}/support/neutrino_pack.cc" CACHE INTERNAL
+    "Source of the neutrino_pack build tool"
+)
+
+# Directory containing neutrino/asset_pack*.hh
+set(NEUTRINO_ASSET_PACK_INCLUDE_DIR "${CMAKE_CURRENT_LIST_DIR}/support/include" CACHE INTERNAL
+    "Include directory for <neutrino/asset_pack.hh>"
+)
+
+#[=============================================================================[
+neutrino_add_asset_pack(<name>
+    FILES <file>...
+    [BASE_DIR <dir>]
+    [COMPRESS <none|lz4>]
+    [ALIGN <bytes>]
+    [OUTPUT <file>]
+)
+
+Pack files into a single memory-mappable archive at build time.
+
+Creates a custom target <name> producing OUTPUT (default:
+${CMAKE_CURRENT_BINARY_DIR}/<name>.pack). Assets are stored under their path
+relative to BASE_DIR (default: CMAKE_CURRENT_SOURCE_DIR), with a hash index
+for O(1) lookup. Each entry starts on an ALIGN boundary (default: 4096, the
+page size), so mapped data is suitably aligned for any use.
+
+With COMPRESS lz4, entries that shrink are stored LZ4-compressed and must be
+read with read() instead of the zero-copy get().
+
+The pack path is stored in the target property NEUTRINO_ASSET_PACK_FILE:
+
+    neutrino_add_asset_pack(game_assets
+        BASE_DIR ${CMAKE_CURRENT_SOURCE_DIR}/assets
+        FILES ${_sprites} ${_fonts}
+    )
+    neutrino_target_asset_packs(game PACKS game_assets)
+#]=============================================================================]
+function(neutrino_add_asset_pack NAME)
+    cmake_parse_arguments(PARSE_ARGV 1 ARG "" "BASE_DIR;COMPRESS;ALIGN;OUTPUT" "FILES")
+
+    if(NOT ARG_FILES)
+        message(FATAL_ERROR "[Neutrino] neutrino_add_asset_pack(${NAME}): FILES is required")
+    endif()
+    if(NOT ARG_BASE_DIR)
+        set(ARG_BASE_DIR "${CMAKE_CURRENT_SOURCE_DIR}")
+    endif()
+    get_filename_component(ARG_BASE_DIR "${ARG_BASE_DIR}" ABSOLUTE BASE_DIR "${CMAKE_CURRENT_SOURCE_DIR}")
+    if(NOT ARG_COMPRESS)
+        set(ARG_COMPRESS "none")
+    elseif(NOT ARG_COMPRESS MATCHES "^(none|lz4)$")
+        message(FATAL_ERROR "[Neutrino] neutrino_add_asset_pack(${NAME}): invalid COMPRESS '${ARG_COMPRESS}'")
+    endif()
+    if(NOT ARG_ALIGN)
+        set(ARG_ALIGN 4096)
+    endif()
+    if(NOT ARG_ALIGN MATCHES "^[0-9]+$" OR ARG_ALIGN LESS 8)
+        message(FATAL_ERROR "[Neutrino] neutrino_add_asset_pack(${NAME}): ALIGN must be a power of two >= 8")
+    endif()
+    math(EXPR _align_check "${ARG_ALIGN} & (${ARG_ALIGN} - 1)")
+    if(NOT _align_check EQUAL 0)
+        message(FATAL_ERROR "[Neutrino] neutrino_add_asset_pack(${NAME}): ALIGN must be a power of two >= 8")
+    endif()
+    if(NOT ARG_OUTPUT)
+        set(ARG_OUTPUT "${CMAKE_CURRENT_BINARY_DIR}/${NAME}.pack")
+    endif()
+    get_filename_component(ARG_OUTPUT "${ARG_OUTPUT}" ABSOLUTE BASE_DIR "${CMAKE_CURRENT_BINARY_DIR}")
+
+    _neutrino_require_asset_packer()
+
+    set(_manifest_content "")
+    set(_inputs "")
+    foreach(_file IN LISTS ARG_FILES)
+        get_filename_component(_abs "${_file}" ABSOLUTE BASE_DIR "${CMAKE_CURRENT_SOURCE_DIR}")
+        file(RELATIVE_PATH _rel "${ARG_BASE_DIR}" "${_abs}")
+        string(APPEND _manifest_content "${_rel}\t${_abs}\n")
+        list(APPEND _inputs "${_abs}")
+    endforeach()
+    list(LENGTH _inputs _count)
+
+    set(_manifest "${CMAKE_CURRENT_BINARY_DIR}/neutrino_asset_packs/${NAME}.manifest")
+    file(GENERATE OUTPUT "${_manifest}" CONTENT "${_manifest_content}")
+
+    add_custom_command(
+        OUTPUT "${ARG_OUTPUT}"
+        COMMAND neutrino_pack
+            --manifest "${_manifest}"
+            --output "${ARG_OUTPUT}"
+            --align ${ARG_ALIGN}
+            --compress ${ARG_COMPRESS}
+        DEPENDS ${_inputs} "${_manifest}" neutrino_pack
+        COMMENT "Packing ${NAME} (${_count} files)"
+        VERBATIM
+    )
+    add_custom_target(${NAME} ALL DEPENDS "${ARG_OUTPUT}")
+    set_target_properties(${NAME} PROPERTIES NEUTRINO_ASSET_PACK_FILE "${ARG_OUTPUT}")
+endfunction()
+
+#[=============================================================================[
+neutrino_target_asset_packs(<target> [PACKS <pack>...] [NO_MMAP])
+
+Make the asset pack readers available to a target and build the listed
+packs before it.
+
+By default links neutrino::mio (fetched on first use) for
+<neutrino/asset_pack.hh>. With NO_MMAP only <neutrino/asset_pack_view.hh>,
+which works on any in-memory buffer, is usable. Requires C++20.
+#]=============================================================================]
+function(neutrino_target_asset_packs TARGET)
+    cmake_parse_arguments(PARSE_ARGV 1 ARG "NO_MMAP" "" "PACKS")
+
+    get_target_property(_type ${TARGET} TYPE)
+    if(_type STREQUAL "INTERFACE_LIBRARY")
+        set(_visibility INTERFACE)
+    else()
+        set(_visibility PRIVATE)
+    endif()
+
+    target_include_directories(${TARGET} SYSTEM ${_visibility}
+        $<BUILD_INTERFACE:${NEUTRINO_ASSET_PACK_INCLUDE_DIR}>
+    )
+    target_compile_features(${TARGET} ${_visibility} cxx_std_20)
+
+    if(NOT ARG_NO_MMAP)
+        include("${NEUTRINO_CMAKE_DIR}/deps/mio.cmake")
+        neutrino_fetch_mio()
+        target_link_libraries(${TARGET} ${_visibility} neutrino::mio)
+    endif()
+
+    foreach(_pack IN LISTS ARG_PACKS)
+        add_dependencies(${TARGET} ${_pack})
+    endforeach()
+endfunction()
+
+# Build the neutrino_pack tool once per build tree
+function(_neutrino_require_asset_packer)
+    if(TARGET neutrino_pack)
+        return()
+    endif()
+    neutrino_bootstrap_local_tool(neutrino_pack
+        SOURCES "${NEUTRINO_ASSET_PACK_TOOL_SOURCE}"
+        STD 17
+    )
+    get_target_property(_imported neutrino_pack IMPORTED)
+    if(NOT _imported)
+        target_compile_features(neutrino_pack PRIVATE cxx_std_17)
+    endif()
+endfunction()
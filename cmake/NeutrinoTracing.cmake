@@ -0,0 +1,82 @@
+# =============================================================================
+# NeutrinoTracing.cmake
+# =============================================================================
+# Zero-overhead instrumentation for the Neutrino ecosystem.
+#
+# Provides scoped-zone, counter and frame-mark macros via <neutrino/trace.hh>.
+# When NEUTRINO_ENABLE_TRACING is OFF the macros expand to nothing; when ON,
+# events are buffered in-process and written at exit as a Chrome trace JSON
+# file that opens directly in Perfetto (ui.perfetto.dev) or chrome://tracing.
+# =============================================================================
+
+include_guard(GLOBAL)
+
+# -----------------------------------------------------------------------------
+# Tracing Options
+# -----------------------------------------------------------------------------
+
+option(NEUTRINO_ENABLE_TRACING "Enable NEUTRINO_TRACE_* instrumentation macros" OFF)
+
+set(NEUTRINO_TRACING_OUTPUT "neutrino-trace.json" CACHE STRING
+    "Default trace file written by instrumented programs (overridable via NEUTRINO_TRACE_FILE env var)"
+)
+
+# Directory containing neutrino/trace.hh
+set(NEUTRINO_TRACING_INCLUDE_DIR "${CMAKE_CURRENT_LIST_DIR}/support/include" CACHE INTERNAL
+    "Include directory for <neutrino/trace.hh>"
+)
+
+# -----------------------------------------------------------------------------
+# Tracing Functions
+# -----------------------------------------------------------------------------
+
+#[=============================================================================[
+neutrino_target_tracing(<target>)
+
+Make <neutrino/trace.hh> available to a target and, when NEUTRINO_ENABLE_TRACING
+is ON, activate the NEUTRINO_TRACE_* macros for it.
+
+Visibility is INTERFACE for header-only libraries and PUBLIC otherwise, so
+zones in public headers are active in consumers built in the same tree.
+The enable definition is build-tree only: installed packages never force
+tracing on their consumers.
+
+neutrino_install_library() installs trace.hh alongside targets that use it.
+#]=============================================================================]
+function(neutrino_target_tracing TARGET)
+    get_target_property(_type ${TARGET} TYPE)
+    if(_type STREQUAL "INTERFACE_LIBRARY")
+        set(_visibility INTERFACE)
+    else()
+        set(_visibility PUBLIC)
+    endif()
+
+    target_include_directories(${TARGET} SYSTEM ${_visibility}
+        $<BUILD_INTERFACE:${NEUTRINO_TRACING_INCLUDE_DIR}>
+    )
+
+    if(NEUTRINO_ENABLE_TRACING)
+        if(NEUTRINO_PLATFORM_EMSCRIPTEN)
+            message(STATUS "[Neutrino] Tracing not supported on Emscripten, skipping ${TARGET}")
+        else()
+            target_compile_definitions(${TARGET} ${_visibility}
+                $<BUILD_INTERFACE:NEUTRINO_TRACING_ENABLED=1>
+                $<BUILD_INTERFACE:NEUTRINO_TRACE_DEFAULT_FILE="${NEUTRINO_TRACING_OUTPUT}">
+            )
+            neutrino_target_compile_features(${TARGET} cxx_std_17)
+
+            find_package(Threads REQUIRED)
+            target_link_libraries(${TARGET} ${_visibility} $<BUILD_INTERFACE:Threads::Threads>)
+        endif()
+    endif()
+
+    set_target_properties(${TARGET} PROPERTIES NEUTRINO_TRACING ON)
+endfunction()
+
+# -----------------------------------------------------------------------------
+# Status Output
+# -----------------------------------------------------------------------------
+
+if(NEUTRINO_ENABLE_TRACING)
+    message(STATUS "[Neutrino] Tracing enabled: ${NEUTRINO_TRACING_OUTPUT}")
+endif()
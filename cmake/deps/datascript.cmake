@@ -53,11 +53,14 @@ endfunction()
 
 # Function to use datascript code generator
 # This wraps datascript_generate() if available
+#
+# With BENCHMARK, also generates a Google Benchmark driver measuring parse
+# throughput and allocations for BENCHMARK_TYPES (see _neutrino_datascript_benchmark)
 function(neutrino_datascript_generate)
     cmake_parse_arguments(ARG
-        ""
-        "TARGET;OUTPUT_DIR"
-        "SCHEMAS;IMPORT_DIRS;INCLUDE_DIRS"
+        "BENCHMARK"
+        "TARGET;OUTPUT_DIR;CORPUS_DIR;PARSE_EXPRESSION"
+        "SCHEMAS;IMPORT_DIRS;INCLUDE_DIRS;BENCHMARK_TYPES;BENCHMARK_HEADERS"
         ${ARGN}
     )
 
@@ -76,4 +79,92 @@ function(neutrino_datascript_generate)
         INCLUDE_DIRS ${ARG_INCLUDE_DIRS}
         PRESERVE_PACKAGE_DIRS ON
     )
+
+    if(ARG_BENCHMARK)
+        _neutrino_datascript_benchmark(
+            TARGET ${ARG_TARGET}
+            OUTPUT_DIR ${ARG_OUTPUT_DIR}
+            CORPUS_DIR ${ARG_CORPUS_DIR}
+            PARSE_EXPRESSION ${ARG_PARSE_EXPRESSION}
+            TYPES ${ARG_BENCHMARK_TYPES}
+            HEADERS ${ARG_BENCHMARK_HEADERS}
+        )
+    endif()
+endfunction()
+
+# Generate <target>_parse_bench: one benchmark per (type, corpus file).
+#
+# Corpus layout: <CORPUS_DIR>/<type>/* where <type> is the qualified C++ type
+# name with "::" replaced by "." (e.g. corpus/formats.iff.form/*.iff).
+# PARSE_EXPRESSION is a C++ expression parsing one sample, with @TYPE@,
+# @BEGIN@ and @END@ (const std::uint8_t*) placeholders.
+function(_neutrino_datascript_benchmark)
+    cmake_parse_arguments(ARG
+        ""
+        "TARGET;OUTPUT_DIR;CORPUS_DIR;PARSE_EXPRESSION"
+        "TYPES;HEADERS"
+        ${ARGN}
+    )
+
+    if(NOT ARG_CORPUS_DIR OR NOT ARG_TYPES OR NOT ARG_HEADERS)
+        message(FATAL_ERROR
+            "[Neutrino] neutrino_datascript_generate(BENCHMARK) requires "
+            "CORPUS_DIR, BENCHMARK_TYPES and BENCHMARK_HEADERS"
+        )
+    endif()
+    get_filename_component(ARG_CORPUS_DIR "${ARG_CORPUS_DIR}" ABSOLUTE BASE_DIR "${CMAKE_CURRENT_SOURCE_DIR}")
+    if(NOT ARG_PARSE_EXPRESSION)
+        set(ARG_PARSE_EXPRESSION "@TYPE@::read(@BEGIN@, @END@)")
+    endif()
+
+    include(${NEUTRINO_CMAKE_DIR}/deps/benchmark.cmake)
+    neutrino_fetch_benchmark()
+
+    set(BENCH_TARGET "${ARG_TARGET}")
+    set(BENCH_CORPUS_DIR "${ARG_CORPUS_DIR}")
+    set(BENCH_INCLUDES "")
+    foreach(_header IN LISTS ARG_HEADERS)
+        string(APPEND BENCH_INCLUDES "#include <${_header}>\n")
+    endforeach()
+    set(BENCH_REGISTRATIONS "")
+    foreach(_type IN LISTS ARG_TYPES)
+        string(REPLACE "::" "." _subdir "${_type}")
+        string(REPLACE "@TYPE@" "${_type}" _expr "${ARG_PARSE_EXPRESSION}")
+        string(REPLACE "@BEGIN@" "begin" _expr "${_expr}")
+        string(REPLACE "@END@" "end" _expr "${_expr}")
+        string(APPEND BENCH_REGISTRATIONS
+            "    register_type(\"${_type}\", \"${_subdir}\",\n"
+            "                  [](const std::uint8_t* begin, const std::uint8_t* end) { return ${_expr}; });\n"
+        )
+    endforeach()
+
+    set(_bench "${ARG_TARGET}_parse_bench")
+    set(_source "${CMAKE_CURRENT_BINARY_DIR}/${_bench}.cc")
+    configure_file("${NEUTRINO_CMAKE_DIR}/support/neutrino_datascript_bench.cc.in" "${_source}" @ONLY)
+
+    add_executable(${_bench} "${_source}")
+    target_include_directories(${_bench} PRIVATE "${ARG_OUTPUT_DIR}")
+    target_compile_features(${_bench} PRIVATE cxx_std_17)
+    target_link_libraries(${_bench} PRIVATE benchmark::benchmark)
+    if(TARGET neutrino::datascript)
+        target_link_libraries(${_bench} PRIVATE neutrino::datascript)
+    endif()
+    get_target_property(_type ${ARG_TARGET} TYPE)
+    if(_type MATCHES "LIBRARY$")
+        target_link_libraries(${_bench} PRIVATE ${ARG_TARGET})
+    else()
+        # Generated code lives in an executable; build after it
+        add_dependencies(${_bench} ${ARG_TARGET})
+    endif()
+
+    # Cross-compiled drivers cannot run on the build host
+    if(NOT NEUTRINO_CROSS_COMPILING)
+        add_test(NAME ${_bench}
+            COMMAND ${_bench}
+                --benchmark_min_time=0.1
+                --benchmark_out=${CMAKE_CURRENT_BINARY_DIR}/${_bench}.json
+                --benchmark_out_format=json
+        )
+        set_tests_properties(${_bench} PROPERTIES LABELS benchmark)
+    endif()
 endfunction()
@@ -43,3 +43,113 @@ function(neutrino_fetch_doctest)
     # (MSVC C5285 / N5014), which breaks the build under -Werror / /WX.
     target_compile_definitions(doctest INTERFACE DOCTEST_CONFIG_USE_STD_HEADERS)
 endfunction()
+
+#[=============================================================================[
+neutrino_add_doctest(<target>
+    [TEST_PREFIX <prefix>]
+    [LABELS <label>...]
+    [TIMEOUT <seconds>]
+    [RESOURCE_LOCK <lock>...]
+    [RESOURCE_GROUPS <spec>...]
+    [WORKING_DIRECTORY <dir>]
+    [EXTRA_ARGS <arg>...]
+    [PROPERTIES <name> <value>...]
+)
+
+Register every doctest TEST_CASE in <target> as its own ctest test, so that
+`ctest -j` can run them in parallel and `ctest -R` can select single cases.
+
+After <target> is linked, the executable is asked for its test suites and
+cases (--list-test-suites/--list-test-cases) and the tests are written to a
+file that ctest includes. Discovery is skipped when neither the executable
+nor the options changed. Cases in a TEST_SUITE are labelled with the suite
+name in addition to LABELS.
+
+RESOURCE_LOCK and RESOURCE_GROUPS are applied to every case; the latter is
+used with `ctest --resource-spec-file`.
+
+When cross-compiling without a CROSSCOMPILING_EMULATOR, the executable
+cannot be queried and is registered as a single test instead.
+#]=============================================================================]
+function(neutrino_add_doctest TARGET)
+    cmake_parse_arguments(ARG
+        ""
+        "TEST_PREFIX;TIMEOUT;WORKING_DIRECTORY"
+        "LABELS;RESOURCE_LOCK;RESOURCE_GROUPS;EXTRA_ARGS;PROPERTIES"
+        ${ARGN}
+    )
+
+    if(NOT ARG_WORKING_DIRECTORY)
+        set(ARG_WORKING_DIRECTORY "${CMAKE_CURRENT_BINARY_DIR}")
+    endif()
+
+    get_target_property(_emulator ${TARGET} CROSSCOMPILING_EMULATOR)
+    if(NOT _emulator)
+        set(_emulator "")
+    endif()
+
+    if(NEUTRINO_CROSS_COMPILING AND NOT _emulator)
+        add_test(NAME ${ARG_TEST_PREFIX}${TARGET}
+            COMMAND ${TARGET} ${ARG_EXTRA_ARGS}
+            WORKING_DIRECTORY "${ARG_WORKING_DIRECTORY}"
+        )
+        set(_properties ${ARG_PROPERTIES})
+        foreach(_property LABELS TIMEOUT RESOURCE_LOCK RESOURCE_GROUPS)
+            if(ARG_${_property})
+                list(APPEND _properties ${_property} "${ARG_${_property}}")
+            endif()
+        endforeach()
+        if(_properties)
+            set_tests_properties(${ARG_TEST_PREFIX}${TARGET} PROPERTIES ${_properties})
+        endif()
+        return()
+    endif()
+
+    set(_base "${CMAKE_CURRENT_BINARY_DIR}/${TARGET}")
+    if(NEUTRINO_MULTI_CONFIG)
+        set(_config_suffix "-$<CONFIG>")
+    else()
+        set(_config_suffix "")
+    endif()
+    set(_config_file "${_base}_doctest${_config_suffix}.cmake")
+    set(_tests_file "${_base}_tests${_config_suffix}.cmake")
+
+    # Lists stay ;-separated inside the bracket arguments
+    string(CONCAT _content
+        "set(TEST_EXECUTABLE [==[$<TARGET_FILE:${TARGET}>]==])\n"
+        "set(TEST_FILE [==[${_tests_file}]==])\n"
+        "set(TEST_EXECUTOR [==[${_emulator}]==])\n"
+        "set(TEST_WORKING_DIR [==[${ARG_WORKING_DIRECTORY}]==])\n"
+        "set(TEST_PREFIX [==[${ARG_TEST_PREFIX}]==])\n"
+    )
+    foreach(_name EXTRA_ARGS LABELS TIMEOUT RESOURCE_LOCK RESOURCE_GROUPS PROPERTIES)
+        string(APPEND _content "set(TEST_${_name} [==[${ARG_${_name}}]==])\n")
+    endforeach()
+    file(GENERATE OUTPUT "${_config_file}" CONTENT "${_content}")
+
+    add_custom_command(
+        OUTPUT "${_tests_file}.stamp"
+        COMMAND ${CMAKE_COMMAND}
+            "-DCONFIG=${_config_file}"
+            -P "${NEUTRINO_CMAKE_DIR}/support/neutrino_doctest_discover.cmake"
+        DEPENDS ${TARGET} "${_config_file}" "${NEUTRINO_CMAKE_DIR}/support/neutrino_doctest_discover.cmake"
+        COMMENT "Discovering doctest cases in ${TARGET}"
+        VERBATIM
+    )
+    add_custom_target(${TARGET}_doctest_discovery ALL DEPENDS "${_tests_file}.stamp")
+
+    # Included by ctest; the tests file appears once the target is built
+    if(NEUTRINO_MULTI_CONFIG)
+        set(_include_tests "${_base}_tests-\${CTEST_CONFIGURATION_TYPE}.cmake")
+    else()
+        set(_include_tests "${_tests_file}")
+    endif()
+    file(WRITE "${_base}_include.cmake"
+        "if(EXISTS \"${_include_tests}\")\n"
+        "    include(\"${_include_tests}\")\n"
+        "else()\n"
+        "    add_test(${TARGET}_NOT_BUILT ${TARGET}_NOT_BUILT)\n"
+        "endif()\n"
+    )
+    set_property(DIRECTORY APPEND PROPERTY TEST_INCLUDE_FILES "${_base}_include.cmake")
+endfunction()
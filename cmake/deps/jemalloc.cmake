@@ -0,0 +1,94 @@
+# =============================================================================
+# jemalloc.cmake - jemalloc general-purpose allocator
+# =============================================================================
+# Target: jemalloc::jemalloc
+#
+# Linking jemalloc::jemalloc into an executable replaces malloc/free. A
+# jemalloc built from source is a static archive linked as a whole archive
+# (see below); a system jemalloc is the shared library.
+# Prefer neutrino_target_allocator() from NeutrinoAllocator.cmake over
+# linking it directly.
+# =============================================================================
+
+include_guard(GLOBAL)
+
+set(NEUTRINO_JEMALLOC_VERSION "5.3.0" CACHE STRING "jemalloc version")
+
+function(neutrino_fetch_jemalloc)
+    if(TARGET jemalloc::jemalloc)
+        message(STATUS "[Neutrino] jemalloc already available")
+        return()
+    endif()
+
+    # First try to find system jemalloc
+    find_package(PkgConfig QUIET)
+    if(PkgConfig_FOUND)
+        pkg_check_modules(_neutrino_jemalloc_pc QUIET IMPORTED_TARGET GLOBAL jemalloc)
+        if(TARGET PkgConfig::_neutrino_jemalloc_pc)
+            message(STATUS "[Neutrino] Using system jemalloc ${_neutrino_jemalloc_pc_VERSION}")
+            add_library(jemalloc::jemalloc ALIAS PkgConfig::_neutrino_jemalloc_pc)
+            return()
+        endif()
+    endif()
+
+    if(NEUTRINO_COMPILER_IS_MSVC)
+        message(FATAL_ERROR
+            "[Neutrino] jemalloc cannot be built from source with MSVC. "
+            "Install it system-wide or use NEUTRINO_ALLOCATOR=mimalloc."
+        )
+    endif()
+
+    # jemalloc uses autotools, so build it as an external project
+    message(STATUS "[Neutrino] Fetching jemalloc ${NEUTRINO_JEMALLOC_VERSION}...")
+
+    include(ExternalProject)
+
+    set(_prefix "${CMAKE_BINARY_DIR}/_deps/jemalloc")
+    set(_lib "${_prefix}/lib/${CMAKE_STATIC_LIBRARY_PREFIX}jemalloc_pic${CMAKE_STATIC_LIBRARY_SUFFIX}")
+
+    ExternalProject_Add(jemalloc_external
+        URL https://github.com/jemalloc/jemalloc/releases/download/${NEUTRINO_JEMALLOC_VERSION}/jemalloc-${NEUTRINO_JEMALLOC_VERSION}.tar.bz2
+        PREFIX "${_prefix}"
+        INSTALL_DIR "${_prefix}"
+        CONFIGURE_COMMAND <SOURCE_DIR>/configure
+            --prefix=<INSTALL_DIR>
+            --disable-doc
+            --disable-stats
+            CC=${CMAKE_C_COMPILER}
+            CXX=${CMAKE_CXX_COMPILER}
+        BUILD_COMMAND make build_lib_static
+        INSTALL_COMMAND make install_lib_static install_include
+        BUILD_BYPRODUCTS "${_lib}"
+    )
+
+    # Imported include directories must exist at configure time
+    file(MAKE_DIRECTORY "${_prefix}/include")
+
+    add_library(jemalloc_static STATIC IMPORTED GLOBAL)
+    set_target_properties(jemalloc_static PROPERTIES
+        IMPORTED_LOCATION "${_lib}"
+        INTERFACE_INCLUDE_DIRECTORIES "${_prefix}/include"
+        INTERFACE_LINK_LIBRARIES "${CMAKE_THREAD_LIBS_INIT};${CMAKE_DL_LIBS}"
+    )
+    add_dependencies(jemalloc_static jemalloc_external)
+
+    # The linker only takes archive members for symbols that are still
+    # undefined, and malloc is mostly reached through libstdc++/libc, which
+    # come later on the link line. Link the whole archive so the executable
+    # always defines malloc/free.
+    add_library(jemalloc::jemalloc INTERFACE IMPORTED GLOBAL)
+    if(CMAKE_VERSION VERSION_GREATER_EQUAL 3.24)
+        set_target_properties(jemalloc::jemalloc PROPERTIES
+            INTERFACE_LINK_LIBRARIES "$<LINK_LIBRARY:WHOLE_ARCHIVE,jemalloc_static>"
+        )
+    elseif(APPLE)
+        set_target_properties(jemalloc::jemalloc PROPERTIES
+            INTERFACE_LINK_LIBRARIES "jemalloc_static"
+            INTERFACE_LINK_OPTIONS "LINKER:-force_load,${_lib}"
+        )
+    else()
+        set_target_properties(jemalloc::jemalloc PROPERTIES
+            INTERFACE_LINK_LIBRARIES "-Wl,--whole-archive;jemalloc_static;-Wl,--no-whole-archive"
+        )
+    endif()
+endfunction()
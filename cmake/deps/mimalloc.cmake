@@ -0,0 +1,56 @@
+# =============================================================================
+# mimalloc.cmake - Microsoft mimalloc general-purpose allocator
+# =============================================================================
+# Targets:
+#   mimalloc::mimalloc  - static library (explicit mi_* API)
+#   mimalloc::override  - object library; linking it into an executable
+#                         replaces malloc/free and operator new/delete
+#
+# Prefer neutrino_target_allocator() from NeutrinoAllocator.cmake over
+# linking these targets directly.
+# =============================================================================
+
+include_guard(GLOBAL)
+
+set(NEUTRINO_MIMALLOC_VERSION "2.1.7" CACHE STRING "mimalloc version")
+
+function(neutrino_fetch_mimalloc)
+    if(TARGET mimalloc::mimalloc)
+        message(STATUS "[Neutrino] mimalloc already available")
+        return()
+    endif()
+
+    message(STATUS "[Neutrino] Fetching mimalloc ${NEUTRINO_MIMALLOC_VERSION}...")
+
+    include(FetchContent)
+
+    FetchContent_Declare(mimalloc
+        GIT_REPOSITORY https://github.com/microsoft/mimalloc.git
+        GIT_TAG v${NEUTRINO_MIMALLOC_VERSION}
+        GIT_SHALLOW TRUE
+    )
+
+    # Static + object builds only; the object file is what overrides malloc
+    # (linkers resolve symbols from object files before archives).
+    set(MI_BUILD_SHARED OFF CACHE BOOL "" FORCE)
+    set(MI_BUILD_STATIC ON CACHE BOOL "" FORCE)
+    set(MI_BUILD_OBJECT ON CACHE BOOL "" FORCE)
+    set(MI_BUILD_TESTS OFF CACHE BOOL "" FORCE)
+    set(MI_OVERRIDE ON CACHE BOOL "" FORCE)
+
+    FetchContent_MakeAvailable(mimalloc)
+
+    if(TARGET mimalloc-static AND NOT TARGET mimalloc::mimalloc)
+        add_library(mimalloc::mimalloc ALIAS mimalloc-static)
+    endif()
+    if(TARGET mimalloc-obj AND NOT TARGET mimalloc::override)
+        add_library(mimalloc::override ALIAS mimalloc-obj)
+    endif()
+
+    # Suppress warnings for third-party library
+    foreach(_lib mimalloc-static mimalloc-obj)
+        if(TARGET ${_lib})
+            neutrino_suppress_warnings(${_lib})
+        endif()
+    endforeach()
+endfunction()
@@ -0,0 +1,56 @@
+// =============================================================================
+// neutrino/asset_pack.hh - Memory-mapped asset pack reader
+// =============================================================================
+// Shipped with neutrino-cmake. Opens a pack produced by
+// neutrino_add_asset_pack() with a single mmap (via neutrino::mio) and serves
+// zero-copy lookups by name:
+//
+//   neutrino::asset_pack pack{"assets.pack"};
+//   std::span<const std::byte> font = pack.get("fonts/topaz.fnt");
+//
+// Link neutrino::mio, or use neutrino_target_asset_packs() which does.
+// =============================================================================
+
+#ifndef NEUTRINO_ASSET_PACK_HH_
+#define NEUTRINO_ASSET_PACK_HH_
+
+#include <neutrino/asset_pack_view.hh>
+
+#include <mio/mmap.hpp>
+
+#include <string>
+#include <vector>
+
+namespace neutrino {
+
+class asset_pack {
+public:
+    using entry = asset_pack_view::entry;
+
+    // Throws std::system_error if the file cannot be mapped and
+    // std::runtime_error if it is not a valid pack.
+    explicit asset_pack(const std::string& path)
+        : map_(path),
+          view_(std::span<const std::byte>(reinterpret_cast<const std::byte*>(map_.data()), map_.size())) {}
+
+    asset_pack(const asset_pack&) = delete;
+    asset_pack& operator=(const asset_pack&) = delete;
+
+    [[nodiscard]] const asset_pack_view& view() const noexcept { return view_; }
+
+    [[nodiscard]] std::size_t size() const noexcept { return view_.size(); }
+    [[nodiscard]] std::span<const entry> entries() const noexcept { return view_.entries(); }
+    [[nodiscard]] std::string_view name(const entry& e) const noexcept { return view_.name(e); }
+    [[nodiscard]] const entry* find(std::string_view name) const noexcept { return view_.find(name); }
+    [[nodiscard]] bool contains(std::string_view name) const noexcept { return view_.contains(name); }
+    [[nodiscard]] std::span<const std::byte> get(std::string_view name) const noexcept { return view_.get(name); }
+    [[nodiscard]] std::vector<std::byte> read(std::string_view name) const { return view_.read(name); }
+
+private:
+    mio::mmap_source map_;
+    asset_pack_view view_;
+};
+
+}  // namespace neutrino
+
+#endif  // NEUTRINO_ASSET_PACK_HH_
@@ -0,0 +1,79 @@
+// =============================================================================
+// neutrino/asset_pack_format.hh - On-disk layout of neutrino asset packs
+// =============================================================================
+// Shared by the neutrino_pack build tool and the readers in
+// <neutrino/asset_pack_view.hh> and <neutrino/asset_pack.hh>.
+//
+// All integers are little-endian. Layout:
+//
+//   header                      64 bytes at offset 0
+//   entry[entry_count]          sorted by (hash, name), 8-byte aligned
+//   uint32 bucket[2^bits + 1]   bucket[b]..bucket[b+1] = entries whose hash
+//                               has top `bits` bits equal to b
+//   names                       concatenated entry names (not terminated)
+//   data                        each entry starts at a multiple of `alignment`
+//
+// With 2^bits >= entry_count a lookup hashes the name (FNV-1a 64), reads one
+// bucket and compares about one entry: O(1) regardless of pack size.
+// =============================================================================
+
+#ifndef NEUTRINO_ASSET_PACK_FORMAT_HH_
+#define NEUTRINO_ASSET_PACK_FORMAT_HH_
+
+#include <cstddef>
+#include <cstdint>
+#include <string_view>
+
+namespace neutrino::asset_pack_format {
+
+inline constexpr char kMagic[8] = {'N', 'T', 'R', 'P', 'A', 'C', 'K', '\0'};
+inline constexpr std::uint32_t kVersion = 1;
+
+enum class compression : std::uint32_t {
+    none = 0,
+    lz4 = 1  // LZ4 block format, no frame
+};
+
+struct header {
+    char magic[8];
+    std::uint32_t version;
+    std::uint32_t entry_count;
+    std::uint32_t bucket_bits;
+    std::uint32_t alignment;
+    std::uint64_t index_offset;
+    std::uint64_t buckets_offset;
+    std::uint64_t names_offset;
+    std::uint64_t names_size;
+    std::uint64_t file_size;
+};
+static_assert(sizeof(header) == 64, "asset pack header must be 64 bytes");
+
+struct entry {
+    std::uint64_t hash;
+    std::uint64_t offset;       // absolute file offset of the stored bytes
+    std::uint64_t stored_size;  // bytes in the pack
+    std::uint64_t size;         // bytes after decompression
+    std::uint32_t name_offset;  // relative to header::names_offset
+    std::uint32_t name_size;
+    compression method;
+    std::uint32_t reserved;
+};
+static_assert(sizeof(entry) == 48, "asset pack entry must be 48 bytes");
+
+// FNV-1a, 64-bit
+constexpr std::uint64_t hash(std::string_view name) noexcept {
+    std::uint64_t h = 14695981039346656037ull;
+    for (const char c : name) {
+        h ^= static_cast<unsigned char>(c);
+        h *= 1099511628211ull;
+    }
+    return h;
+}
+
+constexpr std::uint32_t bucket_of(std::uint64_t h, std::uint32_t bits) noexcept {
+    return bits == 0 ? 0u : static_cast<std::uint32_t>(h >> (64u - bits));
+}
+
+}  // namespace neutrino::asset_pack_format
+
+#endif  // NEUTRINO_ASSET_PACK_FORMAT_HH_
@@ -0,0 +1,262 @@
+// =============================================================================
+// neutrino/asset_pack_view.hh - Read-only view over an in-memory asset pack
+// =============================================================================
+// Shipped with neutrino-cmake. Packs are produced by neutrino_add_asset_pack();
+// see <neutrino/asset_pack_format.hh> for the layout. For file-backed packs
+// use neutrino::asset_pack from <neutrino/asset_pack.hh>, which maps the file
+// and forwards to this view.
+//
+//   neutrino::asset_pack_view pack{bytes};
+//   std::span<const std::byte> sprite = pack.get("sprites/hero.iff");
+//   std::vector<std::byte> anim = pack.read("anims/intro.flc");  // decompresses
+//
+// get() is zero-copy and O(1); it returns an empty span for missing or
+// compressed entries. read() copies and decompresses.
+//
+// Requires C++20 and a little-endian target.
+// =============================================================================
+
+#ifndef NEUTRINO_ASSET_PACK_VIEW_HH_
+#define NEUTRINO_ASSET_PACK_VIEW_HH_
+
+#include <neutrino/asset_pack_format.hh>
+
+#include <bit>
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <span>
+#include <stdexcept>
+#include <string>
+#include <string_view>
+#include <vector>
+
+static_assert(std::endian::native == std::endian::little, "neutrino asset packs require a little-endian target");
+
+namespace neutrino {
+
+namespace detail {
+
+// Decompress one LZ4 block. Returns false unless exactly out.size() bytes
+// were produced without reading or writing out of bounds.
+inline bool lz4_decompress(std::span<const std::byte> in, std::span<std::byte> out) noexcept {
+    const auto* src = reinterpret_cast<const std::uint8_t*>(in.data());
+    const std::uint8_t* const src_end = src + in.size();
+    auto* dst = reinterpret_cast<std::uint8_t*>(out.data());
+    std::uint8_t* const dst_begin = dst;
+    std::uint8_t* const dst_end = dst + out.size();
+
+    const auto read_length = [&](std::size_t length) -> std::size_t {
+        if (length != 15) {
+            return length;
+        }
+        std::uint8_t b = 255;
+        while (b == 255) {
+            if (src == src_end) {
+                return SIZE_MAX;
+            }
+            b = *src++;
+            length += b;
+        }
+        return length;
+    };
+
+    while (src < src_end) {
+        const std::uint8_t token = *src++;
+
+        const std::size_t literals = read_length(token >> 4);
+        if (literals == SIZE_MAX || literals > static_cast<std::size_t>(src_end - src) ||
+            literals > static_cast<std::size_t>(dst_end - dst)) {
+            return false;
+        }
+        std::memcpy(dst, src, literals);
+        src += literals;
+        dst += literals;
+
+        if (src == src_end) {
+            break;  // last sequence has no match
+        }
+
+        if (src_end - src < 2) {
+            return false;
+        }
+        const std::size_t offset = static_cast<std::size_t>(src[0]) | (static_cast<std::size_t>(src[1]) << 8);
+        src += 2;
+        if (offset == 0 || offset > static_cast<std::size_t>(dst - dst_begin)) {
+            return false;
+        }
+
+        std::size_t match = read_length(token & 0x0F);
+        if (match == SIZE_MAX) {
+            return false;
+        }
+        match += 4;
+        if (match > static_cast<std::size_t>(dst_end - dst)) {
+            return false;
+        }
+        const std::uint8_t* from = dst - offset;
+        for (std::size_t i = 0; i < match; ++i) {  // may overlap
+            dst[i] = from[i];
+        }
+        dst += match;
+    }
+
+    return dst == dst_end;
+}
+
+}  // namespace detail
+
+class asset_pack_view {
+public:
+    using entry = asset_pack_format::entry;
+
+    asset_pack_view() noexcept = default;
+
+    // Validates the header and index; throws std::runtime_error on a
+    // malformed pack. `data` must outlive the view.
+    explicit asset_pack_view(std::span<const std::byte> data)
+        : data_(data) {
+        namespace fmt = asset_pack_format;
+
+        if (data.size() < sizeof(fmt::header)) {
+            fail("truncated header");
+        }
+        std::memcpy(&header_, data.data(), sizeof(header_));
+        if (std::memcmp(header_.magic, fmt::kMagic, sizeof(fmt::kMagic)) != 0) {
+            fail("bad magic");
+        }
+        if (header_.version != fmt::kVersion) {
+            fail("unsupported version " + std::to_string(header_.version));
+        }
+        if (header_.file_size != data.size()) {
+            fail("size mismatch");
+        }
+        if (header_.bucket_bits > 31) {
+            fail("bad bucket count");
+        }
+
+        const std::uint64_t count = header_.entry_count;
+        const std::uint64_t buckets = (std::uint64_t{1} << header_.bucket_bits) + 1;
+        if (header_.index_offset % alignof(entry) != 0 ||
+            !in_bounds(header_.index_offset, count * sizeof(entry)) ||
+            header_.buckets_offset % alignof(std::uint32_t) != 0 ||
+            !in_bounds(header_.buckets_offset, buckets * sizeof(std::uint32_t)) ||
+            !in_bounds(header_.names_offset, header_.names_size)) {
+            fail("bad section offsets");
+        }
+
+        entries_ = {reinterpret_cast<const entry*>(data.data() + header_.index_offset),
+                    static_cast<std::size_t>(count)};
+        buckets_ = {reinterpret_cast<const std::uint32_t*>(data.data() + header_.buckets_offset),
+                    static_cast<std::size_t>(buckets)};
+        names_ = {reinterpret_cast<const char*>(data.data() + header_.names_offset),
+                  static_cast<std::size_t>(header_.names_size)};
+
+        for (std::size_t b = 0; b + 1 < buckets_.size(); ++b) {
+            if (buckets_[b] > buckets_[b + 1]) {
+                fail("bad bucket table");
+            }
+        }
+        if (buckets_.back() != count) {
+            fail("bad bucket table");
+        }
+        for (const entry& e : entries_) {
+            if (static_cast<std::uint64_t>(e.name_offset) + e.name_size > names_.size() ||
+                !in_bounds(e.offset, e.stored_size) ||
+                (e.method == asset_pack_format::compression::none && e.stored_size != e.size) ||
+                (e.method != asset_pack_format::compression::none &&
+                 e.method != asset_pack_format::compression::lz4)) {
+                fail("bad entry");
+            }
+        }
+    }
+
+    [[nodiscard]] std::size_t size() const noexcept { return entries_.size(); }
+    [[nodiscard]] bool empty() const noexcept { return entries_.empty(); }
+
+    // Index entries, sorted by name hash.
+    [[nodiscard]] std::span<const entry> entries() const noexcept { return entries_; }
+
+    [[nodiscard]] std::string_view name(const entry& e) const noexcept {
+        return names_.substr(e.name_offset, e.name_size);
+    }
+
+    [[nodiscard]] const entry* find(std::string_view name) const noexcept {
+        if (entries_.empty()) {
+            return nullptr;
+        }
+        const std::uint64_t h = asset_pack_format::hash(name);
+        const std::uint32_t b = asset_pack_format::bucket_of(h, header_.bucket_bits);
+        for (std::uint32_t i = buckets_[b]; i < buckets_[b + 1]; ++i) {
+            const entry& e = entries_[i];
+            if (e.hash == h && this->name(e) == name) {
+                return &e;
+            }
+        }
+        return nullptr;
+    }
+
+    [[nodiscard]] bool contains(std::string_view name) const noexcept { return find(name) != nullptr; }
+
+    // Contents of an uncompressed entry without copying. Empty if the entry
+    // is missing or compressed.
+    [[nodiscard]] std::span<const std::byte> get(std::string_view name) const noexcept {
+        const entry* e = find(name);
+        if (e == nullptr || e->method != asset_pack_format::compression::none) {
+            return {};
+        }
+        return stored(*e);
+    }
+
+    // Bytes of an entry as stored in the pack (compressed or not).
+    [[nodiscard]] std::span<const std::byte> stored(const entry& e) const noexcept {
+        return data_.subspan(static_cast<std::size_t>(e.offset), static_cast<std::size_t>(e.stored_size));
+    }
+
+    // Copy an entry into `out` (which must be e.size bytes), decompressing
+    // if needed. Throws std::runtime_error on corrupt data.
+    void read(const entry& e, std::span<std::byte> out) const {
+        if (out.size() != e.size) {
+            throw std::invalid_argument("neutrino::asset_pack_view: output size does not match entry size");
+        }
+        const auto in = stored(e);
+        if (e.method == asset_pack_format::compression::none) {
+            if (!in.empty()) {
+                std::memcpy(out.data(), in.data(), in.size());
+            }
+        } else if (!detail::lz4_decompress(in, out)) {
+            fail("corrupt data in '" + std::string(name(e)) + "'");
+        }
+    }
+
+    // Copy an entry, decompressing if needed. Throws std::out_of_range if
+    // there is no such entry.
+    [[nodiscard]] std::vector<std::byte> read(std::string_view name) const {
+        const entry* e = find(name);
+        if (e == nullptr) {
+            throw std::out_of_range("neutrino::asset_pack_view: no asset '" + std::string(name) + "'");
+        }
+        std::vector<std::byte> out(static_cast<std::size_t>(e->size));
+        read(*e, out);
+        return out;
+    }
+
+private:
+    [[noreturn]] static void fail(const std::string& what) {
+        throw std::runtime_error("neutrino::asset_pack_view: " + what);
+    }
+
+    [[nodiscard]] bool in_bounds(std::uint64_t offset, std::uint64_t length) const noexcept {
+        return offset <= data_.size() && length <= data_.size() - offset;
+    }
+
+    std::span<const std::byte> data_{};
+    asset_pack_format::header header_{};
+    std::span<const entry> entries_{};
+    std::span<const std::uint32_t> buckets_{};
+    std::string_view names_{};
+};
+
+}  // namespace neutrino
+
+#endif  // NEUTRINO_ASSET_PACK_VIEW_HH_
@@ -0,0 +1,281 @@
+// =============================================================================
+// neutrino/trace.hh - Zero-overhead instrumentation macros
+// =============================================================================
+// Shipped with neutrino-cmake. Enable per target with neutrino_target_tracing()
+// and globally with -DNEUTRINO_ENABLE_TRACING=ON.
+//
+//   NEUTRINO_TRACE_ZONE(name)              - time the enclosing scope
+//   NEUTRINO_TRACE_COUNTER(name, value)    - record a counter sample
+//   NEUTRINO_TRACE_FRAME_MARK()            - mark the end of a frame
+//   NEUTRINO_TRACE_FRAME_MARK_NAMED(name)  - mark the end of a named frame
+//   NEUTRINO_TRACE_FLUSH()                 - write the trace file now
+//
+// `name` must have static storage duration (normally a string literal).
+//
+// With tracing disabled every macro expands to a no-op and no code or data
+// is emitted. With tracing enabled events are buffered per thread and the
+// trace is written when the process exits (or on NEUTRINO_TRACE_FLUSH()) as
+// Chrome trace-event JSON, loadable in Perfetto or chrome://tracing.
+// The output path is $NEUTRINO_TRACE_FILE, falling back to the
+// NEUTRINO_TRACING_OUTPUT value chosen at configure time.
+// =============================================================================
+
+#ifndef NEUTRINO_TRACE_HH_
+#define NEUTRINO_TRACE_HH_
+
+#define NEUTRINO_TRACE_CONCAT_IMPL(a, b) a##b
+#define NEUTRINO_TRACE_CONCAT(a, b) NEUTRINO_TRACE_CONCAT_IMPL(a, b)
+
+#if defined(NEUTRINO_TRACING_ENABLED) && NEUTRINO_TRACING_ENABLED
+
+#if (defined(_MSVC_LANG) && _MSVC_LANG < 201703L) || (!defined(_MSVC_LANG) && __cplusplus < 201703L)
+#error "NEUTRINO_TRACING_ENABLED requires C++17 or later"
+#endif
+
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <mutex>
+#include <string>
+#include <vector>
+
+#ifndef NEUTRINO_TRACE_DEFAULT_FILE
+#define NEUTRINO_TRACE_DEFAULT_FILE "neutrino-trace.json"
+#endif
+
+namespace neutrino::trace {
+namespace detail {
+
+enum class phase : char {
+    complete = 'X',
+    counter = 'C',
+    instant = 'i'
+};
+
+struct event {
+    const char* name;
+    std::int64_t ts_ns;
+    std::int64_t dur_ns;
+    double value;
+    std::uint32_t tid;
+    phase ph;
+};
+
+class session {
+public:
+    static session& instance() {
+        static session s;
+        return s;
+    }
+
+    session(const session&) = delete;
+    session& operator=(const session&) = delete;
+
+    ~session() { flush(); }
+
+    [[nodiscard]] std::int64_t now() const noexcept {
+        return std::chrono::duration_cast<std::chrono::nanoseconds>(
+            std::chrono::steady_clock::now() - epoch_).count();
+    }
+
+    std::uint32_t register_thread() noexcept { return next_tid_.fetch_add(1, std::memory_order_relaxed); }
+
+    // Move a thread's buffered events into the session.
+    void retire(std::vector<event>& events) {
+        std::lock_guard<std::mutex> lock(mutex_);
+        retired_.insert(retired_.end(), events.begin(), events.end());
+        events.clear();
+    }
+
+    // Write every retired event to the trace file, replacing previous output.
+    void flush() {
+        std::lock_guard<std::mutex> lock(mutex_);
+        std::FILE* out = open_output();
+        if (out == nullptr) {
+            return;
+        }
+        std::fputs("{\"displayTimeUnit\":\"ns\",\"traceEvents\":[\n", out);
+        bool first = true;
+        for (const event& e : retired_) {
+            if (!first) {
+                std::fputs(",\n", out);
+            }
+            first = false;
+            write_event(out, e);
+        }
+        std::fputs("\n]}\n", out);
+        std::fclose(out);
+    }
+
+private:
+    session()
+        : epoch_(std::chrono::steady_clock::now()) {
+        retired_.reserve(1u << 16);
+    }
+
+    static std::FILE* open_output() {
+        std::string path = NEUTRINO_TRACE_DEFAULT_FILE;
+#if defined(_MSC_VER)
+        char* env = nullptr;
+        std::size_t len = 0;
+        if (_dupenv_s(&env, &len, "NEUTRINO_TRACE_FILE") == 0 && env != nullptr) {
+            if (*env != '\0') {
+                path = env;
+            }
+            std::free(env);
+        }
+        std::FILE* out = nullptr;
+        if (fopen_s(&out, path.c_str(), "wb") != 0) {
+            return nullptr;
+        }
+        return out;
+#else
+        if (const char* env = std::getenv("NEUTRINO_TRACE_FILE"); env != nullptr && *env != '\0') {
+            path = env;
+        }
+        return std::fopen(path.c_str(), "wb");
+#endif
+    }
+
+    static void write_name(std::FILE* out, const char* name) {
+        std::fputc('"', out);
+        for (const char* p = name; *p != '\0'; ++p) {
+            const auto c = static_cast<unsigned char>(*p);
+            if (c == '"' || c == '\\') {
+                std::fputc('\\', out);
+                std::fputc(c, out);
+            } else if (c < 0x20) {
+                std::fprintf(out, "\\u%04x", static_cast<unsigned>(c));
+            } else {
+                std::fputc(c, out);
+            }
+        }
+        std::fputc('"', out);
+    }
+
+    static void write_event(std::FILE* out, const event& e) {
+        const double ts_us = static_cast<double>(e.ts_ns) / 1000.0;
+        std::fputs("{\"name\":", out);
+        write_name(out, e.name);
+        std::fprintf(out, ",\"cat\":\"neutrino\",\"ph\":\"%c\",\"ts\":%.3f,\"pid\":1,\"tid\":%u",
+                     static_cast<char>(e.ph), ts_us, static_cast<unsigned>(e.tid));
+        switch (e.ph) {
+            case phase::complete:
+                std::fprintf(out, ",\"dur\":%.3f", static_cast<double>(e.dur_ns) / 1000.0);
+                break;
+            case phase::counter:
+                std::fprintf(out, ",\"args\":{\"value\":%.17g}", e.value);
+                break;
+            case phase::instant:
+                std::fputs(",\"s\":\"g\"", out);
+                break;
+        }
+        std::fputc('}', out);
+    }
+
+    std::chrono::steady_clock::time_point epoch_;
+    std::mutex mutex_;
+    std::vector<event> retired_;
+    std::atomic<std::uint32_t> next_tid_{1};
+};
+
+// Per-thread event buffer. Thread-local objects are destroyed before objects
+// with static storage duration, so the main thread's events reach the
+// session before its destructor writes the file.
+class thread_buffer {
+public:
+    thread_buffer()
+        : owner_(session::instance()),
+          tid_(owner_.register_thread()) {
+        events_.reserve(kFlushThreshold);
+    }
+
+    thread_buffer(const thread_buffer&) = delete;
+    thread_buffer& operator=(const thread_buffer&) = delete;
+
+    ~thread_buffer() { owner_.retire(events_); }
+
+    [[nodiscard]] std::int64_t now() const noexcept { return owner_.now(); }
+
+    void push(const char* name, std::int64_t ts_ns, std::int64_t dur_ns, double value, phase ph) {
+        events_.push_back(event{name, ts_ns, dur_ns, value, tid_, ph});
+        if (events_.size() >= kFlushThreshold) {
+            owner_.retire(events_);
+        }
+    }
+
+    void retire() { owner_.retire(events_); }
+
+private:
+    static constexpr std::size_t kFlushThreshold = 1u << 14;
+
+    session& owner_;
+    std::uint32_t tid_;
+    std::vector<event> events_;
+};
+
+inline thread_buffer& local_buffer() {
+    thread_local thread_buffer buffer;
+    return buffer;
+}
+
+}  // namespace detail
+
+// RAII zone: records a complete ("X") event spanning its lifetime.
+class zone {
+public:
+    explicit zone(const char* name)
+        : buffer_(detail::local_buffer()),
+          name_(name),
+          start_ns_(buffer_.now()) {}
+
+    zone(const zone&) = delete;
+    zone& operator=(const zone&) = delete;
+
+    ~zone() { buffer_.push(name_, start_ns_, buffer_.now() - start_ns_, 0.0, detail::phase::complete); }
+
+private:
+    detail::thread_buffer& buffer_;
+    const char* name_;
+    std::int64_t start_ns_;
+};
+
+inline void counter(const char* name, double value) {
+    auto& buffer = detail::local_buffer();
+    buffer.push(name, buffer.now(), 0, value, detail::phase::counter);
+}
+
+inline void frame_mark(const char* name) {
+    auto& buffer = detail::local_buffer();
+    buffer.push(name, buffer.now(), 0, 0.0, detail::phase::instant);
+}
+
+// Write everything recorded so far. Events still buffered by other live
+// threads are written when those threads exit.
+inline void flush() {
+    detail::local_buffer().retire();
+    detail::session::instance().flush();
+}
+
+}  // namespace neutrino::trace
+
+#define NEUTRINO_TRACE_ZONE(name) \
+    ::neutrino::trace::zone NEUTRINO_TRACE_CONCAT(neutrino_trace_zone_, __LINE__) { name }
+#define NEUTRINO_TRACE_COUNTER(name, value) ::neutrino::trace::counter(name, static_cast<double>(value))
+#define NEUTRINO_TRACE_FRAME_MARK() ::neutrino::trace::frame_mark("frame")
+#define NEUTRINO_TRACE_FRAME_MARK_NAMED(name) ::neutrino::trace::frame_mark(name)
+#define NEUTRINO_TRACE_FLUSH() ::neutrino::trace::flush()
+
+#else  // tracing disabled
+
+#define NEUTRINO_TRACE_ZONE(name) static_cast<void>(0)
+#define NEUTRINO_TRACE_COUNTER(name, value) static_cast<void>(sizeof(value))
+#define NEUTRINO_TRACE_FRAME_MARK() static_cast<void>(0)
+#define NEUTRINO_TRACE_FRAME_MARK_NAMED(name) static_cast<void>(0)
+#define NEUTRINO_TRACE_FLUSH() static_cast<void>(0)
+
+#endif
+
+#endif  // NEUTRINO_TRACE_HH_
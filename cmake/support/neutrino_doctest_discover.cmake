@@ -0,0 +1,188 @@
+# =============================================================================
+# neutrino_doctest_discover.cmake - Register doctest cases as ctest tests
+# =============================================================================
+# Build step behind neutrino_add_doctest(), run after the test executable
+# is linked.
+#
+# Usage:
+#   cmake -DCONFIG=<file> -P neutrino_doctest_discover.cmake
+#
+# CONFIG (generated at configure time) sets TEST_EXECUTABLE, TEST_EXECUTOR,
+# TEST_WORKING_DIR, TEST_PREFIX, TEST_EXTRA_ARGS, TEST_LABELS, TEST_TIMEOUT,
+# TEST_RESOURCE_LOCK, TEST_RESOURCE_GROUPS, TEST_PROPERTIES and TEST_FILE.
+# The executable is queried with --list-test-suites / --list-test-cases and
+# TEST_FILE is rewritten with one add_test() per case. Discovery is skipped when neither the executable nor
+# CONFIG changed since the last run.
+# =============================================================================
+
+cmake_minimum_required(VERSION 3.20)
+
+if(NOT DEFINED CONFIG)
+    message(FATAL_ERROR "neutrino_doctest_discover: CONFIG is required")
+endif()
+include("${CONFIG}")
+
+file(SHA256 "${TEST_EXECUTABLE}" _binary_hash)
+file(SHA256 "${CONFIG}" _config_hash)
+file(SHA256 "${CMAKE_CURRENT_LIST_FILE}" _script_hash)
+set(_stamp "${_binary_hash} ${_config_hash} ${_script_hash}")
+if(EXISTS "${TEST_FILE}.stamp" AND EXISTS "${TEST_FILE}")
+    file(READ "${TEST_FILE}.stamp" _previous)
+    if(_previous STREQUAL _stamp)
+        file(TOUCH "${TEST_FILE}.stamp")
+        return()
+    endif()
+endif()
+
+# Run the executable and return the names it lists, one per line, dropping
+# doctest's banner and separator lines
+function(_doctest_list OUTPUT_VAR)
+    execute_process(
+        COMMAND ${TEST_EXECUTOR} "${TEST_EXECUTABLE}" --no-colors=true ${ARGN}
+        WORKING_DIRECTORY "${TEST_WORKING_DIR}"
+        OUTPUT_VARIABLE _output
+        ERROR_VARIABLE _error
+        RESULT_VARIABLE _result
+        TIMEOUT 60
+    )
+    if(NOT _result EQUAL 0)
+        message(FATAL_ERROR
+            "neutrino_doctest_discover: '${TEST_EXECUTABLE} ${ARGN}' failed (${_result}):\n${_output}${_error}"
+        )
+    endif()
+    # Unbalanced brackets in a name would stop the list from splitting
+    string(REPLACE "[" "_NEUTRINO_LB_" _output "${_output}")
+    string(REPLACE "]" "_NEUTRINO_RB_" _output "${_output}")
+    string(REPLACE "\n" ";" _lines "${_output}")
+    set(_names "")
+    foreach(_line IN LISTS _lines)
+        string(REPLACE "_NEUTRINO_LB_" "[" _line "${_line}")
+        string(REPLACE "_NEUTRINO_RB_" "]" _line "${_line}")
+        string(REGEX REPLACE "\r$" "" _line "${_line}")
+        if(_line STREQUAL "" OR _line MATCHES "^===+$" OR _line MATCHES "^\\[doctest\\] ")
+            continue()
+        endif()
+        list(APPEND _names "${_line}")
+    endforeach()
+    set(${OUTPUT_VAR} "${_names}" PARENT_SCOPE)
+endfunction()
+
+# doctest filters treat ',' as a separator; escape it
+function(_doctest_filter NAME OUTPUT_VAR)
+    string(REPLACE "," "\\," _escaped "${NAME}")
+    set(${OUTPUT_VAR} "${_escaped}" PARENT_SCOPE)
+endfunction()
+
+# Quote a value as a bracket argument for the generated file
+function(_doctest_quote VALUE OUTPUT_VAR)
+    set(_eq "=")
+    while(VALUE MATCHES "]${_eq}]")
+        string(APPEND _eq "=")
+    endwhile()
+    set(${OUTPUT_VAR} "[${_eq}[${VALUE}]${_eq}]" PARENT_SCOPE)
+endfunction()
+
+# Map every case to its suite ("" for cases outside any TEST_SUITE)
+_doctest_list(_all_cases --list-test-cases)
+_doctest_list(_suites --list-test-suites)
+
+set(_entry_count 0)
+set(_in_suite "")
+foreach(_suite IN LISTS _suites)
+    _doctest_filter("${_suite}" _filter)
+    _doctest_list(_cases --list-test-cases "--test-suite=${_filter}")
+    foreach(_case IN LISTS _cases)
+        list(APPEND _in_suite "${_case}")
+        set(_entry_suite_${_entry_count} "${_suite}")
+        set(_entry_case_${_entry_count} "${_case}")
+        math(EXPR _entry_count "${_entry_count} + 1")
+    endforeach()
+endforeach()
+set(_suite_cases "${_in_suite}")
+foreach(_case IN LISTS _all_cases)
+    list(FIND _in_suite "${_case}" _found)
+    if(_found GREATER -1)
+        list(REMOVE_AT _in_suite ${_found})
+    else()
+        set(_entry_suite_${_entry_count} "")
+        set(_entry_case_${_entry_count} "${_case}")
+        math(EXPR _entry_count "${_entry_count} + 1")
+    endif()
+endforeach()
+
+set(_content "# Generated by neutrino_add_doctest() - do not edit.\n")
+set(_names "")
+set(_count 0)
+if(_entry_count GREATER 0)
+    math(EXPR _last "${_entry_count} - 1")
+    foreach(_i RANGE ${_last})
+        set(_suite "${_entry_suite_${_i}}")
+        set(_case "${_entry_case_${_i}}")
+
+        # Ambiguous case names get the suite prepended
+        set(_others "${_all_cases}")
+        list(FIND _others "${_case}" _found)
+        list(REMOVE_AT _others ${_found})
+        set(_name "${TEST_PREFIX}${_case}")
+        if(_case IN_LIST _others AND NOT _suite STREQUAL "")
+            set(_name "${TEST_PREFIX}${_suite}/${_case}")
+        endif()
+        if(_name IN_LIST _names)
+            message(WARNING "neutrino_doctest_discover: duplicate test case '${_case}' skipped")
+            continue()
+        endif()
+        list(APPEND _names "${_name}")
+
+        _doctest_filter("${_case}" _case_filter)
+        set(_args "--test-case=${_case_filter}")
+        set(_labels ${TEST_LABELS})
+        if(NOT _suite STREQUAL "")
+            _doctest_filter("${_suite}" _suite_filter)
+            list(APPEND _args "--test-suite=${_suite_filter}")
+            list(APPEND _labels "${_suite}")
+        elseif(_case IN_LIST _suite_cases)
+            # Same name inside a suite: run only the one outside all suites
+            set(_excluded "")
+            foreach(_other IN LISTS _suites)
+                _doctest_filter("${_other}" _other_filter)
+                list(APPEND _excluded "${_other_filter}")
+            endforeach()
+            list(JOIN _excluded "," _excluded)
+            list(APPEND _args "--test-suite-exclude=${_excluded}")
+        endif()
+
+        set(_command "")
+        set(_argv ${TEST_EXECUTOR} "${TEST_EXECUTABLE}" ${_args} ${TEST_EXTRA_ARGS})
+        foreach(_arg IN LISTS _argv)
+            _doctest_quote("${_arg}" _quoted)
+            string(APPEND _command " ${_quoted}")
+        endforeach()
+        _doctest_quote("${_name}" _quoted_name)
+        _doctest_quote("${TEST_WORKING_DIR}" _quoted_dir)
+        string(APPEND _content
+            "add_test(${_quoted_name}${_command})\n"
+            "set_tests_properties(${_quoted_name} PROPERTIES WORKING_DIRECTORY ${_quoted_dir}"
+        )
+        if(_labels)
+            _doctest_quote("${_labels}" _quoted)
+            string(APPEND _content " LABELS ${_quoted}")
+        endif()
+        foreach(_property TIMEOUT RESOURCE_LOCK RESOURCE_GROUPS)
+            if(TEST_${_property})
+                _doctest_quote("${TEST_${_property}}" _quoted)
+                string(APPEND _content " ${_property} ${_quoted}")
+            endif()
+        endforeach()
+        foreach(_property IN LISTS TEST_PROPERTIES)
+            _doctest_quote("${_property}" _quoted)
+            string(APPEND _content " ${_quoted}")
+        endforeach()
+        string(APPEND _content ")\n")
+        math(EXPR _count "${_count} + 1")
+    endforeach()
+endif()
+
+file(WRITE "${TEST_FILE}" "${_content}")
+file(WRITE "${TEST_FILE}.stamp" "${_stamp}")
+get_filename_component(_exe_name "${TEST_EXECUTABLE}" NAME)
+message(STATUS "[Neutrino] ${_exe_name}: registered ${_count} doctest cases")
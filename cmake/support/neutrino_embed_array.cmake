@@ -0,0 +1,43 @@
+# =============================================================================
+# neutrino_embed_array.cmake - Convert a file to a C++ array definition
+# =============================================================================
+# Build-time fallback used by neutrino_embed_resources() where .incbin is not
+# available (MSVC, Emscripten).
+#
+# Usage:
+#   cmake -DINPUT=<file> -DOUTPUT=<file.cc> -DSYMBOL=<name> -P neutrino_embed_array.cmake
+#
+# Defines <SYMBOL>_data (followed by a NUL byte) and <SYMBOL>_size.
+# =============================================================================
+
+cmake_minimum_required(VERSION 3.20)
+
+foreach(_var INPUT OUTPUT SYMBOL)
+    if(NOT DEFINED ${_var})
+        message(FATAL_ERROR "neutrino_embed_array: ${_var} is required")
+    endif()
+endforeach()
+
+file(SIZE "${INPUT}" _size)
+file(READ "${INPUT}" _hex HEX)
+
+# Append the terminating NUL, then format as 0xNN, sixteen bytes per line
+string(APPEND _hex "00")
+string(REGEX REPLACE "([0-9a-f][0-9a-f])" "0x\\1," _bytes "${_hex}")
+string(REGEX REPLACE "((0x..,){16})" "\\1\n    " _bytes "${_bytes}")
+
+file(WRITE "${OUTPUT}.tmp"
+"// Generated by neutrino_embed_resources() - do not edit.
+// Source: ${INPUT}
+
+#include <cstddef>
+
+extern \"C\" {
+alignas(16) extern const unsigned char ${SYMBOL}_data[] = {
+    ${_bytes}
+};
+extern const std::size_t ${SYMBOL}_size = ${_size};
+}
+"
+)
+file(RENAME "${OUTPUT}.tmp" "${OUTPUT}")
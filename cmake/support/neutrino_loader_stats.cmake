@@ -0,0 +1,85 @@
+# =============================================================================
+# neutrino_loader_stats.cmake - Report dynamic loader work for an executable
+# =============================================================================
+# Build-time script behind neutrino_add_loader_stats(). glibc only.
+#
+# Usage:
+#   cmake -DEXECUTABLE=<file> [-DARGS=<arg;...>] [-DRUNS=<n>] -P neutrino_loader_stats.cmake
+#
+# Runs the executable RUNS times (default 5) with LD_DEBUG=statistics and
+# prints the number of loaded shared objects, the relocation counts and the
+# median time spent in the dynamic loader.
+# =============================================================================
+
+cmake_minimum_required(VERSION 3.20)
+
+if(NOT DEFINED EXECUTABLE)
+    message(FATAL_ERROR "neutrino_loader_stats: EXECUTABLE is required")
+endif()
+if(NOT RUNS)
+    set(RUNS 5)
+endif()
+
+get_filename_component(_name "${EXECUTABLE}" NAME)
+
+# Shared objects the loader maps (what ldd prints), without running main()
+execute_process(
+    COMMAND ${CMAKE_COMMAND} -E env LD_TRACE_LOADED_OBJECTS=1 "${EXECUTABLE}"
+    OUTPUT_VARIABLE _trace
+    ERROR_QUIET
+)
+string(REGEX MATCHALL "[^\n]+" _objects "${_trace}")
+list(FILTER _objects EXCLUDE REGEX "linux-vdso|linux-gate")
+list(LENGTH _objects _object_count)
+
+set(_startup_cycles "")
+set(_load_cycles "")
+set(_relocation_cycles "")
+foreach(_run RANGE 1 ${RUNS})
+    execute_process(
+        COMMAND ${CMAKE_COMMAND} -E env LD_DEBUG=statistics "${EXECUTABLE}" ${ARGS}
+        OUTPUT_QUIET
+        ERROR_VARIABLE _stats
+    )
+    if(NOT _stats MATCHES "total startup time in dynamic loader: ([0-9]+)")
+        message(FATAL_ERROR "neutrino_loader_stats: no LD_DEBUG statistics from ${_name} (not glibc?)")
+    endif()
+    list(APPEND _startup_cycles ${CMAKE_MATCH_1})
+    if(_stats MATCHES "time needed to load objects: ([0-9]+)")
+        list(APPEND _load_cycles ${CMAKE_MATCH_1})
+    endif()
+    if(_stats MATCHES "time needed for relocation: ([0-9]+)")
+        list(APPEND _relocation_cycles ${CMAKE_MATCH_1})
+    endif()
+    # Counts are deterministic; keep the last run's
+    string(REGEX MATCH "final number of relocations: ([0-9]+)" _ "${_stats}")
+    set(_relocations "${CMAKE_MATCH_1}")
+    string(REGEX MATCH "final number of relocations from cache: ([0-9]+)" _ "${_stats}")
+    set(_cached "${CMAKE_MATCH_1}")
+    string(REGEX MATCH "number of relative relocations: ([0-9]+)" _ "${_stats}")
+    set(_relative "${CMAKE_MATCH_1}")
+endforeach()
+
+function(_median LIST OUTPUT_VAR)
+    list(LENGTH LIST _n)
+    if(_n EQUAL 0)
+        set(${OUTPUT_VAR} "?" PARENT_SCOPE)
+        return()
+    endif()
+    list(SORT LIST COMPARE NATURAL)
+    math(EXPR _mid "${_n} / 2")
+    list(GET LIST ${_mid} _value)
+    set(${OUTPUT_VAR} "${_value}" PARENT_SCOPE)
+endfunction()
+
+_median("${_startup_cycles}" _startup)
+_median("${_load_cycles}" _load)
+_median("${_relocation_cycles}" _relocation)
+
+message("[Neutrino] Loader statistics for ${_name} (median of ${RUNS} runs):")
+message("  shared objects loaded:  ${_object_count}")
+message("  relocations:            ${_relocations} (${_cached} from cache)")
+message("  relative relocations:   ${_relative}")
+message("  loader time:            ${_startup} cycles")
+message("    loading objects:      ${_load} cycles")
+message("    relocation:           ${_relocation} cycles")
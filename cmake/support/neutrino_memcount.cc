@@ -0,0 +1,132 @@
+// =============================================================================
+// neutrino_memcount - LD_PRELOAD allocation counter for neutrino_memwatch
+// =============================================================================
+// Interposes the malloc family (glibc only), counting allocations and
+// tracking the peak of live heap bytes (malloc_usable_size). At exit one line
+// "<allocations> <peak bytes>\n" is appended to $NEUTRINO_MEMCOUNT_OUTPUT.
+//
+// operator new/delete in libstdc++ and libc++ go through malloc/free, so C++
+// allocations are counted too. Executables that link their own allocator
+// (neutrino_target_allocator) bypass the interposed functions.
+// =============================================================================
+
+#include <fcntl.h>
+#include <malloc.h>
+#include <unistd.h>
+
+#include <atomic>
+#include <cerrno>
+#include <cstddef>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+
+extern "C" {
+void* __libc_malloc(std::size_t size);
+void* __libc_calloc(std::size_t count, std::size_t size);
+void* __libc_realloc(void* ptr, std::size_t size);
+void* __libc_memalign(std::size_t alignment, std::size_t size);
+void __libc_free(void* ptr);
+}
+
+namespace {
+
+std::atomic<std::uint64_t> g_allocations{0};
+std::atomic<std::int64_t> g_live{0};
+std::atomic<std::int64_t> g_peak{0};
+
+void track_alloc(void* ptr) {
+    if (ptr == nullptr) {
+        return;
+    }
+    g_allocations.fetch_add(1, std::memory_order_relaxed);
+    const auto size = static_cast<std::int64_t>(malloc_usable_size(ptr));
+    const std::int64_t live = g_live.fetch_add(size, std::memory_order_relaxed) + size;
+    std::int64_t peak = g_peak.load(std::memory_order_relaxed);
+    while (live > peak && !g_peak.compare_exchange_weak(peak, live, std::memory_order_relaxed)) {
+    }
+}
+
+void track_free(void* ptr) {
+    if (ptr != nullptr) {
+        g_live.fetch_sub(static_cast<std::int64_t>(malloc_usable_size(ptr)), std::memory_order_relaxed);
+    }
+}
+
+// Written with plain syscalls: stdio may allocate
+__attribute__((destructor)) void report() {
+    const char* path = std::getenv("NEUTRINO_MEMCOUNT_OUTPUT");
+    if (path == nullptr) {
+        return;
+    }
+    char line[64];
+    const int length = std::snprintf(line, sizeof(line), "%llu %lld\n",
+                                     static_cast<unsigned long long>(g_allocations.load()),
+                                     static_cast<long long>(g_peak.load()));
+    const int fd = open(path, O_WRONLY | O_CREAT | O_APPEND, 0644);
+    if (fd >= 0) {
+        (void)!write(fd, line, static_cast<std::size_t>(length));
+        close(fd);
+    }
+}
+
+}  // namespace
+
+#define NEUTRINO_MEMCOUNT_EXPORT __attribute__((visibility("default")))
+
+extern "C" {
+
+NEUTRINO_MEMCOUNT_EXPORT void* malloc(std::size_t size) {
+    void* ptr = __libc_malloc(size);
+    track_alloc(ptr);
+    return ptr;
+}
+
+NEUTRINO_MEMCOUNT_EXPORT void* calloc(std::size_t count, std::size_t size) {
+    void* ptr = __libc_calloc(count, size);
+    track_alloc(ptr);
+    return ptr;
+}
+
+NEUTRINO_MEMCOUNT_EXPORT void* realloc(void* ptr, std::size_t size) {
+    track_free(ptr);
+    void* result = __libc_realloc(ptr, size);
+    if (result == nullptr && size != 0) {
+        // Failed: the original block is still live
+        if (ptr != nullptr) {
+            g_live.fetch_add(static_cast<std::int64_t>(malloc_usable_size(ptr)), std::memory_order_relaxed);
+        }
+        return nullptr;
+    }
+    track_alloc(result);
+    return result;
+}
+
+NEUTRINO_MEMCOUNT_EXPORT void free(void* ptr) {
+    track_free(ptr);
+    __libc_free(ptr);
+}
+
+NEUTRINO_MEMCOUNT_EXPORT void* memalign(std::size_t alignment, std::size_t size) {
+    void* ptr = __libc_memalign(alignment, size);
+    track_alloc(ptr);
+    return ptr;
+}
+
+NEUTRINO_MEMCOUNT_EXPORT void* aligned_alloc(std::size_t alignment, std::size_t size) {
+    return memalign(alignment, size);
+}
+
+NEUTRINO_MEMCOUNT_EXPORT int posix_memalign(void** out, std::size_t alignment, std::size_t size) {
+    if (alignment < sizeof(void*) || (alignment & (alignment - 1)) != 0) {
+        return EINVAL;
+    }
+    void* ptr = memalign(alignment, size);
+    if (ptr == nullptr) {
+        return ENOMEM;
+    }
+    *out = ptr;
+    return 0;
+}
+
+}  // extern "C"
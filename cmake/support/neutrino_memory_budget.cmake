@@ -0,0 +1,89 @@
+# =============================================================================
+# neutrino_memory_budget.cmake - Run an existing test under a memory budget
+# =============================================================================
+# Test-time script behind neutrino_add_memory_budget(<test>) without COMMAND.
+#
+# Usage:
+#   cmake -DCTEST=<ctest> -DTEST=<name> -DTEST_DIR=<dir> [-DCONFIG=<config>]
+#         -DMEMWATCH=<neutrino_memwatch> -DMEMWATCH_ARGS=<arg|...>
+#         -P neutrino_memory_budget.cmake
+#
+# Looks the command, working directory and environment of TEST up with
+# ctest --show-only=json-v1 and runs the command under neutrino_memwatch.
+# =============================================================================
+
+cmake_minimum_required(VERSION 3.20)
+
+foreach(_var CTEST TEST TEST_DIR MEMWATCH)
+    if(NOT DEFINED ${_var})
+        message(FATAL_ERROR "neutrino_memory_budget: ${_var} is required")
+    endif()
+endforeach()
+
+string(REGEX REPLACE "([][.*+?^$()|\\\\{}])" "\\\\\\1" _regex "${TEST}")
+set(_config_args "")
+if(CONFIG)
+    set(_config_args -C "${CONFIG}")
+endif()
+execute_process(
+    COMMAND "${CTEST}" --show-only=json-v1 -R "^${_regex}$" ${_config_args}
+    WORKING_DIRECTORY "${TEST_DIR}"
+    OUTPUT_VARIABLE _json
+    ERROR_VARIABLE _error
+    RESULT_VARIABLE _result
+)
+if(NOT _result EQUAL 0)
+    message(FATAL_ERROR "neutrino_memory_budget: ctest --show-only failed:\n${_error}")
+endif()
+string(JSON _count LENGTH "${_json}" tests)
+if(NOT _count EQUAL 1)
+    message(FATAL_ERROR "neutrino_memory_budget: expected one test named '${TEST}', found ${_count}")
+endif()
+
+string(JSON _length LENGTH "${_json}" tests 0 command)
+if(_length EQUAL 0)
+    message(FATAL_ERROR "neutrino_memory_budget: test '${TEST}' has no command")
+endif()
+set(_command "")
+math(EXPR _last "${_length} - 1")
+foreach(_i RANGE ${_last})
+    string(JSON _arg GET "${_json}" tests 0 command ${_i})
+    string(REPLACE ";" "\\;" _arg "${_arg}")
+    list(APPEND _command "${_arg}")
+endforeach()
+
+set(_working_directory "${TEST_DIR}")
+string(JSON _properties ERROR_VARIABLE _no_properties GET "${_json}" tests 0 properties)
+if(NOT _no_properties)
+    string(JSON _count LENGTH "${_properties}")
+    if(_count GREATER 0)
+        math(EXPR _last "${_count} - 1")
+        foreach(_i RANGE ${_last})
+            string(JSON _name GET "${_properties}" ${_i} name)
+            if(_name STREQUAL "WORKING_DIRECTORY")
+                string(JSON _working_directory GET "${_properties}" ${_i} value)
+            elseif(_name STREQUAL "ENVIRONMENT")
+                string(JSON _entries LENGTH "${_properties}" ${_i} value)
+                math(EXPR _entries_last "${_entries} - 1")
+                foreach(_j RANGE ${_entries_last})
+                    string(JSON _entry GET "${_properties}" ${_i} value ${_j})
+                    string(FIND "${_entry}" "=" _pos)
+                    string(SUBSTRING "${_entry}" 0 ${_pos} _key)
+                    math(EXPR _pos "${_pos} + 1")
+                    string(SUBSTRING "${_entry}" ${_pos} -1 _value)
+                    set(ENV{${_key}} "${_value}")
+                endforeach()
+            endif()
+        endforeach()
+    endif()
+endif()
+
+string(REPLACE "|" ";" MEMWATCH_ARGS "${MEMWATCH_ARGS}")
+execute_process(
+    COMMAND "${MEMWATCH}" ${MEMWATCH_ARGS} -- ${_command}
+    WORKING_DIRECTORY "${_working_directory}"
+    RESULT_VARIABLE _result
+)
+if(NOT _result EQUAL 0)
+    message(FATAL_ERROR "neutrino_memory_budget: ${TEST} failed or exceeded its budget (${_result})")
+endif()
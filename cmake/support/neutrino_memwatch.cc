@@ -0,0 +1,381 @@
+// =============================================================================
+// neutrino_memwatch - Test driver behind neutrino_add_memory_budget()
+// =============================================================================
+// Usage:
+//   neutrino_memwatch --name <test> --output <json> [--tool rusage|massif|heaptrack]
+//                     [--max-rss <size>] [--max-heap <size>] [--max-allocs <n>]
+//                     [--preload <libneutrino_memcount.so>] [--valgrind <exe>]
+//                     [--heaptrack <exe>] [--heaptrack-print <exe>]
+//                     -- <command> [args...]
+//
+// Runs the command, measures peak RSS (wait4), peak heap and allocation
+// count, writes them to the JSON file and fails when a budget is exceeded.
+// Sizes accept K, M and G suffixes (powers of 1024).
+//
+//   rusage    - peak RSS from the kernel; heap and allocations from the
+//               LD_PRELOAD counter (glibc) when --preload is given
+//   massif    - peak heap from valgrind --tool=massif
+//   heaptrack - peak heap and allocations from heaptrack/heaptrack_print
+//
+// POSIX only.
+// =============================================================================
+
+#include <sys/resource.h>
+#include <sys/types.h>
+#include <sys/wait.h>
+#include <unistd.h>
+
+#include <algorithm>
+#include <cerrno>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <iostream>
+#include <sstream>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace {
+
+namespace fs = std::filesystem;
+
+constexpr std::int64_t kUnknown = -1;
+
+struct options {
+    std::string name;
+    std::string output;
+    std::string tool = "rusage";
+    std::string preload;
+    std::string valgrind = "valgrind";
+    std::string heaptrack = "heaptrack";
+    std::string heaptrack_print = "heaptrack_print";
+    std::int64_t max_rss = kUnknown;
+    std::int64_t max_heap = kUnknown;
+    std::int64_t max_allocs = kUnknown;
+    std::vector<std::string> command;
+};
+
+struct measurement {
+    std::int64_t peak_rss = kUnknown;
+    std::int64_t peak_heap = kUnknown;
+    std::int64_t allocations = kUnknown;
+    int exit_code = 0;
+};
+
+std::int64_t parse_size(const std::string& text) {
+    std::size_t used = 0;
+    const double value = std::stod(text, &used);
+    std::string unit = text.substr(used);
+    std::int64_t scale = 1;
+    if (!unit.empty()) {
+        switch (unit[0]) {
+            case 'K': case 'k': scale = std::int64_t{1} << 10; break;
+            case 'M': case 'm': scale = std::int64_t{1} << 20; break;
+            case 'G': case 'g': scale = std::int64_t{1} << 30; break;
+            case 'B': case 'b': break;
+            default: throw std::invalid_argument("bad size '" + text + "'");
+        }
+    }
+    return static_cast<std::int64_t>(value * static_cast<double>(scale));
+}
+
+// fork/exec/wait4; returns the exit code (128 + signal when killed)
+int run(const std::vector<std::string>& argv, const std::vector<std::pair<std::string, std::string>>& env,
+        bool quiet, rusage* usage) {
+    const pid_t pid = fork();
+    if (pid < 0) {
+        throw std::runtime_error(std::string("fork failed: ") + std::strerror(errno));
+    }
+    if (pid == 0) {
+        for (const auto& [key, value] : env) {
+            setenv(key.c_str(), value.c_str(), 1);
+        }
+        if (quiet) {
+            std::freopen("/dev/null", "w", stdout);
+        }
+        std::vector<char*> args;
+        for (const std::string& arg : argv) {
+            args.push_back(const_cast<char*>(arg.c_str()));
+        }
+        args.push_back(nullptr);
+        execvp(args[0], args.data());
+        std::fprintf(stderr, "neutrino_memwatch: cannot run '%s': %s\n", args[0], std::strerror(errno));
+        _exit(127);
+    }
+
+    int status = 0;
+    rusage local{};
+    while (wait4(pid, &status, 0, usage != nullptr ? usage : &local) < 0) {
+        if (errno != EINTR) {
+            throw std::runtime_error(std::string("wait4 failed: ") + std::strerror(errno));
+        }
+    }
+    if (WIFSIGNALED(status)) {
+        return 128 + WTERMSIG(status);
+    }
+    return WEXITSTATUS(status);
+}
+
+std::string read_file(const fs::path& path) {
+    std::ifstream in(path, std::ios::binary);
+    std::ostringstream text;
+    text << in.rdbuf();
+    return text.str();
+}
+
+fs::path temp_path(const std::string& name, const char* suffix) {
+    return fs::temp_directory_path() / (name + "." + std::to_string(getpid()) + suffix);
+}
+
+measurement measure_rusage(const options& opt) {
+    measurement m;
+    std::vector<std::pair<std::string, std::string>> env;
+    fs::path counts;
+    if (!opt.preload.empty()) {
+        counts = temp_path("neutrino_memcount", ".txt");
+        fs::remove(counts);
+        std::string preload = opt.preload;
+        if (const char* existing = std::getenv("LD_PRELOAD"); existing != nullptr && *existing != '\0') {
+            preload += std::string(":") + existing;
+        }
+        env.emplace_back("LD_PRELOAD", preload);
+        env.emplace_back("NEUTRINO_MEMCOUNT_OUTPUT", counts.string());
+    }
+
+    rusage usage{};
+    m.exit_code = run(opt.command, env, false, &usage);
+#ifdef __APPLE__
+    m.peak_rss = static_cast<std::int64_t>(usage.ru_maxrss);  // bytes
+#else
+    m.peak_rss = static_cast<std::int64_t>(usage.ru_maxrss) * 1024;  // KiB
+#endif
+
+    if (!counts.empty() && fs::exists(counts)) {
+        // One line per process that loaded the counter
+        std::istringstream lines(read_file(counts));
+        std::int64_t allocations = 0;
+        std::int64_t peak = 0;
+        std::int64_t process_allocations = 0;
+        std::int64_t process_peak = 0;
+        while (lines >> process_allocations >> process_peak) {
+            allocations += process_allocations;
+            peak = std::max(peak, process_peak);
+        }
+        m.allocations = allocations;
+        m.peak_heap = peak;
+        fs::remove(counts);
+    }
+    return m;
+}
+
+measurement measure_massif(const options& opt) {
+    measurement m;
+    const fs::path out = temp_path("neutrino_massif", ".out");
+    std::vector<std::string> argv = {opt.valgrind, "--tool=massif", "--massif-out-file=" + out.string(),
+                                     "--depth=1", "--quiet"};
+    argv.insert(argv.end(), opt.command.begin(), opt.command.end());
+    m.exit_code = run(argv, {}, false, nullptr);
+
+    std::istringstream lines(read_file(out));
+    std::string line;
+    std::int64_t peak = kUnknown;
+    while (std::getline(lines, line)) {
+        if (line.rfind("mem_heap_B=", 0) == 0) {
+            peak = std::max<std::int64_t>(peak, std::stoll(line.substr(11)));
+        }
+    }
+    m.peak_heap = peak;
+    fs::remove(out);
+    return m;
+}
+
+// heaptrack_print sizes look like "1.23M" or "512B"
+std::int64_t parse_heaptrack_size(const std::string& text) {
+    std::size_t used = 0;
+    const double value = std::stod(text, &used);
+    const std::string unit = text.substr(used);
+    const double base = unit.find('i') != std::string::npos ? 1024.0 : 1000.0;
+    double scale = 1.0;
+    if (!unit.empty()) {
+        switch (unit[0]) {
+            case 'K': case 'k': scale = base; break;
+            case 'M': scale = base * base; break;
+            case 'G': scale = base * base * base; break;
+            default: break;
+        }
+    }
+    return static_cast<std::int64_t>(value * scale);
+}
+
+measurement measure_heaptrack(const options& opt) {
+    measurement m;
+    const fs::path base = temp_path("neutrino_heaptrack", "");
+    std::vector<std::string> argv = {opt.heaptrack, "-o", base.string()};
+    argv.insert(argv.end(), opt.command.begin(), opt.command.end());
+    m.exit_code = run(argv, {}, false, nullptr);
+
+    // heaptrack appends a compression suffix (.zst or .gz)
+    fs::path data;
+    for (const auto& item : fs::directory_iterator(base.parent_path())) {
+        if (item.path().filename().string().rfind(base.filename().string(), 0) == 0) {
+            data = item.path();
+        }
+    }
+    if (data.empty()) {
+        std::cerr << "neutrino_memwatch: heaptrack produced no data\n";
+        return m;
+    }
+
+    const fs::path report = temp_path("neutrino_heaptrack", ".txt");
+    const std::string shell = "'" + opt.heaptrack_print + "' '" + data.string() + "' > '" + report.string() + "'";
+    run({"/bin/sh", "-c", shell}, {}, true, nullptr);
+
+    std::istringstream lines(read_file(report));
+    std::string line;
+    while (std::getline(lines, line)) {
+        constexpr const char* kCalls = "calls to allocation functions: ";
+        constexpr const char* kPeak = "peak heap memory consumption: ";
+        if (line.rfind(kCalls, 0) == 0) {
+            m.allocations = std::stoll(line.substr(std::strlen(kCalls)));
+        } else if (line.rfind(kPeak, 0) == 0) {
+            m.peak_heap = parse_heaptrack_size(line.substr(std::strlen(kPeak)));
+        }
+    }
+    fs::remove(data);
+    fs::remove(report);
+    return m;
+}
+
+std::string json_escape(const std::string& text) {
+    std::string out;
+    for (const char c : text) {
+        if (c == '"' || c == '\\') {
+            out += '\\';
+        }
+        out += c;
+    }
+    return out;
+}
+
+void write_json(const options& opt, const measurement& m, bool passed) {
+    const auto value = [](std::int64_t v) { return v == kUnknown ? std::string("null") : std::to_string(v); };
+    std::ofstream out(opt.output, std::ios::trunc);
+    out << "{\n"
+        << "  \"test\": \"" << json_escape(opt.name) << "\",\n"
+        << "  \"tool\": \"" << opt.tool << "\",\n"
+        << "  \"exit_code\": " << m.exit_code << ",\n"
+        << "  \"peak_rss_bytes\": " << value(m.peak_rss) << ",\n"
+        << "  \"peak_heap_bytes\": " << value(m.peak_heap) << ",\n"
+        << "  \"allocations\": " << value(m.allocations) << ",\n"
+        << "  \"budget\": {\n"
+        << "    \"max_rss_bytes\": " << value(opt.max_rss) << ",\n"
+        << "    \"max_heap_bytes\": " << value(opt.max_heap) << ",\n"
+        << "    \"max_allocations\": " << value(opt.max_allocs) << "\n"
+        << "  },\n"
+        << "  \"passed\": " << (passed ? "true" : "false") << "\n"
+        << "}\n";
+}
+
+// Returns false if the measured value exceeds its budget
+bool check(const char* what, std::int64_t measured, std::int64_t budget) {
+    if (budget == kUnknown) {
+        return true;
+    }
+    if (measured == kUnknown) {
+        std::cout << "neutrino_memwatch: " << what << ": not measured, budget " << budget << " not checked\n";
+        return true;
+    }
+    const bool ok = measured <= budget;
+    std::cout << "neutrino_memwatch: " << what << ": " << measured << " (budget " << budget << ")"
+              << (ok ? "" : "  EXCEEDED") << '\n';
+    return ok;
+}
+
+int usage() {
+    std::cerr << "usage: neutrino_memwatch --name <test> --output <json> [--tool rusage|massif|heaptrack]\n"
+                 "                         [--max-rss <size>] [--max-heap <size>] [--max-allocs <n>]\n"
+                 "                         [--preload <lib>] [--valgrind <exe>] [--heaptrack <exe>]\n"
+                 "                         [--heaptrack-print <exe>] -- <command> [args...]\n";
+    return 2;
+}
+
+}  // namespace
+
+int main(int argc, char* argv[]) {
+    options opt;
+    try {
+        int i = 1;
+        for (; i < argc; ++i) {
+            const std::string arg = argv[i];
+            if (arg == "--") {
+                ++i;
+                break;
+            }
+            if (i + 1 >= argc) {
+                return usage();
+            }
+            const std::string value = argv[++i];
+            if (arg == "--name") {
+                opt.name = value;
+            } else if (arg == "--output") {
+                opt.output = value;
+            } else if (arg == "--tool") {
+                opt.tool = value;
+            } else if (arg == "--max-rss") {
+                opt.max_rss = parse_size(value);
+            } else if (arg == "--max-heap") {
+                opt.max_heap = parse_size(value);
+            } else if (arg == "--max-allocs") {
+                opt.max_allocs = std::stoll(value);
+            } else if (arg == "--preload") {
+                opt.preload = value;
+            } else if (arg == "--valgrind") {
+                opt.valgrind = value;
+            } else if (arg == "--heaptrack") {
+                opt.heaptrack = value;
+            } else if (arg == "--heaptrack-print") {
+                opt.heaptrack_print = value;
+            } else {
+                return usage();
+            }
+        }
+        opt.command.assign(argv + i, argv + argc);
+    } catch (const std::exception&) {
+        return usage();
+    }
+    if (opt.name.empty() || opt.output.empty() || opt.command.empty() ||
+        (opt.tool != "rusage" && opt.tool != "massif" && opt.tool != "heaptrack")) {
+        return usage();
+    }
+
+    try {
+        measurement m;
+        if (opt.tool == "massif") {
+            m = measure_massif(opt);
+        } else if (opt.tool == "heaptrack") {
+            m = measure_heaptrack(opt);
+        } else {
+            m = measure_rusage(opt);
+        }
+
+        bool passed = true;
+        passed = check("peak RSS bytes", m.peak_rss, opt.max_rss) && passed;
+        passed = check("peak heap bytes", m.peak_heap, opt.max_heap) && passed;
+        passed = check("allocations", m.allocations, opt.max_allocs) && passed;
+        write_json(opt, m, passed && m.exit_code == 0);
+
+        if (m.exit_code != 0) {
+            std::cout << "neutrino_memwatch: command exited with " << m.exit_code << '\n';
+            return m.exit_code;
+        }
+        return passed ? 0 : 1;
+    } catch (const std::exception& e) {
+        std::cerr << "neutrino_memwatch: " << e.what() << '\n';
+        return 1;
+    }
+}
@@ -0,0 +1,319 @@
+// =============================================================================
+// neutrino_pack - Build tool behind neutrino_add_asset_pack()
+// =============================================================================
+// Usage:
+//   neutrino_pack --manifest <file> --output <file> [--align <n>] [--compress none|lz4]
+//
+// The manifest lists one asset per line as "<name>\t<path>". The pack layout
+// is described in include/neutrino/asset_pack_format.hh.
+//
+// Self-contained (no include paths needed) so that it can be bootstrapped
+// with the host compiler when cross-compiling.
+// =============================================================================
+
+#include "include/neutrino/asset_pack_format.hh"
+
+#include <algorithm>
+#include <cstdint>
+#include <cstdio>
+#include <cstring>
+#include <fstream>
+#include <iostream>
+#include <iterator>
+#include <set>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+namespace {
+
+namespace fmt = neutrino::asset_pack_format;
+
+struct asset {
+    std::string name;
+    std::string path;
+    std::uint64_t hash = 0;
+    std::vector<std::uint8_t> stored;
+    std::uint64_t size = 0;
+    fmt::compression method = fmt::compression::none;
+};
+
+std::vector<std::uint8_t> read_file(const std::string& path) {
+    std::ifstream in(path, std::ios::binary);
+    if (!in) {
+        throw std::runtime_error("cannot open '" + path + "'");
+    }
+    return {std::istreambuf_iterator<char>(in), std::istreambuf_iterator<char>()};
+}
+
+// -----------------------------------------------------------------------------
+// LZ4 block compressor (greedy, single hash probe)
+// -----------------------------------------------------------------------------
+
+constexpr std::size_t kMinMatch = 4;
+constexpr std::size_t kLastLiterals = 5;  // block must end with >= 5 literals
+constexpr std::size_t kMatchLimit = 12;   // last match starts >= 12 bytes before end
+constexpr std::size_t kMaxOffset = 65535;
+constexpr unsigned kHashBits = 16;
+
+std::uint32_t read32(const std::uint8_t* p) {
+    std::uint32_t v = 0;
+    std::memcpy(&v, p, sizeof(v));
+    return v;
+}
+
+void write_length(std::vector<std::uint8_t>& out, std::size_t length) {
+    while (length >= 255) {
+        out.push_back(255);
+        length -= 255;
+    }
+    out.push_back(static_cast<std::uint8_t>(length));
+}
+
+void emit_sequence(std::vector<std::uint8_t>& out, const std::uint8_t* literals, std::size_t literal_count,
+                   std::size_t offset, std::size_t match_length) {
+    const std::size_t match_code = match_length == 0 ? 0 : match_length - kMinMatch;
+    const auto token = static_cast<std::uint8_t>((std::min<std::size_t>(literal_count, 15) << 4) |
+                                                 std::min<std::size_t>(match_code, 15));
+    out.push_back(token);
+    if (literal_count >= 15) {
+        write_length(out, literal_count - 15);
+    }
+    out.insert(out.end(), literals, literals + literal_count);
+    if (match_length == 0) {
+        return;
+    }
+    out.push_back(static_cast<std::uint8_t>(offset & 0xFF));
+    out.push_back(static_cast<std::uint8_t>(offset >> 8));
+    if (match_code >= 15) {
+        write_length(out, match_code - 15);
+    }
+}
+
+std::vector<std::uint8_t> lz4_compress(const std::vector<std::uint8_t>& input) {
+    const std::uint8_t* src = input.data();
+    const std::size_t n = input.size();
+
+    std::vector<std::uint8_t> out;
+    out.reserve(n + n / 255 + 16);
+
+    std::size_t anchor = 0;
+    if (n > kMatchLimit) {
+        std::vector<std::size_t> table(std::size_t{1} << kHashBits, SIZE_MAX);
+        std::size_t ip = 0;
+        while (ip + kMatchLimit <= n) {
+            const std::uint32_t sequence = read32(src + ip);
+            const std::uint32_t h = (sequence * 2654435761u) >> (32 - kHashBits);
+            const std::size_t ref = table[h];
+            table[h] = ip;
+
+            if (ref != SIZE_MAX && ip - ref <= kMaxOffset && read32(src + ref) == sequence) {
+                std::size_t length = kMinMatch;
+                const std::size_t max_length = n - kLastLiterals - ip;
+                while (length < max_length && src[ref + length] == src[ip + length]) {
+                    ++length;
+                }
+                emit_sequence(out, src + anchor, ip - anchor, ip - ref, length);
+                ip += length;
+                anchor = ip;
+            } else {
+                ++ip;
+            }
+        }
+    }
+    emit_sequence(out, src + anchor, n - anchor, 0, 0);
+    return out;
+}
+
+// -----------------------------------------------------------------------------
+// Pack writer
+// -----------------------------------------------------------------------------
+
+std::uint64_t align_up(std::uint64_t value, std::uint64_t alignment) {
+    return (value + alignment - 1) / alignment * alignment;
+}
+
+void pad_to(std::ofstream& out, std::uint64_t& position, std::uint64_t target) {
+    static const char zeros[4096] = {};
+    while (position < target) {
+        const auto chunk = static_cast<std::streamsize>(std::min<std::uint64_t>(target - position, sizeof(zeros)));
+        out.write(zeros, chunk);
+        position += static_cast<std::uint64_t>(chunk);
+    }
+}
+
+std::vector<asset> read_manifest(const std::string& manifest) {
+    std::ifstream in(manifest);
+    if (!in) {
+        throw std::runtime_error("cannot open manifest '" + manifest + "'");
+    }
+    std::vector<asset> assets;
+    std::set<std::string> names;
+    std::string line;
+    while (std::getline(in, line)) {
+        if (!line.empty() && line.back() == '\r') {
+            line.pop_back();
+        }
+        if (line.empty()) {
+            continue;
+        }
+        const auto tab = line.find('\t');
+        if (tab == std::string::npos) {
+            throw std::runtime_error("malformed manifest line: " + line);
+        }
+        asset a;
+        a.name = line.substr(0, tab);
+        a.path = line.substr(tab + 1);
+        if (!names.insert(a.name).second) {
+            throw std::runtime_error("duplicate asset name '" + a.name + "'");
+        }
+        assets.push_back(std::move(a));
+    }
+    return assets;
+}
+
+void write_pack(std::vector<asset>& assets, const std::string& output, std::uint32_t alignment) {
+    std::sort(assets.begin(), assets.end(), [](const asset& a, const asset& b) {
+        return a.hash != b.hash ? a.hash < b.hash : a.name < b.name;
+    });
+
+    std::uint32_t bits = 0;
+    while ((std::uint64_t{1} << bits) < assets.size()) {
+        ++bits;
+    }
+    std::vector<std::uint32_t> buckets((std::size_t{1} << bits) + 1, 0);
+    for (const asset& a : assets) {
+        ++buckets[fmt::bucket_of(a.hash, bits) + 1];
+    }
+    for (std::size_t i = 1; i < buckets.size(); ++i) {
+        buckets[i] += buckets[i - 1];
+    }
+
+    std::string names;
+    std::vector<fmt::entry> index(assets.size());
+    for (std::size_t i = 0; i < assets.size(); ++i) {
+        index[i].hash = assets[i].hash;
+        index[i].stored_size = assets[i].stored.size();
+        index[i].size = assets[i].size;
+        index[i].name_offset = static_cast<std::uint32_t>(names.size());
+        index[i].name_size = static_cast<std::uint32_t>(assets[i].name.size());
+        index[i].method = assets[i].method;
+        index[i].reserved = 0;
+        names += assets[i].name;
+    }
+
+    fmt::header header{};
+    std::memcpy(header.magic, fmt::kMagic, sizeof(fmt::kMagic));
+    header.version = fmt::kVersion;
+    header.entry_count = static_cast<std::uint32_t>(assets.size());
+    header.bucket_bits = bits;
+    header.alignment = alignment;
+    header.index_offset = sizeof(fmt::header);
+    header.buckets_offset = header.index_offset + index.size() * sizeof(fmt::entry);
+    header.names_offset = header.buckets_offset + buckets.size() * sizeof(std::uint32_t);
+    header.names_size = names.size();
+
+    std::uint64_t position = header.names_offset + header.names_size;
+    for (std::size_t i = 0; i < assets.size(); ++i) {
+        position = align_up(position, alignment);
+        index[i].offset = position;
+        position += index[i].stored_size;
+    }
+    header.file_size = position;
+
+    const std::string temp = output + ".tmp";
+    {
+        std::ofstream out(temp, std::ios::binary | std::ios::trunc);
+        if (!out) {
+            throw std::runtime_error("cannot write '" + temp + "'");
+        }
+        out.write(reinterpret_cast<const char*>(&header), sizeof(header));
+        out.write(reinterpret_cast<const char*>(index.data()),
+                  static_cast<std::streamsize>(index.size() * sizeof(fmt::entry)));
+        out.write(reinterpret_cast<const char*>(buckets.data()),
+                  static_cast<std::streamsize>(buckets.size() * sizeof(std::uint32_t)));
+        out.write(names.data(), static_cast<std::streamsize>(names.size()));
+
+        position = header.names_offset + header.names_size;
+        for (std::size_t i = 0; i < assets.size(); ++i) {
+            pad_to(out, position, index[i].offset);
+            out.write(reinterpret_cast<const char*>(assets[i].stored.data()),
+                      static_cast<std::streamsize>(assets[i].stored.size()));
+            position += assets[i].stored.size();
+        }
+        if (!out) {
+            throw std::runtime_error("error writing '" + temp + "'");
+        }
+    }
+    std::remove(output.c_str());
+    if (std::rename(temp.c_str(), output.c_str()) != 0) {
+        throw std::runtime_error("cannot rename '" + temp + "' to '" + output + "'");
+    }
+}
+
+int usage() {
+    std::cerr << "usage: neutrino_pack --manifest <file> --output <file> [--align <n>] [--compress none|lz4]\n";
+    return 2;
+}
+
+}  // namespace
+
+int main(int argc, char* argv[]) {
+    std::string manifest;
+    std::string output;
+    std::uint32_t alignment = 4096;
+    bool compress = false;
+
+    for (int i = 1; i < argc; ++i) {
+        const std::string arg = argv[i];
+        if (i + 1 >= argc) {
+            return usage();
+        }
+        const std::string value = argv[++i];
+        if (arg == "--manifest") {
+            manifest = value;
+        } else if (arg == "--output") {
+            output = value;
+        } else if (arg == "--align") {
+            alignment = static_cast<std::uint32_t>(std::stoul(value));
+        } else if (arg == "--compress") {
+            if (value != "none" && value != "lz4") {
+                return usage();
+            }
+            compress = value == "lz4";
+        } else {
+            return usage();
+        }
+    }
+    if (manifest.empty() || output.empty() || alignment == 0 || (alignment & (alignment - 1)) != 0) {
+        return usage();
+    }
+
+    const std::uint16_t probe = 1;
+    if (*reinterpret_cast<const std::uint8_t*>(&probe) != 1) {
+        std::cerr << "neutrino_pack: big-endian hosts are not supported\n";
+        return 1;
+    }
+
+    try {
+        std::vector<asset> assets = read_manifest(manifest);
+        for (asset& a : assets) {
+            a.hash = fmt::hash(a.name);
+            a.stored = read_file(a.path);
+            a.size = a.stored.size();
+            if (compress) {
+                std::vector<std::uint8_t> packed = lz4_compress(a.stored);
+                // Keep data that does not shrink uncompressed (and zero-copy)
+                if (packed.size() < a.stored.size()) {
+                    a.stored = std::move(packed);
+                    a.method = fmt::compression::lz4;
+                }
+            }
+        }
+        write_pack(assets, output, alignment);
+    } catch (const std::exception& e) {
+        std::cerr << "neutrino_pack: " << e.what() << '\n';
+        return 1;
+    }
+    return 0;
+}
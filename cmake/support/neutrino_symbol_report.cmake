@@ -0,0 +1,75 @@
+# =============================================================================
+# neutrino_symbol_report.cmake - Count the dynamic symbols a library exports
+# =============================================================================
+# POST_BUILD step behind neutrino_target_visibility(REPORT).
+#
+# Usage:
+#   cmake -DLIBRARY=<file> -DSTATE=<file> -DNM=<nm> [-DOBJECTS=<file>...]
+#         [-DAPPLE=ON] -P neutrino_symbol_report.cmake
+#
+# Prints the number of exported symbols, the number of global symbols
+# defined in OBJECTS (i.e. what default visibility would export) and the
+# exported count of the previous build, which is kept in STATE.
+# =============================================================================
+
+cmake_minimum_required(VERSION 3.20)
+
+foreach(_var LIBRARY STATE NM)
+    if(NOT DEFINED ${_var})
+        message(FATAL_ERROR "neutrino_symbol_report: ${_var} is required")
+    endif()
+endforeach()
+
+get_filename_component(_name "${LIBRARY}" NAME)
+
+if(APPLE)
+    set(_nm_args -gU)
+    set(_global_args -gU)
+else()
+    set(_nm_args -D --defined-only)
+    set(_global_args -g --defined-only)
+endif()
+execute_process(
+    COMMAND "${NM}" ${_nm_args} "${LIBRARY}"
+    OUTPUT_VARIABLE _nm_out
+    RESULT_VARIABLE _nm_result
+    ERROR_QUIET
+)
+if(NOT _nm_result EQUAL 0)
+    message(STATUS "[Neutrino] ${_name}: cannot list symbols with ${NM}")
+    return()
+endif()
+
+# One symbol per line: "<address> <type> <name>"; skip the version nodes
+string(REGEX MATCHALL "[^\n]+" _lines "${_nm_out}")
+list(FILTER _lines EXCLUDE REGEX " A ")
+list(LENGTH _lines _exported)
+
+set(_summary "${_exported} symbols")
+if(OBJECTS)
+    # Globals defined by the target's own objects: what default visibility
+    # would have exported
+    execute_process(
+        COMMAND "${NM}" ${_global_args} ${OBJECTS}
+        OUTPUT_VARIABLE _objects_out
+        RESULT_VARIABLE _objects_result
+        ERROR_QUIET
+    )
+    if(_objects_result EQUAL 0)
+        string(REGEX MATCHALL "[0-9a-fA-F]+ [A-Za-z] [^\n]+" _globals "${_objects_out}")
+        list(REMOVE_DUPLICATES _globals)
+        list(LENGTH _globals _global_count)
+        set(_summary "${_exported} of ${_global_count} global symbols")
+    endif()
+endif()
+
+if(EXISTS "${STATE}")
+    file(READ "${STATE}" _previous)
+    string(STRIP "${_previous}" _previous)
+    if(NOT _previous STREQUAL _exported)
+        string(APPEND _summary " (was ${_previous})")
+    endif()
+endif()
+file(WRITE "${STATE}" "${_exported}\n")
+
+message(STATUS "[Neutrino] ${_name}: exports ${_summary}")
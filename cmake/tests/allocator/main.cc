@@ -0,0 +1,71 @@
+#include <dlfcn.h>
+
+#include <cstddef>
+#include <cstdio>
+#include <cstring>
+#include <memory>
+
+// malloc, free and the allocator API are only reached through dlsym() and
+// shared libraries: a direct reference would pull the allocator out of a
+// static archive on its own and hide a broken link.
+template <typename Function>
+static Function lookup(const char* name) {
+    return reinterpret_cast<Function>(dlsym(RTLD_DEFAULT, name));
+}
+
+// The object that defines the malloc shared libraries (libc, libstdc++) bind to
+static const char* malloc_owner() {
+    Dl_info info{};
+    void* symbol = dlsym(RTLD_DEFAULT, "malloc");
+    if (symbol == nullptr || dladdr(symbol, &info) == 0 || info.dli_fname == nullptr) {
+        return "?";
+    }
+    return info.dli_fname;
+}
+
+int main() {
+    auto value = std::make_unique<int>(42);
+    // Allocated inside libc, so it shows which malloc libc itself calls
+    char* copy = strdup("neutrino");
+
+    const char* owner = malloc_owner();
+    std::printf("allocator: %s\n", NEUTRINO_ALLOCATOR_NAME);
+    std::printf("malloc: %s\n", owner);
+
+    int failures = 0;
+#if defined(EXPECT_MIMALLOC) || defined(EXPECT_JEMALLOC)
+#if defined(__linux__)
+    if (std::strstr(owner, "libc.so") != nullptr) {
+        std::printf("FAIL: malloc still resolves to the C library\n");
+        ++failures;
+    }
+#endif
+#endif
+#if defined(EXPECT_MIMALLOC)
+    auto version = lookup<int (*)()>("mi_version");
+    auto in_heap = lookup<bool (*)(const void*)>("mi_is_in_heap_region");
+    if (version == nullptr || in_heap == nullptr) {
+        std::printf("FAIL: mimalloc is not linked in\n");
+        ++failures;
+    } else if (!in_heap(copy) || !in_heap(value.get())) {
+        std::printf("FAIL: allocations are not served by mimalloc\n");
+        ++failures;
+    } else {
+        std::printf("mimalloc version: %d\n", version());
+    }
+#elif defined(EXPECT_JEMALLOC)
+    using mallctl_t = int (*)(const char*, void*, std::size_t*, void*, std::size_t);
+    auto mallctl = lookup<mallctl_t>("mallctl");
+    const char* version = nullptr;
+    std::size_t size = sizeof(version);
+    if (mallctl == nullptr || mallctl("version", &version, &size, nullptr, 0) != 0) {
+        std::printf("FAIL: jemalloc is not linked in\n");
+        ++failures;
+    } else {
+        std::printf("jemalloc version: %s\n", version);
+    }
+#endif
+
+    lookup<void (*)(void*)>("free")(copy);
+    return failures == 0 && *value == 42 ? 0 : 1;
+}
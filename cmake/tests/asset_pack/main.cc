@@ -0,0 +1,92 @@
+#ifdef ASSET_PACK_MMAP
+#include <neutrino/asset_pack.hh>
+#else
+#include <neutrino/asset_pack_view.hh>
+#endif
+
+#include <cstdio>
+#include <cstdlib>
+#include <fstream>
+#include <iterator>
+#include <string>
+#include <vector>
+
+namespace {
+
+std::vector<std::byte> load(const std::string& path) {
+    std::ifstream in(path, std::ios::binary);
+    std::vector<char> chars{std::istreambuf_iterator<char>(in), std::istreambuf_iterator<char>()};
+    std::vector<std::byte> bytes(chars.size());
+    for (std::size_t i = 0; i < chars.size(); ++i) {
+        bytes[i] = static_cast<std::byte>(chars[i]);
+    }
+    return bytes;
+}
+
+}  // namespace
+
+int main(int argc, char* argv[]) {
+    if (argc != 5) {
+        std::puts("usage: asset_pack_check <pack> <asset-dir> <count> <align>");
+        return 2;
+    }
+    const std::string asset_dir = argv[2];
+    const auto expected_count = std::strtoul(argv[3], nullptr, 10);
+    const auto alignment = std::strtoul(argv[4], nullptr, 10);
+
+#ifdef ASSET_PACK_MMAP
+    const neutrino::asset_pack pack{argv[1]};
+    const std::byte* base = nullptr;
+#else
+    const std::vector<std::byte> bytes = load(argv[1]);
+    const neutrino::asset_pack_view pack{bytes};
+    const std::byte* base = bytes.data();
+#endif
+    if (pack.size() != expected_count) {
+        std::printf("expected %lu entries, got %zu\n", expected_count, pack.size());
+        return 1;
+    }
+
+    for (const auto& e : pack.entries()) {
+        const std::string name{pack.name(e)};
+        const std::vector<std::byte> original = load(asset_dir + "/" + name);
+
+        if (pack.find(name) != &e) {
+            std::printf("lookup of '%s' failed\n", name.c_str());
+            return 1;
+        }
+        if (e.offset % alignment != 0) {
+            std::printf("'%s' is not aligned\n", name.c_str());
+            return 1;
+        }
+        if (pack.read(name) != original) {
+            std::printf("content of '%s' differs\n", name.c_str());
+            return 1;
+        }
+        const auto view = pack.get(name);
+        if (e.method == neutrino::asset_pack_format::compression::none) {
+            if (!view.empty() && base == nullptr) {
+                base = view.data() - e.offset;
+            }
+            if (view.size() != original.size() || (!view.empty() && view.data() != base + e.offset)) {
+                std::printf("zero-copy view of '%s' is wrong\n", name.c_str());
+                return 1;
+            }
+        } else {
+            std::printf("'%s' compressed %llu -> %llu bytes\n", name.c_str(),
+                        static_cast<unsigned long long>(e.size), static_cast<unsigned long long>(e.stored_size));
+            if (!view.empty()) {
+                std::printf("get() of compressed '%s' should be empty\n", name.c_str());
+                return 1;
+            }
+        }
+    }
+
+    if (pack.contains("missing.bin") || pack.find("text") != nullptr) {
+        std::puts("lookup of a missing asset succeeded");
+        return 1;
+    }
+
+    std::printf("asset pack OK (%zu entries)\n", pack.size());
+    return 0;
+}
@@ -0,0 +1,30 @@
+# Checks that the generated parse benchmark wrote Google Benchmark JSON with
+# one entry per corpus file, each reporting throughput and allocations.
+file(READ "${RESULTS}" _results)
+
+string(JSON _count LENGTH "${_results}" benchmarks)
+set(_names "")
+math(EXPR _last "${_count} - 1")
+foreach(_i RANGE ${_last})
+    string(JSON _name GET "${_results}" benchmarks ${_i} name)
+    string(JSON _bytes GET "${_results}" benchmarks ${_i} bytes_per_second)
+    string(JSON _allocs GET "${_results}" benchmarks ${_i} allocs_per_parse)
+    if(NOT _bytes GREATER 0)
+        message(FATAL_ERROR "${_name}: no throughput reported")
+    endif()
+    # One allocation per parse: the vector of values
+    if(NOT _allocs EQUAL 1)
+        message(FATAL_ERROR "${_name}: expected 1 allocation per parse, got ${_allocs}")
+    endif()
+    list(APPEND _names "${_name}")
+    message("${_name}: ${_bytes} B/s, ${_allocs} allocs/parse")
+endforeach()
+
+set(_expected
+    "parse/demo::record/record_200.bin"
+    "parse/demo::record/record_4.bin"
+    "parse/demo::record/record_50.bin"
+)
+if(NOT _names STREQUAL _expected)
+    message(FATAL_ERROR "unexpected benchmarks: ${_names}")
+endif()
@@ -0,0 +1,6 @@
+#include <demo/record.h>
+
+// Anchor for the generated code, as a real format library would have
+namespace demo {
+std::size_t record_value_count(const record& r) { return r.values.size(); }
+}  // namespace demo
@@ -0,0 +1,32 @@
+// Output of the stand-in generator for schema/record.ds
+#pragma once
+
+#include <cstdint>
+#include <stdexcept>
+#include <vector>
+
+namespace demo {
+
+struct record {
+    std::uint8_t magic[4];
+    std::uint8_t count;
+    std::vector<std::uint8_t> values;
+
+    static record read(const std::uint8_t* begin, const std::uint8_t* end) {
+        if (end - begin < 5) {
+            throw std::runtime_error("record: truncated header");
+        }
+        record r{};
+        for (int i = 0; i < 4; ++i) {
+            r.magic[i] = begin[i];
+        }
+        r.count = begin[4];
+        if (end - begin - 5 < r.count) {
+            throw std::runtime_error("record: truncated values");
+        }
+        r.values.assign(begin + 5, begin + 5 + r.count);
+        return r;
+    }
+};
+
+}  // namespace demo
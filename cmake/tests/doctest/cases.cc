@@ -0,0 +1,21 @@
+#include <doctest/doctest.h>
+
+#include <string>
+
+TEST_CASE("plain case") {
+    CHECK(1 + 1 == 2);
+}
+
+TEST_CASE("name, with comma") {
+    CHECK(std::string("a,b").size() == 3);
+}
+
+TEST_SUITE("codec") {
+    TEST_CASE("decode") {
+        CHECK(true);
+    }
+
+    TEST_CASE("plain case") {
+        CHECK(true);
+    }
+}
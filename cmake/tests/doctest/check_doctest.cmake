@@ -0,0 +1,54 @@
+# Builds the doctest fixture and checks that each case became its own test.
+cmake_minimum_required(VERSION 3.20)
+
+foreach(_step configure build)
+    if(_step STREQUAL "configure")
+        set(_command ${CMAKE_COMMAND} -S "${SOURCE_DIR}" -B "${BINARY_DIR}" -G "${GENERATOR}"
+            "-DNEUTRINO_CMAKE_DIR=${NEUTRINO_CMAKE_DIR}")
+    else()
+        set(_command ${CMAKE_COMMAND} --build "${BINARY_DIR}")
+    endif()
+    execute_process(COMMAND ${_command} RESULT_VARIABLE _result OUTPUT_VARIABLE _output ERROR_VARIABLE _output)
+    if(NOT _result EQUAL 0)
+        message(FATAL_ERROR "${_step} failed:\n${_output}")
+    endif()
+endforeach()
+
+execute_process(
+    COMMAND ${CMAKE_CTEST_COMMAND} -N
+    WORKING_DIRECTORY "${BINARY_DIR}"
+    OUTPUT_VARIABLE _listed
+)
+foreach(_name "discovery.plain case" "discovery.name, with comma" "discovery.codec/plain case" "discovery.decode")
+    string(FIND "${_listed}" "${_name}\n" _found)
+    if(_found EQUAL -1)
+        message(FATAL_ERROR "test '${_name}' was not registered:\n${_listed}")
+    endif()
+endforeach()
+
+# Suite cases carry the suite as a label; every case passes on its own
+execute_process(
+    COMMAND ${CMAKE_CTEST_COMMAND} -L codec -N
+    WORKING_DIRECTORY "${BINARY_DIR}"
+    OUTPUT_VARIABLE _codec
+)
+if(NOT _codec MATCHES "Total Tests: 2")
+    message(FATAL_ERROR "expected 2 tests labelled 'codec':\n${_codec}")
+endif()
+execute_process(
+    COMMAND ${CMAKE_CTEST_COMMAND} -j4 --output-on-failure
+    WORKING_DIRECTORY "${BINARY_DIR}"
+    RESULT_VARIABLE _result
+    OUTPUT_VARIABLE _output
+)
+if(NOT _result EQUAL 0 OR NOT _output MATCHES "100% tests passed, 0 tests failed out of 4")
+    message(FATAL_ERROR "discovered tests failed:\n${_output}")
+endif()
+
+# Rebuilding an unchanged binary must not query it again
+execute_process(COMMAND ${CMAKE_COMMAND} --build "${BINARY_DIR}" OUTPUT_VARIABLE _rebuild)
+if(_rebuild MATCHES "registered")
+    message(FATAL_ERROR "discovery ran again for an unchanged binary:\n${_rebuild}")
+endif()
+
+message(STATUS "doctest discovery PASSED")
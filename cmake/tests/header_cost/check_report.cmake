@@ -0,0 +1,32 @@
+# Checks the header cost report: one entry per public header outside
+# detail/, with <regex> making heavy.hpp the expensive one.
+file(READ "${REPORT}" _report)
+
+string(JSON _passed GET "${_report}" passed)
+if(NOT _passed)
+    message(FATAL_ERROR "report not passed")
+endif()
+
+string(JSON _count LENGTH "${_report}" headers)
+if(NOT _count EQUAL 2)
+    message(FATAL_ERROR "expected 2 headers (detail/ excluded), found ${_count}")
+endif()
+
+string(JSON _light_lines GET "${_report}" headers "hcost/light.hpp" lines)
+string(JSON _light_files GET "${_report}" headers "hcost/light.hpp" files)
+string(JSON _heavy_lines GET "${_report}" headers "hcost/heavy.hpp" lines)
+string(JSON _heavy_files GET "${_report}" headers "hcost/heavy.hpp" files)
+string(JSON _heavy_ms GET "${_report}" headers "hcost/heavy.hpp" cpu_ms)
+string(JSON _heaviest GET "${_report}" headers "hcost/heavy.hpp" heaviest 0 file)
+
+if(NOT _light_lines GREATER 0 OR _light_lines GREATER 20)
+    message(FATAL_ERROR "light.hpp: unexpected line count ${_light_lines}")
+endif()
+if(NOT _heavy_lines GREATER 5000 OR NOT _heavy_files GREATER _light_files)
+    message(FATAL_ERROR "heavy.hpp: ${_heavy_lines} lines in ${_heavy_files} files")
+endif()
+if(NOT _heavy_ms GREATER 0)
+    message(FATAL_ERROR "heavy.hpp: no compile time")
+endif()
+message("light.hpp: ${_light_lines} lines; heavy.hpp: ${_heavy_lines} lines, "
+    "${_heavy_files} files, ${_heavy_ms} ms, heaviest ${_heaviest}")
@@ -0,0 +1,5 @@
+// Relies on <vector> being included first, so it is not self-contained and
+// has to be excluded from the check
+namespace hcost::detail {
+    inline std::vector<int> empty() { return {}; }
+}
@@ -0,0 +1,14 @@
+#ifndef HCOST_HEAVY_HPP_
+#define HCOST_HEAVY_HPP_
+
+#include <iostream>
+#include <regex>
+#include <string>
+
+namespace hcost {
+    inline bool matches(const std::string& text) {
+        return std::regex_match(text, std::regex("[a-z]+"));
+    }
+}
+
+#endif
@@ -0,0 +1,8 @@
+#ifndef HCOST_LIGHT_HPP_
+#define HCOST_LIGHT_HPP_
+
+namespace hcost {
+    inline int twice(int value) { return 2 * value; }
+}
+
+#endif
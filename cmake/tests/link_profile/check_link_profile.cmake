@@ -0,0 +1,29 @@
+# Checks the dynamic sections produced by NEUTRINO_LINK_PROFILE=fast-startup
+# with NEUTRINO_LINK_BINDING=now.
+cmake_minimum_required(VERSION 3.20)
+
+execute_process(
+    COMMAND "${READELF}" --dynamic --wide "${EXECUTABLE}"
+    OUTPUT_VARIABLE _exe
+    COMMAND_ERROR_IS_FATAL ANY
+)
+execute_process(
+    COMMAND "${READELF}" --relocs --wide "${LIBRARY}"
+    OUTPUT_VARIABLE _lib
+    COMMAND_ERROR_IS_FATAL ANY
+)
+
+if(_exe MATCHES "NEEDED[^\n]*libm\\.so")
+    message(FATAL_ERROR "--as-needed did not drop libm:\n${_exe}")
+endif()
+if(NOT _exe MATCHES "GNU_HASH" OR _exe MATCHES "\\(HASH\\)")
+    message(FATAL_ERROR "expected a GNU hash table only:\n${_exe}")
+endif()
+if(NOT _exe MATCHES "BIND_NOW|FLAGS_1[^\n]*NOW")
+    message(FATAL_ERROR "expected immediate binding:\n${_exe}")
+endif()
+# -Bsymbolic-functions binds the internal call at link time: no PLT slot
+if(_lib MATCHES "JUMP_SLOT[^\n]*link_greeting")
+    message(FATAL_ERROR "link_greeting is still called through the PLT:\n${_lib}")
+endif()
+message(STATUS "link profile ok")
@@ -0,0 +1,8 @@
+const char* link_greeting() {
+    return "hello from a shared library";
+}
+
+const char* link_greeting_twice() {
+    // Bound locally with -Bsymbolic-functions
+    return link_greeting();
+}
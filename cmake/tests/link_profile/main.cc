@@ -0,0 +1,8 @@
+#include <cstdio>
+
+const char* link_greeting_twice();
+
+int main() {
+    std::printf("%s\n", link_greeting_twice());
+    return 0;
+}
@@ -0,0 +1,110 @@
+# Builds the LTO fixture in thin and full mode, checks that the dependency
+# subproject picks up the mode's flags, and reports the relink time after a
+# one-file change. Prints "SKIPPED" when the toolchain has no LTO.
+# The fixture is built from a copy in BINARY_DIR, so the change touches
+# nothing in the source tree.
+cmake_minimum_required(VERSION 3.20)
+
+# Build the fixture and return the wall time in milliseconds
+function(_timed_build DIR OUTPUT_VAR)
+    string(TIMESTAMP _start "%s%f")
+    execute_process(
+        COMMAND ${CMAKE_COMMAND} --build "${DIR}"
+        RESULT_VARIABLE _result
+        OUTPUT_VARIABLE _output
+        ERROR_VARIABLE _output
+    )
+    string(TIMESTAMP _end "%s%f")
+    if(NOT _result EQUAL 0)
+        message(FATAL_ERROR "building ${DIR} failed:\n${_output}")
+    endif()
+    math(EXPR _ms "(${_end} - ${_start}) / 1000")
+    set(${OUTPUT_VAR} ${_ms} PARENT_SCOPE)
+endfunction()
+
+set(_source "${BINARY_DIR}/src")
+file(REMOVE_RECURSE "${_source}")
+file(COPY "${SOURCE_DIR}/" DESTINATION "${_source}")
+
+foreach(_mode thin full)
+    set(_dir "${BINARY_DIR}/${_mode}")
+    file(REMOVE_RECURSE "${_dir}")
+    execute_process(
+        COMMAND ${CMAKE_COMMAND} -S "${_source}" -B "${_dir}" -G "${GENERATOR}"
+            "-DNEUTRINO_CMAKE_DIR=${NEUTRINO_CMAKE_DIR}"
+            -DCMAKE_BUILD_TYPE=Release
+            -DNEUTRINO_LTO_MODE=${_mode}
+        RESULT_VARIABLE _result
+        OUTPUT_VARIABLE _output
+        ERROR_VARIABLE _output
+    )
+    if(NOT _result EQUAL 0)
+        message(FATAL_ERROR "configure (${_mode}) failed:\n${_output}")
+    endif()
+    if(_output MATCHES "LTO: off \\(${_mode} disabled: ([^)\n]*)")
+        message("SKIPPED: LTO ${CMAKE_MATCH_1}")
+        return()
+    endif()
+
+    # The dependency subproject must be built with the same LTO flags
+    file(GLOB_RECURSE _build_files
+        "${_dir}/*/flags.make" "${_dir}/*/link.txt" "${_dir}/build.ninja"
+    )
+    set(_commands "")
+    foreach(_file IN LISTS _build_files)
+        file(READ "${_file}" _content)
+        string(APPEND _commands "${_content}\n")
+    endforeach()
+    file(STRINGS "${_dir}/CMakeCache.txt" _compiler_id REGEX "^CMAKE_CXX_COMPILER_ID:")
+    if(_compiler_id MATCHES "=GNU$")
+        if(_mode STREQUAL "thin")
+            set(_expected "-flto-partition=balanced" "gcc-ar")
+        else()
+            set(_expected "-flto-partition=one" "gcc-ar")
+        endif()
+    elseif(_compiler_id MATCHES "=(Apple)?Clang$")
+        set(_expected "-flto=${_mode}")
+    else()
+        set(_expected "")
+    endif()
+    foreach(_flag IN LISTS _expected)
+        string(FIND "${_commands}" "${_flag}" _pos)
+        if(_pos EQUAL -1)
+            message(FATAL_ERROR "${_mode}: '${_flag}' missing from the generated build commands")
+        endif()
+    endforeach()
+    file(GLOB_RECURSE _dep_files "${_dir}/dep/*/flags.make" "${_dir}/build.ninja")
+    set(_dep_flags "")
+    foreach(_file IN LISTS _dep_files)
+        file(STRINGS "${_file}" _lines REGEX "FLAGS")
+        string(APPEND _dep_flags "${_lines}\n")
+    endforeach()
+    if(_compiler_id MATCHES "=(GNU|Clang|AppleClang)$" AND NOT _dep_flags MATCHES "-flto")
+        message(FATAL_ERROR "${_mode}: dependency compiled without -flto")
+    endif()
+
+    _timed_build("${_dir}" _${_mode}_full)
+    file(TOUCH "${_source}/dep/transform.cc")
+    _timed_build("${_dir}" _${_mode}_relink)
+
+    file(GLOB_RECURSE _exe "${_dir}/lto_demo" "${_dir}/lto_demo.exe")
+    execute_process(COMMAND ${_exe} RESULT_VARIABLE _result OUTPUT_VARIABLE _output)
+    if(NOT _result EQUAL 0 OR NOT _output MATCHES "checksum [0-9]+")
+        message(FATAL_ERROR "${_mode}: lto_demo failed (${_result}): ${_output}")
+    endif()
+    set(_${_mode}_output "${_output}")
+
+    if(_mode STREQUAL "thin" AND _compiler_id MATCHES "=(Apple)?Clang$")
+        file(GLOB _cache_entries "${_dir}/lto-cache/*")
+        list(LENGTH _cache_entries _cache_count)
+        message("[Neutrino] ThinLTO cache entries: ${_cache_count}")
+    endif()
+endforeach()
+
+if(NOT _thin_output STREQUAL _full_output)
+    message(FATAL_ERROR "modes disagree: '${_thin_output}' vs '${_full_output}'")
+endif()
+
+message("[Neutrino] LTO build time, thin vs full:")
+message("  full build:         ${_thin_full} ms vs ${_full_full} ms")
+message("  one file relinked:  ${_thin_relink} ms vs ${_full_relink} ms")
@@ -0,0 +1,9 @@
+#pragma once
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+std::vector<std::uint32_t> parse_numbers(const std::string& text);
+void transform_numbers(std::vector<std::uint32_t>& values);
+std::uint64_t reduce_numbers(const std::vector<std::uint32_t>& values);
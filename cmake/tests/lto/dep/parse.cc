@@ -0,0 +1,21 @@
+#include "ltodep.hh"
+
+std::vector<std::uint32_t> parse_numbers(const std::string& text) {
+    std::vector<std::uint32_t> values;
+    std::uint32_t current = 0;
+    bool in_number = false;
+    for (char c : text) {
+        if (c >= '0' && c <= '9') {
+            current = current * 10 + static_cast<std::uint32_t>(c - '0');
+            in_number = true;
+        } else if (in_number) {
+            values.push_back(current);
+            current = 0;
+            in_number = false;
+        }
+    }
+    if (in_number) {
+        values.push_back(current);
+    }
+    return values;
+}
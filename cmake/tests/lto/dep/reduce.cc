@@ -0,0 +1,9 @@
+#include "ltodep.hh"
+
+std::uint64_t reduce_numbers(const std::vector<std::uint32_t>& values) {
+    std::uint64_t sum = 0;
+    for (auto v : values) {
+        sum += v % 1000003u;
+    }
+    return sum;
+}
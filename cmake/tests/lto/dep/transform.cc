@@ -0,0 +1,7 @@
+#include "ltodep.hh"
+
+void transform_numbers(std::vector<std::uint32_t>& values) {
+    for (auto& v : values) {
+        v = v * 2654435761u ^ (v >> 7);
+    }
+}
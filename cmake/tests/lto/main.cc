@@ -0,0 +1,10 @@
+#include <iostream>
+
+#include "ltodep.hh"
+
+int main() {
+    auto values = parse_numbers("3 1 4 1 5 9 2 6 5 3 5 8 9 7 9");
+    transform_numbers(values);
+    std::cout << "checksum " << reduce_numbers(values) << '\n';
+    return 0;
+}
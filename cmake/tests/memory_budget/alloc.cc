@@ -0,0 +1,18 @@
+// Allocates a known number of blocks so the budgets below are deterministic.
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <memory>
+#include <vector>
+
+int main(int argc, char* argv[]) {
+    const int blocks = argc > 1 ? std::atoi(argv[1]) : 100;
+    std::vector<std::unique_ptr<char[]>> live;
+    live.reserve(static_cast<std::size_t>(blocks));
+    for (int i = 0; i < blocks; ++i) {
+        live.emplace_back(new char[4096]);
+        std::memset(live.back().get(), i, 4096);
+    }
+    std::printf("allocated %d blocks\n", blocks);
+    return 0;
+}
@@ -0,0 +1,28 @@
+# Checks the JSON written by neutrino_add_memory_budget(memory_within_budget).
+cmake_minimum_required(VERSION 3.20)
+
+if(NOT EXISTS "${REPORT}")
+    message(FATAL_ERROR "memory report not written: ${REPORT}")
+endif()
+file(READ "${REPORT}" _json)
+
+string(JSON _passed GET "${_json}" passed)
+string(JSON _rss GET "${_json}" peak_rss_bytes)
+string(JSON _heap GET "${_json}" peak_heap_bytes)
+string(JSON _allocs GET "${_json}" allocations)
+string(JSON _budget GET "${_json}" budget max_allocations)
+
+if(NOT _passed STREQUAL "ON")
+    message(FATAL_ERROR "memory_within_budget did not pass:\n${_json}")
+endif()
+if(NOT _rss GREATER 0)
+    message(FATAL_ERROR "peak RSS not recorded:\n${_json}")
+endif()
+# 100 blocks of 4 KiB are live at once
+if(NOT _heap GREATER_EQUAL 409600 OR NOT _allocs GREATER_EQUAL 100)
+    message(FATAL_ERROR "heap/allocation counts missing:\n${_json}")
+endif()
+if(NOT _budget EQUAL 1000)
+    message(FATAL_ERROR "budget not recorded:\n${_json}")
+endif()
+message(STATUS "rss=${_rss} heap=${_heap} allocations=${_allocs}")
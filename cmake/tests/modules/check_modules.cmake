@@ -0,0 +1,80 @@
+# Builds the modules fixture and compares rebuild times of the header-based
+# and module-based variants. Prints "SKIPPED" when modules are unavailable.
+cmake_minimum_required(VERSION 3.20)
+
+find_program(NINJA_EXECUTABLE NAMES ninja ninja-build)
+if(NOT NINJA_EXECUTABLE)
+    message("SKIPPED: C++20 modules need the Ninja generator, ninja not found")
+    return()
+endif()
+
+file(REMOVE_RECURSE "${BINARY_DIR}")
+execute_process(
+    COMMAND ${CMAKE_COMMAND} -S "${SOURCE_DIR}" -B "${BINARY_DIR}" -G Ninja
+        "-DCMAKE_MAKE_PROGRAM=${NINJA_EXECUTABLE}"
+        "-DNEUTRINO_CMAKE_DIR=${NEUTRINO_CMAKE_DIR}"
+        -DCMAKE_BUILD_TYPE=Release
+    RESULT_VARIABLE _result
+    OUTPUT_VARIABLE _output
+    ERROR_VARIABLE _output
+)
+if(NOT _result EQUAL 0)
+    message(FATAL_ERROR "configure failed:\n${_output}")
+endif()
+
+if(_output MATCHES "C\\+\\+20 modules unavailable: ([^\n]*)")
+    message("SKIPPED: C++20 modules unavailable: ${CMAKE_MATCH_1}")
+    return()
+endif()
+
+# Build <target> and return the wall time in milliseconds
+function(_timed_build TARGET OUTPUT_VAR)
+    string(TIMESTAMP _start "%s%f")
+    execute_process(
+        COMMAND ${CMAKE_COMMAND} --build "${BINARY_DIR}" --target ${TARGET}
+        RESULT_VARIABLE _result
+        OUTPUT_VARIABLE _output
+        ERROR_VARIABLE _output
+    )
+    string(TIMESTAMP _end "%s%f")
+    if(NOT _result EQUAL 0)
+        message(FATAL_ERROR "building ${TARGET} failed:\n${_output}")
+    endif()
+    math(EXPR _ms "(${_end} - ${_start}) / 1000")
+    set(${OUTPUT_VAR} ${_ms} PARENT_SCOPE)
+endfunction()
+
+function(_clean)
+    execute_process(COMMAND ${CMAKE_COMMAND} --build "${BINARY_DIR}" --target clean OUTPUT_QUIET)
+endfunction()
+
+# Full builds
+_clean()
+_timed_build(header_demo _header_full)
+_clean()
+_timed_build(module_demo _module_full)
+
+# Incremental: one consumer changed
+foreach(_variant header module)
+    file(TOUCH "${BINARY_DIR}/${_variant}/consumer_1.cc")
+    _timed_build(${_variant}_demo _${_variant}_incremental)
+endforeach()
+
+foreach(_variant header module)
+    execute_process(
+        COMMAND "${BINARY_DIR}/bin/${_variant}_demo"
+        RESULT_VARIABLE _result
+        OUTPUT_VARIABLE _output
+    )
+    if(NOT _result EQUAL 0 OR NOT _output MATCHES "checksum [0-9]+")
+        message(FATAL_ERROR "${_variant}_demo failed (${_result}): ${_output}")
+    endif()
+    set(_${_variant}_output "${_output}")
+endforeach()
+if(NOT _header_output STREQUAL _module_output)
+    message(FATAL_ERROR "variants disagree: '${_header_output}' vs '${_module_output}'")
+endif()
+
+message("[Neutrino] Rebuild time, header vs module consumers:")
+message("  full build:         ${_header_full} ms vs ${_module_full} ms")
+message("  one consumer:       ${_header_incremental} ms vs ${_module_incremental} ms")
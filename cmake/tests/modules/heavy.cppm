@@ -0,0 +1,14 @@
+module;
+
+#include <algorithm>
+#include <map>
+#include <regex>
+#include <sstream>
+#include <string>
+#include <vector>
+
+export module heavy;
+
+export namespace heavy {
+#include "heavy_body.inc"
+}  // namespace heavy
@@ -0,0 +1,12 @@
+#pragma once
+
+#include <algorithm>
+#include <map>
+#include <regex>
+#include <sstream>
+#include <string>
+#include <vector>
+
+namespace heavy {
+#include "heavy_body.inc"
+}  // namespace heavy
@@ -0,0 +1,19 @@
+// Loops with known vectorizer outcomes. With REGRESS the scaling loop gets
+// a loop-carried dependency and must stop vectorizing.
+void scale_row(float* __restrict out, const float* __restrict in, int n, float k) {
+    for (int i = 0; i < n; ++i) {
+#ifdef REGRESS
+        out[i] = in[i] * k + (i > 0 ? out[i - 1] : 0.0f);
+#else
+        out[i] = in[i] * k;
+#endif
+    }
+}
+
+int walk_list(const int* next, int start) {
+    int sum = 0;
+    for (int i = start; i != -1; i = next[i]) {
+        sum += i;
+    }
+    return sum;
+}
@@ -0,0 +1,7 @@
+bool optdep_optimized() {
+#ifdef __OPTIMIZE__
+    return true;
+#else
+    return false;
+#endif
+}
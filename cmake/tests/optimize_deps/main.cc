@@ -0,0 +1,13 @@
+#include <cstdio>
+
+bool optdep_optimized();
+
+int main() {
+#ifdef __OPTIMIZE__
+    const bool self_optimized = true;
+#else
+    const bool self_optimized = false;
+#endif
+    std::printf("project optimized: %d, dependency optimized: %d\n", self_optimized, optdep_optimized());
+    return !self_optimized && optdep_optimized() ? 0 : 1;
+}
@@ -0,0 +1,129 @@
+# Checks the CMakePresets.json that neutrino-new generates, and that
+# "neutrino-new presets --update" refreshes it without touching other files.
+#
+# Usage: cmake -DNEUTRINO_NEW=<neutrino-new.py> -DPYTHON=<python>
+#              -DWORK_DIR=<dir> -P check_presets.cmake
+cmake_minimum_required(VERSION 3.25)
+
+set(_project "${WORK_DIR}/preset-lib")
+file(REMOVE_RECURSE "${WORK_DIR}")
+file(MAKE_DIRECTORY "${WORK_DIR}")
+
+execute_process(
+    COMMAND "${PYTHON}" "${NEUTRINO_NEW}" preset-lib --type=compiled --output "${WORK_DIR}"
+    RESULT_VARIABLE _result
+    OUTPUT_QUIET
+)
+if(NOT _result EQUAL 0)
+    message(FATAL_ERROR "neutrino-new failed: ${_result}")
+endif()
+
+# CMake itself has to accept the file
+execute_process(
+    COMMAND "${CMAKE_COMMAND}" --list-presets=all
+    WORKING_DIRECTORY "${_project}"
+    RESULT_VARIABLE _result
+    OUTPUT_VARIABLE _list
+    ERROR_VARIABLE _list
+)
+if(NOT _result EQUAL 0)
+    message(FATAL_ERROR "cmake --list-presets failed:\n${_list}")
+endif()
+foreach(_preset debug-fast release release-native profiling asan tsan msan benchmark)
+    if(NOT _list MATCHES "\"${_preset}\"")
+        message(FATAL_ERROR "preset ${_preset} missing:\n${_list}")
+    endif()
+endforeach()
+
+file(READ "${_project}/CMakePresets.json" _presets)
+string(JSON _count LENGTH "${_presets}" configurePresets)
+math(EXPR _last "${_count} - 1")
+foreach(_i RANGE ${_last})
+    string(JSON _name GET "${_presets}" configurePresets ${_i} name)
+    if(_name STREQUAL "debug-fast")
+        string(JSON _optimize_deps GET "${_presets}" configurePresets ${_i} cacheVariables NEUTRINO_OPTIMIZE_DEPS)
+    elseif(_name STREQUAL "release-native")
+        string(JSON _lto GET "${_presets}" configurePresets ${_i} cacheVariables NEUTRINO_LTO_MODE)
+    elseif(_name STREQUAL "benchmark")
+        string(JSON _generator GET "${_presets}" configurePresets ${_i} generator)
+        string(JSON _benchmarks GET "${_presets}" configurePresets ${_i}
+            cacheVariables NEUTRINO_PRESET_LIB_BUILD_BENCHMARKS)
+    endif()
+endforeach()
+if(NOT _lto STREQUAL "thin" OR NOT _generator STREQUAL "Ninja" OR NOT _benchmarks OR NOT _optimize_deps)
+    message(FATAL_ERROR "unexpected presets: LTO '${_lto}', generator '${_generator}', optimized deps '${_optimize_deps}'")
+endif()
+string(JSON _label GET "${_presets}" workflowPresets 0 steps 2 name)
+if(NOT _label STREQUAL "benchmark")
+    message(FATAL_ERROR "benchmark workflow does not run the benchmark test preset")
+endif()
+
+# The benchmark test preset writes JSON and fails when it finds no tests
+string(JSON _test_count LENGTH "${_presets}" testPresets)
+math(EXPR _last "${_test_count} - 1")
+foreach(_i RANGE ${_last})
+    string(JSON _name GET "${_presets}" testPresets ${_i} name)
+    if(_name STREQUAL "benchmark")
+        string(JSON _out_format GET "${_presets}" testPresets ${_i} environment BENCHMARK_OUT_FORMAT)
+        string(JSON _no_tests GET "${_presets}" testPresets ${_i} execution noTestsAction)
+    endif()
+endforeach()
+if(NOT _out_format STREQUAL "json" OR NOT _no_tests STREQUAL "error")
+    message(FATAL_ERROR "benchmark test preset: output format '${_out_format}', noTestsAction '${_no_tests}'")
+endif()
+
+# ... and the project has a benchmark-labelled test behind the option
+file(READ "${_project}/CMakeLists.txt" _lists)
+if(NOT _lists MATCHES "if\\(NEUTRINO_PRESET_LIB_BUILD_BENCHMARKS\\)\n([^\n]*\n)*    add_subdirectory\\(benchmarks\\)")
+    message(FATAL_ERROR "benchmarks/ is not added with NEUTRINO_PRESET_LIB_BUILD_BENCHMARKS")
+endif()
+file(READ "${_project}/benchmarks/CMakeLists.txt" _bench)
+if(NOT _bench MATCHES "--benchmark_out=[^\n]*preset-lib_bench\\.json" OR NOT _bench MATCHES "LABELS benchmark")
+    message(FATAL_ERROR "unexpected benchmarks/CMakeLists.txt:\n${_bench}")
+endif()
+
+# Without --update an existing file is left alone
+execute_process(
+    COMMAND "${PYTHON}" "${NEUTRINO_NEW}" presets --directory "${_project}"
+    RESULT_VARIABLE _result
+    OUTPUT_VARIABLE _output
+)
+if(_result EQUAL 0 OR NOT _output MATCHES "Use --update")
+    message(FATAL_ERROR "presets overwrote an existing file: ${_output}")
+endif()
+
+# A stale generated preset is refreshed; a preset of the project's own and
+# every other file are kept
+string(JSON _presets SET "${_presets}" configurePresets 1 displayName "\"stale\"")
+string(JSON _presets SET "${_presets}" configurePresets ${_count}
+    [=[{"name": "ci", "inherits": "release", "cacheVariables": {"CI": "ON"}}]=])
+file(WRITE "${_project}/CMakePresets.json" "${_presets}")
+file(APPEND "${_project}/README.md" "Local notes\n")
+file(SHA256 "${_project}/README.md" _readme_before)
+file(SHA256 "${_project}/CMakeLists.txt" _lists_before)
+
+execute_process(
+    COMMAND "${PYTHON}" "${NEUTRINO_NEW}" presets --update --directory "${_project}"
+    RESULT_VARIABLE _result
+    OUTPUT_QUIET
+)
+if(NOT _result EQUAL 0)
+    message(FATAL_ERROR "presets --update failed: ${_result}")
+endif()
+
+file(READ "${_project}/CMakePresets.json" _updated)
+string(JSON _count_after LENGTH "${_updated}" configurePresets)
+string(JSON _display GET "${_updated}" configurePresets 1 displayName)
+math(EXPR _ci "${_count_after} - 1")
+string(JSON _ci_name GET "${_updated}" configurePresets ${_ci} name)
+if(NOT _ci EQUAL _count OR _display STREQUAL "stale" OR NOT _ci_name STREQUAL "ci")
+    message(FATAL_ERROR "presets --update did not merge: ${_updated}")
+endif()
+
+file(SHA256 "${_project}/README.md" _readme_after)
+file(SHA256 "${_project}/CMakeLists.txt" _lists_after)
+if(NOT _readme_before STREQUAL _readme_after OR NOT _lists_before STREQUAL _lists_after)
+    message(FATAL_ERROR "presets --update modified other files")
+endif()
+
+message(STATUS "presets test PASSED")
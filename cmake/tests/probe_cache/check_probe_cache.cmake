@@ -0,0 +1,65 @@
+# Configure the probe cache fixture twice and verify the second configure
+# reuses every cached probe, then verify NEUTRINO_RESET_PROBE_CACHE reruns them
+# and that changing the compile or link flags does too.
+#
+# Inputs: NEUTRINO_CMAKE_DIR, SOURCE_DIR, BINARY_DIR, GENERATOR
+cmake_minimum_required(VERSION 3.20)
+
+function(configure_fixture OUTPUT_VAR)
+    execute_process(
+        COMMAND ${CMAKE_COMMAND}
+            -S "${SOURCE_DIR}"
+            -B "${BINARY_DIR}"
+            -G "${GENERATOR}"
+            -DNEUTRINO_CMAKE_DIR=${NEUTRINO_CMAKE_DIR}
+            ${ARGN}
+        OUTPUT_VARIABLE _out
+        ERROR_VARIABLE _out
+        RESULT_VARIABLE _result
+    )
+    if(NOT _result EQUAL 0)
+        message(FATAL_ERROR "Configure failed:\n${_out}")
+    endif()
+    set(${OUTPUT_VAR} "${_out}" PARENT_SCOPE)
+endfunction()
+
+file(REMOVE_RECURSE "${BINARY_DIR}")
+
+configure_fixture(_first)
+if(NOT _first MATCHES "Compiler probes: [1-9][0-9]* run")
+    message(FATAL_ERROR "First configure did not run any probes:\n${_first}")
+endif()
+
+configure_fixture(_second)
+if(NOT _second MATCHES "Compiler probes: 0 run")
+    message(FATAL_ERROR "Reconfigure ran probes again:\n${_second}")
+endif()
+if(_second MATCHES "Performing Test|Detecting CXX")
+    message(FATAL_ERROR "Reconfigure performed a try_compile:\n${_second}")
+endif()
+
+configure_fixture(_reset -DNEUTRINO_RESET_PROBE_CACHE=ON)
+if(NOT _reset MATCHES "Compiler probes: [1-9][0-9]* run")
+    message(FATAL_ERROR "NEUTRINO_RESET_PROBE_CACHE did not rerun probes:\n${_reset}")
+endif()
+
+configure_fixture(_after_reset)
+if(NOT _after_reset MATCHES "Compiler probes: 0 run")
+    message(FATAL_ERROR "NEUTRINO_RESET_PROBE_CACHE did not switch itself off:\n${_after_reset}")
+endif()
+
+# Flag strings reach the linker probe as separate arguments, and changing
+# them (here: switching linkers) re-probes
+find_program(_gold ld.gold)
+if(_gold)
+    configure_fixture(_gold_out "-DCMAKE_CXX_FLAGS=-O2 -g" "-DCMAKE_EXE_LINKER_FLAGS=-Wl,-O1 -fuse-ld=gold")
+    if(NOT _gold_out MATCHES "Linker: gold")
+        message(FATAL_ERROR "-fuse-ld=gold not detected:\n${_gold_out}")
+    endif()
+    configure_fixture(_default_out "-DCMAKE_CXX_FLAGS=" "-DCMAKE_EXE_LINKER_FLAGS=")
+    if(NOT _default_out MATCHES "Compiler probes: [1-9][0-9]* run" OR _default_out MATCHES "Linker: gold")
+        message(FATAL_ERROR "Changing the linker flags did not re-probe:\n${_default_out}")
+    endif()
+endif()
+
+message(STATUS "probe cache test PASSED")
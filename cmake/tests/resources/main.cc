@@ -0,0 +1,33 @@
+#include <resources_demo_resources.hh>
+
+#include <cstdio>
+#include <cstring>
+
+int main() {
+    const auto greeting = demo::assets::greeting_txt();
+    const char* text = reinterpret_cast<const char*>(greeting.data());
+    if (greeting.size() != 17 || std::memcmp(text, "Hello, Neutrino!\n", 17) != 0 || text[17] != '\0') {
+        std::puts("greeting.txt mismatch");
+        return 1;
+    }
+
+    const auto ramp = demo::assets::get("palettes/ramp.pal");
+    if (ramp.size() != 256 || ramp.data() != demo::assets::palettes_ramp_pal().data()) {
+        std::puts("palettes/ramp.pal lookup mismatch");
+        return 1;
+    }
+    for (std::size_t i = 0; i < ramp.size(); ++i) {
+        if (static_cast<std::size_t>(ramp[i]) != i) {
+            std::puts("palettes/ramp.pal content mismatch");
+            return 1;
+        }
+    }
+
+    if (!demo::assets::get("missing.bin").empty()) {
+        std::puts("lookup of a missing asset returned data");
+        return 1;
+    }
+
+    std::puts("resources OK");
+    return 0;
+}
@@ -0,0 +1,30 @@
+# Checks that the size report of the fixture's app attributes bytes to its
+# static dependencies, its namespaces and its template instantiations.
+file(READ "${REPORT}" _report)
+
+string(JSON _attribution GET "${_report}" attribution)
+if(NOT _attribution STREQUAL "map")
+    message(FATAL_ERROR "expected map attribution, got ${_attribution}")
+endif()
+
+foreach(_key sizedep sizeutil)
+    string(JSON _size ERROR_VARIABLE _error GET "${_report}" dependencies ${_key})
+    if(_error OR NOT _size GREATER 0)
+        message(FATAL_ERROR "no bytes attributed to dependency ${_key}")
+    endif()
+endforeach()
+
+foreach(_key sizedep sizeutil)
+    string(JSON _size ERROR_VARIABLE _error GET "${_report}" namespaces ${_key})
+    if(_error OR NOT _size GREATER 0)
+        message(FATAL_ERROR "no bytes attributed to namespace ${_key}")
+    endif()
+endforeach()
+
+string(JSON _instances ERROR_VARIABLE _error GET "${_report}" templates "sizedep::Table<>::total" instances)
+if(_error OR _instances LESS 3)
+    message(FATAL_ERROR "expected 3 instantiations of sizedep::Table<>::total, got '${_instances}'")
+endif()
+
+string(JSON _image GET "${_report}" image_size)
+message("app: image ${_image} bytes, Table<>::total instantiated ${_instances} times")
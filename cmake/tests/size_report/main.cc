@@ -0,0 +1,11 @@
+#include <cstddef>
+#include <cstdio>
+
+namespace sizedep {
+std::size_t fill_tables(int n);
+}
+
+int main(int argc, char**) {
+    std::printf("%zu\n", sizedep::fill_tables(argc * 100));
+    return 0;
+}
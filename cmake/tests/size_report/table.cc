@@ -0,0 +1,53 @@
+#include <cstddef>
+#include <string>
+#include <vector>
+
+namespace sizeutil {
+std::size_t checksum(const char* data, std::size_t size);
+}
+
+namespace sizedep {
+
+template <typename T>
+class Table {
+public:
+    void add(const T& value) { rows_.push_back(value); }
+    std::size_t total() const {
+        std::size_t sum = 0;
+        for (const auto& row : rows_) {
+            sum += weight(row);
+        }
+        return sum;
+    }
+
+private:
+    static std::size_t weight(const std::string& s) { return sizeutil::checksum(s.data(), s.size()); }
+    template <typename U>
+    static std::size_t weight(const U& u) { return static_cast<std::size_t>(u); }
+
+    std::vector<T> rows_;
+};
+
+std::size_t fill_tables(int n) {
+    Table<int> ints;
+    Table<double> doubles;
+    Table<std::string> strings;
+    for (int i = 0; i < n; ++i) {
+        ints.add(i);
+        doubles.add(i * 0.5);
+        strings.add(std::to_string(i));
+    }
+#ifdef GROW
+    Table<long> longs;
+    Table<unsigned> unsigneds;
+    for (int i = 0; i < n; ++i) {
+        longs.add(i);
+        unsigneds.add(static_cast<unsigned>(i));
+    }
+    return ints.total() + doubles.total() + strings.total() + longs.total() + unsigneds.total();
+#else
+    return ints.total() + doubles.total() + strings.total();
+#endif
+}
+
+}  // namespace sizedep
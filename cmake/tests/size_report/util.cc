@@ -0,0 +1,13 @@
+#include <cstddef>
+
+namespace sizeutil {
+
+std::size_t checksum(const char* data, std::size_t size) {
+    std::size_t hash = 14695981039346656037ull;
+    for (std::size_t i = 0; i < size; ++i) {
+        hash = (hash ^ static_cast<unsigned char>(data[i])) * 1099511628211ull;
+    }
+    return hash;
+}
+
+}  // namespace sizeutil
@@ -0,0 +1,38 @@
+# Checks that the startup benchmarks wrote Google Benchmark JSON with one
+# entry per run and the usual aggregates.
+foreach(_target startup_exit startup_ready)
+    file(READ "${BINARY_DIR}/${_target}.startup.json" _results)
+
+    string(JSON _executable GET "${_results}" context executable)
+    if(NOT _executable MATCHES "${_target}$")
+        message(FATAL_ERROR "${_target}: unexpected context.executable '${_executable}'")
+    endif()
+    string(JSON _method GET "${_results}" context cold_method)
+
+    string(JSON _count LENGTH "${_results}" benchmarks)
+    math(EXPR _last "${_count} - 1")
+    set(_iterations 0)
+    set(_medians "")
+    foreach(_i RANGE ${_last})
+        string(JSON _name GET "${_results}" benchmarks ${_i} name)
+        string(JSON _run_type GET "${_results}" benchmarks ${_i} run_type)
+        string(JSON _unit GET "${_results}" benchmarks ${_i} time_unit)
+        string(JSON _real GET "${_results}" benchmarks ${_i} real_time)
+        if(NOT _unit STREQUAL "ms" OR NOT _real GREATER 0)
+            message(FATAL_ERROR "${_target}: bad entry ${_name}: ${_real} ${_unit}")
+        endif()
+        if(_name STREQUAL "startup/${_target}/warm" AND _run_type STREQUAL "iteration")
+            math(EXPR _iterations "${_iterations} + 1")
+        elseif(_name MATCHES "_median$")
+            list(APPEND _medians "${_name}=${_real}")
+        endif()
+    endforeach()
+
+    if(NOT _iterations EQUAL RUNS)
+        message(FATAL_ERROR "${_target}: expected ${RUNS} warm runs, found ${_iterations}")
+    endif()
+    if(NOT _medians MATCHES "startup/${_target}/warm_median")
+        message(FATAL_ERROR "${_target}: no warm median aggregate")
+    endif()
+    message("${_target} (cold: ${_method}): ${_medians}")
+endforeach()
@@ -0,0 +1,22 @@
+#include <chrono>
+#include <cstdio>
+#include <map>
+#include <string>
+#include <thread>
+
+int main() {
+    // Some start-up work before the program is usable
+    std::map<std::string, int> table;
+    for (int i = 0; i < 10000; ++i) {
+        table[std::to_string(i)] = i;
+    }
+    std::printf("loaded %zu entries\n", table.size());
+
+#ifdef SERVE
+    // A player or tool that keeps running once ready
+    std::printf("ready\n");
+    std::fflush(stdout);
+    std::this_thread::sleep_for(std::chrono::seconds(60));
+#endif
+    return 0;
+}
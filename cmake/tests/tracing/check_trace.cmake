@@ -0,0 +1,32 @@
+# Verifies the trace written by trace_demo (or its absence when disabled).
+cmake_minimum_required(VERSION 3.20)
+
+if(NOT EXPECT_TRACE)
+    if(EXISTS "${TRACE_FILE}")
+        message(FATAL_ERROR "Tracing disabled but ${TRACE_FILE} was written")
+    endif()
+    return()
+endif()
+
+if(NOT EXISTS "${TRACE_FILE}")
+    message(FATAL_ERROR "Trace file ${TRACE_FILE} not written")
+endif()
+
+file(READ "${TRACE_FILE}" _json)
+string(JSON _count LENGTH "${_json}" traceEvents)
+
+set(_seen "")
+math(EXPR _last "${_count} - 1")
+foreach(_i RANGE ${_last})
+    string(JSON _name GET "${_json}" traceEvents ${_i} name)
+    string(JSON _ph GET "${_json}" traceEvents ${_i} ph)
+    list(APPEND _seen "${_name}:${_ph}")
+endforeach()
+
+foreach(_expected "work:X" "frame:X" "acc:C" "frame:i")
+    if(NOT _expected IN_LIST _seen)
+        message(FATAL_ERROR "Trace is missing event ${_expected}")
+    endif()
+endforeach()
+
+message(STATUS "Trace OK: ${_count} events")
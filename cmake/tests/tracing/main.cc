@@ -0,0 +1,31 @@
+#include <neutrino/trace.hh>
+
+#include <thread>
+
+namespace {
+
+int work(int n) {
+    NEUTRINO_TRACE_ZONE("work");
+    int acc = 0;
+    for (int i = 0; i < n; ++i) {
+        acc += i % 7;
+    }
+    NEUTRINO_TRACE_COUNTER("acc", acc);
+    return acc;
+}
+
+}  // namespace
+
+int main() {
+    int total = 0;
+    for (int frame = 0; frame < 3; ++frame) {
+        NEUTRINO_TRACE_ZONE("frame");
+        total += work(1000);
+        NEUTRINO_TRACE_FRAME_MARK();
+    }
+
+    std::thread worker([] { work(500); });
+    worker.join();
+
+    return total > 0 ? 0 : 1;
+}
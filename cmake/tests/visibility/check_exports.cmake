@@ -0,0 +1,22 @@
+# Checks the dynamic symbol table of the visibility fixture library.
+cmake_minimum_required(VERSION 3.20)
+
+execute_process(
+    COMMAND "${NM}" -D --defined-only -C "${LIBRARY}"
+    OUTPUT_VARIABLE _symbols
+    COMMAND_ERROR_IS_FATAL ANY
+)
+
+if(NOT _symbols MATCHES "vis::public_api")
+    message(FATAL_ERROR "vis::public_api is not exported:\n${_symbols}")
+endif()
+if(_symbols MATCHES "internal_helper")
+    message(FATAL_ERROR "vis::detail::internal_helper is exported:\n${_symbols}")
+endif()
+if(DEP_EXPORTED AND NOT _symbols MATCHES "vis_dep_function")
+    message(FATAL_ERROR "vis_dep_function should keep default visibility:\n${_symbols}")
+endif()
+if(NOT DEP_EXPORTED AND _symbols MATCHES "vis_dep_function")
+    message(FATAL_ERROR "vis_dep_function is exported despite the version script:\n${_symbols}")
+endif()
+message(STATUS "exports ok")
@@ -0,0 +1,3 @@
+extern "C" int vis_dep_function(int x) {
+    return x * 3;
+}
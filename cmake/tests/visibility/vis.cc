@@ -0,0 +1,17 @@
+#include "vis_export.h"
+
+extern "C" int vis_dep_function(int x);
+
+namespace vis {
+
+namespace detail {
+int internal_helper(int x) {
+    return vis_dep_function(x) + 1;
+}
+}  // namespace detail
+
+VIS_EXPORT int public_api(int x) {
+    return detail::internal_helper(x);
+}
+
+}  // namespace vis
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+neutrino-configure-bench - Measure the configure time neutrino-cmake adds
+
+Configures fixture projects with --profiling-format=google-trace and
+attributes the time to each Neutrino module (include(Neutrino*)) and each
+dependency recipe (neutrino_fetch_*()). Dependencies are cloned from local
+bare-git mirrors, so timings do not depend on the network.
+
+Fixtures:
+    empty        A project that only includes NeutrinoInit
+    header-only  neutrino-new --type=header-only
+    compiled     neutrino-new --type=compiled --deps=<recipes>
+                 (skipped unless every recipe has a mirror)
+
+Usage:
+    neutrino-configure-bench mirror --mirror-dir <dir> [--all] [recipes...]
+    neutrino-configure-bench run --output <results.json> [--mirror-dir <dir>]
+                                 [--repeat N] [--baseline <baseline.json>]
+    neutrino-configure-bench compare <baseline.json> <results.json>
+
+Examples:
+    neutrino-configure-bench mirror --mirror-dir ~/.cache/neutrino-mirrors
+    neutrino-configure-bench run --mirror-dir ~/.cache/neutrino-mirrors \\
+        --output configure-bench.json --baseline benchmarks/configure/baseline.json
+
+To refresh the committed baseline, run without --baseline and write the
+results to benchmarks/configure/baseline.json. compare (and run with
+--baseline) exits with status 1 when a timing exceeds its baseline by more
+than the threshold. Timings are only comparable on the same machine, so a
+baseline recorded with another CMake version, host or generator is
+reported against but never fails the run.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+CMAKE_DIR = ROOT_DIR / "cmake"
+DEPS_DIR = CMAKE_DIR / "deps"
+EMPTY_FIXTURE = ROOT_DIR / "benchmarks" / "configure" / "empty"
+NEUTRINO_NEW = Path(__file__).resolve().parent / "neutrino-new.py"
+
+FIXTURES = ["empty", "header-only", "compiled"]
+
+# Ecosystem recipes that neutrino-new links as neutrino::<name>
+DEFAULT_DEPS = ["failsafe", "euler", "mio", "libiff", "scaler"]
+
+GIT_REPOSITORY = re.compile(r"GIT_REPOSITORY\s+(\S+)")
+MODULE_ARG = re.compile(r"(?:^|[/}])(Neutrino[A-Za-z]+)(?:\.cmake)?$")
+FETCH_CALL = re.compile(r"^neutrino_fetch_(\w+)$")
+
+
+# =============================================================================
+# Mirrors
+# =============================================================================
+
+def recipe_repository(recipe: str):
+    """Return the GIT_REPOSITORY of a recipe, or None for URL downloads."""
+    path = DEPS_DIR / f"{recipe}.cmake"
+    if not path.exists():
+        raise SystemExit(f"neutrino-configure-bench: unknown recipe '{recipe}'")
+    match = GIT_REPOSITORY.search(path.read_text())
+    return match.group(1) if match else None
+
+
+def mirror_path(mirror_dir: Path, url: str) -> Path:
+    """Map https://host/owner/repo.git to <mirror_dir>/host/owner/repo.git."""
+    path = re.sub(r"^[a-z]+://", "", url)
+    if not path.endswith(".git"):
+        path += ".git"
+    return mirror_dir / path
+
+
+def git_environment(mirror_dir: Path) -> dict:
+    """Environment that redirects GitHub clones to the local mirrors."""
+    env = dict(os.environ)
+    env["GIT_CONFIG_COUNT"] = "1"
+    env["GIT_CONFIG_KEY_0"] = f"url.{(mirror_dir / 'github.com').as_uri()}/.insteadOf"
+    env["GIT_CONFIG_VALUE_0"] = "https://github.com/"
+    return env
+
+
+def mirror(args) -> int:
+    """Create or update bare mirrors of the recipes' repositories."""
+    mirror_dir = Path(args.mirror_dir).resolve()
+    recipes = args.recipes or DEFAULT_DEPS
+    if args.all:
+        recipes = sorted(path.stem for path in DEPS_DIR.glob("*.cmake"))
+
+    failed = 0
+    for recipe in recipes:
+        url = recipe_repository(recipe)
+        if url is None:
+            print(f"  {recipe}: URL download, not mirrored")
+            continue
+        target = mirror_path(mirror_dir, url)
+        if target.exists():
+            command = ["git", "-C", str(target), "remote", "update", "--prune"]
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            command = ["git", "clone", "--mirror", "--quiet", url, str(target)]
+        print(f"  {recipe}: {target}")
+        if subprocess.run(command).returncode != 0:
+            failed += 1
+    return 1 if failed else 0
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+def trace_durations(path: Path):
+    """Sum inclusive durations (ms) of module includes and recipe calls."""
+    with open(path) as handle:
+        events = json.load(handle)
+
+    modules = {}
+    recipes = {}
+    stack = []
+    for event in events:
+        if event["ph"] == "B":
+            stack.append(event)
+            continue
+        if event["ph"] != "E" or not stack:
+            continue
+        begin = stack.pop()
+        elapsed = (event["ts"] - begin["ts"]) / 1000.0
+        name = begin["name"].lower()
+        if name == "include":
+            match = MODULE_ARG.search(begin["args"].get("functionArgs", "").split()[0])
+            if match:
+                modules[match.group(1)] = modules.get(match.group(1), 0.0) + elapsed
+        else:
+            match = FETCH_CALL.match(name)
+            if match:
+                recipes[match.group(1)] = recipes.get(match.group(1), 0.0) + elapsed
+    return modules, recipes
+
+
+def configure(args, source: Path, build: Path, options: list, env: dict, trace: Path = None) -> float:
+    """Run one configure and return its wall time in milliseconds."""
+    command = [args.cmake, "-S", str(source), "-B", str(build), f"-DNEUTRINO_CMAKE_DIR={CMAKE_DIR}"]
+    if args.generator:
+        command += ["-G", args.generator]
+    command += options
+    if trace:
+        command += ["--profiling-format=google-trace", f"--profiling-output={trace}"]
+
+    start = time.perf_counter()
+    result = subprocess.run(command, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    elapsed = (time.perf_counter() - start) * 1000.0
+    if result.returncode != 0:
+        raise RuntimeError(f"configuring {source.name} failed:\n{result.stdout}")
+    return elapsed
+
+
+def prepare_fixture(args, name: str, work_dir: Path):
+    """Return (source dir, cache options) for a fixture, or a skip reason."""
+    if name == "empty":
+        return EMPTY_FIXTURE, []
+
+    project = "bench_header" if name == "header-only" else "bench_compiled"
+    command = [
+        sys.executable, str(NEUTRINO_NEW), project,
+        "--output", str(work_dir), "--no-tests", "--no-examples", "--force",
+    ]
+    if name == "header-only":
+        command += ["--type=header-only"]
+    else:
+        if not args.mirror_dir:
+            return "no --mirror-dir given"
+        mirror_dir = Path(args.mirror_dir).resolve()
+        missing = [
+            recipe for recipe in args.deps
+            if recipe_repository(recipe) and not mirror_path(mirror_dir, recipe_repository(recipe)).exists()
+        ]
+        if missing:
+            return f"no mirror for {', '.join(missing)}"
+        command += ["--type=compiled", f"--deps={','.join(args.deps)}"]
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+    upper = project.upper()
+    return work_dir / project, [
+        f"-DNEUTRINO_{upper}_BUILD_TESTS=OFF",
+        f"-DNEUTRINO_{upper}_BUILD_EXAMPLES=OFF",
+    ]
+
+
+def measure(args, name: str, work_dir: Path) -> dict:
+    """Configure a fixture --repeat times from scratch, then once more warm."""
+    prepared = prepare_fixture(args, name, work_dir)
+    if isinstance(prepared, str):
+        print(f"  {name}: SKIPPED ({prepared})")
+        return {"skipped": prepared}
+    source, options = prepared
+
+    env = git_environment(Path(args.mirror_dir).resolve()) if args.mirror_dir else dict(os.environ)
+    build = work_dir / f"build-{name}"
+    trace = work_dir / f"trace-{name}.json"
+
+    configure_ms, reconfigure_ms = [], []
+    modules, recipes = {}, {}
+    for _ in range(args.repeat):
+        shutil.rmtree(build, ignore_errors=True)
+        configure_ms.append(configure(args, source, build, options, env, trace))
+        reconfigure_ms.append(configure(args, source, build, options, env))
+        run_modules, run_recipes = trace_durations(trace)
+        for key, value in run_modules.items():
+            modules.setdefault(key, []).append(value)
+        for key, value in run_recipes.items():
+            recipes.setdefault(key, []).append(value)
+
+    # Medians: one slow run (disk cache, scheduler) should not move the result
+    result = {
+        "configure_ms": round(statistics.median(configure_ms), 1),
+        "reconfigure_ms": round(statistics.median(reconfigure_ms), 1),
+        "runs_ms": [round(value, 1) for value in configure_ms],
+        "modules": {key: round(statistics.median(values), 1) for key, values in sorted(modules.items())},
+        "recipes": {key: round(statistics.median(values), 1) for key, values in sorted(recipes.items())},
+    }
+    print(f"  {name}: configure {result['configure_ms']} ms, reconfigure {result['reconfigure_ms']} ms")
+    return result
+
+
+def cmake_version(cmake: str) -> str:
+    output = subprocess.run([cmake, "--version"], stdout=subprocess.PIPE, text=True).stdout
+    return output.split("\n")[0].replace("cmake version ", "")
+
+
+def host_description() -> str:
+    """The machine the timings were taken on."""
+    cpu = platform.processor()
+    try:
+        with open("/proc/cpuinfo") as handle:
+            match = re.search(r"^model name\s*:\s*(.+)$", handle.read(), re.MULTILINE)
+            cpu = match.group(1).strip() if match else cpu
+    except OSError:
+        pass
+    return f"{platform.system()} {platform.machine()}, {cpu or 'unknown CPU'}, {os.cpu_count()} CPUs"
+
+
+def run(args) -> int:
+    """Measure every fixture and write the results."""
+    work_dir = Path(args.work_dir).resolve()
+    work_dir.mkdir(parents=True, exist_ok=True)
+    args.deps = [d.strip() for d in args.deps.split(",") if d.strip()]
+
+    results = {
+        "cmake": cmake_version(args.cmake),
+        "generator": args.generator or "default",
+        "host": host_description(),
+        "repeat": args.repeat,
+        "deps": args.deps,
+        "fixtures": {},
+    }
+    print(f"neutrino-configure-bench: {args.repeat} run(s) per fixture")
+    for name in args.fixtures.split(","):
+        if name not in FIXTURES:
+            raise SystemExit(f"neutrino-configure-bench: unknown fixture '{name}'")
+        try:
+            results["fixtures"][name] = measure(args, name, work_dir)
+        except RuntimeError as error:
+            print(f"neutrino-configure-bench: {error}", file=sys.stderr)
+            return 1
+
+    Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    print(f"neutrino-configure-bench: wrote {args.output}")
+
+    if args.baseline:
+        return check(load(args.baseline), results, args.threshold, args.slack_ms)
+    return 0
+
+
+# =============================================================================
+# Baseline Comparison
+# =============================================================================
+
+def load(path: str) -> dict:
+    """Load results written by run."""
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def metrics(results: dict) -> dict:
+    """Flatten results into {"fixture/metric": ms}."""
+    flat = {}
+    for fixture, data in results["fixtures"].items():
+        if "skipped" in data:
+            continue
+        flat[f"{fixture}/configure"] = data["configure_ms"]
+        flat[f"{fixture}/reconfigure"] = data["reconfigure_ms"]
+        for module, value in data["modules"].items():
+            flat[f"{fixture}/module/{module}"] = value
+        for recipe, value in data["recipes"].items():
+            flat[f"{fixture}/recipe/{recipe}"] = value
+    return flat
+
+
+ENVIRONMENT = ["cmake", "host", "generator"]
+
+
+def check(baseline: dict, results: dict, threshold: float, slack_ms: float) -> int:
+    """Print timings above baseline * (1 + threshold) + slack; 1 if any.
+
+    Regressions only fail the check when the baseline was recorded with the
+    same CMake version, host and generator.
+    """
+    before = metrics(baseline)
+    after = metrics(results)
+
+    different = [
+        f"{key} '{baseline.get(key, 'unknown')}' vs '{results.get(key, 'unknown')}'"
+        for key in ENVIRONMENT
+        if key not in baseline or baseline.get(key) != results.get(key)
+    ]
+    if different:
+        print("Baseline recorded in another environment, reporting only:")
+        for entry in different:
+            print(f"  {entry}")
+
+    regressions = []
+    for key, base in sorted(before.items()):
+        if key not in after:
+            continue
+        limit = base * (1.0 + threshold) + slack_ms
+        if after[key] > limit:
+            regressions.append((key, base, after[key], limit))
+
+    not_measured = sorted(key for key in before if key not in after)
+    if not_measured:
+        print(f"Not measured in this run: {len(not_measured)} baseline entries")
+    if regressions:
+        print(f"Configure time regressions (threshold {threshold:.0%} + {slack_ms:g} ms):")
+        for key, base, value, limit in regressions:
+            print(f"  {key}: {base:.1f} ms -> {value:.1f} ms (limit {limit:.1f} ms)")
+        return 0 if different else 1
+    print(f"No configure time regressions against the baseline ({len(before) - len(not_measured)} checked).")
+    return 0
+
+
+def compare(args) -> int:
+    """Compare results against a baseline."""
+    return check(load(args.baseline), load(args.results), args.threshold, args.slack_ms)
+
+
+def add_threshold_arguments(parser):
+    parser.add_argument(
+        "--threshold", type=float, default=0.5,
+        help="Allowed relative slowdown over the baseline (default: 0.5)"
+    )
+    parser.add_argument(
+        "--slack-ms", type=float, default=100.0,
+        help="Allowed absolute slowdown in ms, for short timings (default: 100)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure neutrino-cmake's configure overhead",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    mirror_parser = commands.add_parser("mirror", help="Create or update local bare-git mirrors")
+    mirror_parser.add_argument("--mirror-dir", required=True, help="Directory holding the mirrors")
+    mirror_parser.add_argument("--all", action="store_true", help="Mirror every git recipe")
+    mirror_parser.add_argument("recipes", nargs="*", help=f"Recipes (default: {','.join(DEFAULT_DEPS)})")
+    mirror_parser.set_defaults(func=mirror)
+
+    run_parser = commands.add_parser("run", help="Configure the fixtures and record timings")
+    run_parser.add_argument("--output", required=True, help="Results JSON to write")
+    run_parser.add_argument("--mirror-dir", help="Local mirrors (required for the compiled fixture)")
+    run_parser.add_argument("--work-dir", default="configure-bench", help="Scratch directory")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Runs per fixture (default: 5)")
+    run_parser.add_argument("--fixtures", default=",".join(FIXTURES), help="Fixtures to run")
+    run_parser.add_argument("--deps", default=",".join(DEFAULT_DEPS), help="Recipes of the compiled fixture")
+    run_parser.add_argument("--cmake", default="cmake", help="CMake executable")
+    run_parser.add_argument("--generator", help="CMake generator")
+    run_parser.add_argument("--baseline", help="Baseline JSON to check against")
+    add_threshold_arguments(run_parser)
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="Check results against a baseline")
+    compare_parser.add_argument("baseline", help="Baseline JSON")
+    compare_parser.add_argument("results", help="Results JSON")
+    add_threshold_arguments(compare_parser)
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+neutrino-header-cost - Measure what including each public header costs
+
+Used by neutrino_add_header_cost_check(), which compiles one translation
+unit per public header. The measure command runs as the compiler launcher
+of those translation units: it compiles the unit, recording the compiler's
+CPU time, then preprocesses it to count the lines and files the header pulls
+in. The check command collects the results, writes a report and fails when
+a header exceeds its budget or regresses against a baseline.
+
+Usage:
+    neutrino-header-cost measure --results-dir <dir> -- <compiler command>
+    neutrino-header-cost check --results-dir <dir> --output <report.json>
+                               [--budget-ms N] [--budget-lines N]
+                               [--baseline <baseline.json>] [--threshold F]
+    neutrino-header-cost summary <report.json>
+
+Examples:
+    neutrino-header-cost check --results-dir build/mylib_header_cost \\
+        --output build/mylib.header-cost.json --budget-lines 20000 \\
+        --baseline mylib.header-cost.json
+
+A report can be committed as the baseline of later runs. Preprocessed lines
+are counted without blank lines and line markers; time is the compiler's
+CPU time, which is less sensitive to parallel builds than wall time.
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+INCLUDE = re.compile(r'^#include [<"]([^>"]+)[>"]', re.MULTILINE)
+LINE_MARKER = re.compile(r'^#(?:line)? ?[0-9]+ "((?:[^"\\]|\\.)*)"')
+
+# Dependency file options that make no sense when preprocessing to stdout
+DEPFILE_FLAGS = {"-MD", "-MMD"}
+DEPFILE_FLAGS_WITH_VALUE = {"-MF", "-MT", "-MQ"}
+
+HEAVIEST = 5
+
+
+# =============================================================================
+# Measure
+# =============================================================================
+
+def option_value(command: list, option: str):
+    """Value of an option given as '<option> <value>' or '<option><value>'."""
+    for index, arg in enumerate(command):
+        if arg == option and index + 1 < len(command):
+            return command[index + 1]
+        if arg.startswith(option) and len(arg) > len(option):
+            return arg[len(option):]
+    return None
+
+
+def preprocess_command(command: list) -> list:
+    """Turn a compile command into one that preprocesses to stdout."""
+    result = []
+    skip = False
+    for arg in command:
+        if skip:
+            skip = False
+            continue
+        if arg in DEPFILE_FLAGS:
+            continue
+        if arg in DEPFILE_FLAGS_WITH_VALUE or arg == "-o":
+            skip = True
+            continue
+        if any(arg.startswith(flag) and len(arg) > 3 for flag in DEPFILE_FLAGS_WITH_VALUE):
+            continue
+        result.append("-E" if arg == "-c" else arg)
+    return result
+
+
+def count_lines(output: str) -> dict:
+    """Preprocessed lines, files included, and the files contributing most."""
+    per_file = {}
+    current = None
+    for line in output.splitlines():
+        marker = LINE_MARKER.match(line)
+        if marker:
+            current = marker.group(1)
+            continue
+        if line.strip() and current is not None:
+            per_file[current] = per_file.get(current, 0) + 1
+
+    files = [name for name in per_file if not name.startswith("<")]
+    heaviest = sorted(files, key=lambda name: per_file[name], reverse=True)[:HEAVIEST]
+    return {
+        "lines": sum(per_file.values()),
+        "files": len(files),
+        "heaviest": [{"file": name, "lines": per_file[name]} for name in heaviest],
+    }
+
+
+def measure(args) -> int:
+    """Compile (timed), then preprocess one translation unit."""
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    if not command:
+        print("neutrino-header-cost: no compiler command given", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    process = subprocess.Popen(command)
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        # The header is not self-contained (or does not compile at all)
+        return process.returncode
+
+    source = Path(option_value(command, "-c") or "")
+    if not source.is_file():
+        print(f"neutrino-header-cost: no source file in: {' '.join(command)}", file=sys.stderr)
+        return 2
+    match = INCLUDE.search(source.read_text())
+    header = match.group(1) if match else source.name
+
+    result = subprocess.run(preprocess_command(command), capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        return result.returncode
+
+    record = {
+        "header": header,
+        "source": str(source),
+        "cpu_ms": round((usage.ru_utime + usage.ru_stime) * 1000.0, 1),
+        "real_ms": round(elapsed * 1000.0, 1),
+        **count_lines(result.stdout),
+    }
+    output = Path(args.results_dir) / f"{source.stem}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(record, indent=2) + "\n")
+    return 0
+
+
+# =============================================================================
+# Check
+# =============================================================================
+
+def collect(results_dir: Path) -> dict:
+    """Results of every generated translation unit, keyed by header."""
+    headers = {}
+    missing = []
+    for source in sorted(results_dir.glob("*.cc")):
+        result = results_dir / f"{source.stem}.json"
+        if not result.is_file():
+            missing.append(source.name)
+            continue
+        record = json.loads(result.read_text())
+        headers[record.pop("header")] = {
+            key: value for key, value in record.items() if key != "source"
+        }
+    if missing:
+        raise RuntimeError(f"not measured (build the target first): {', '.join(missing)}")
+    return headers
+
+
+def regressions(baseline: dict, headers: dict, threshold: float, slack_ms: float) -> list:
+    """Headers whose lines or time grew beyond the threshold."""
+    found = []
+    for header, before in sorted(baseline.get("headers", {}).items()):
+        after = headers.get(header)
+        if after is None:
+            continue
+        limit = before["lines"] * (1.0 + threshold)
+        if after["lines"] > limit:
+            found.append(f"{header}: {before['lines']} -> {after['lines']} lines (limit {limit:.0f})")
+        limit = before["cpu_ms"] * (1.0 + threshold) + slack_ms
+        if after["cpu_ms"] > limit:
+            found.append(f"{header}: {before['cpu_ms']:.0f} -> {after['cpu_ms']:.0f} ms (limit {limit:.0f} ms)")
+    return found
+
+
+def print_summary(report: dict):
+    print(f"Header cost of {report['target']} ({len(report['headers'])} headers):")
+    print(f"  {'lines':>8} {'files':>6} {'cpu ms':>8}  header")
+    for header, data in sorted(report["headers"].items(), key=lambda item: -item[1]["lines"]):
+        print(f"  {data['lines']:>8} {data['files']:>6} {data['cpu_ms']:>8.0f}  {header}")
+        top = data["heaviest"][0] if data["heaviest"] else None
+        if top and not top["file"].endswith(header):
+            print(f"  {'':>24}  heaviest: {top['file']} ({top['lines']} lines)")
+
+
+def check(args) -> int:
+    """Write the report; 1 if a header is over budget or regressed."""
+    try:
+        headers = collect(Path(args.results_dir))
+    except RuntimeError as error:
+        print(f"neutrino-header-cost: {error}", file=sys.stderr)
+        return 1
+
+    report = {
+        "target": args.target or Path(args.results_dir).name,
+        "budget": {"cpu_ms": args.budget_ms, "lines": args.budget_lines},
+        "headers": headers,
+    }
+
+    failures = []
+    for header, data in sorted(headers.items()):
+        if args.budget_lines is not None and data["lines"] > args.budget_lines:
+            failures.append(f"{header}: {data['lines']} lines over budget of {args.budget_lines}")
+        if args.budget_ms is not None and data["cpu_ms"] > args.budget_ms:
+            failures.append(f"{header}: {data['cpu_ms']:.0f} ms over budget of {args.budget_ms:g} ms")
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+        failures += [
+            f"{entry} regressed (threshold {args.threshold:.0%})"
+            for entry in regressions(baseline, headers, args.threshold, args.slack_ms)
+        ]
+
+    report["passed"] = not failures
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+
+    print_summary(report)
+    if failures:
+        print("Header cost check failed:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    return 0
+
+
+def summary(args) -> int:
+    """Print a report."""
+    with open(args.report) as handle:
+        print_summary(json.load(handle))
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the include cost of public headers",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command_name", required=True)
+
+    measure_parser = commands.add_parser("measure", help="Compiler launcher: compile and measure one unit")
+    measure_parser.add_argument("--results-dir", required=True, help="Directory for per-header results")
+    measure_parser.add_argument("command", nargs=argparse.REMAINDER, help="-- <compiler command>")
+    measure_parser.set_defaults(func=measure)
+
+    check_parser = commands.add_parser("check", help="Write the report and check budgets")
+    check_parser.add_argument("--results-dir", required=True, help="Directory with per-header results")
+    check_parser.add_argument("--output", required=True, help="Report JSON to write")
+    check_parser.add_argument("--target", help="Target name for the report")
+    check_parser.add_argument("--budget-ms", type=float, help="Compile time budget per header (CPU ms)")
+    check_parser.add_argument("--budget-lines", type=int, help="Preprocessed line budget per header")
+    check_parser.add_argument("--baseline", help="Earlier report to check against")
+    check_parser.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="Allowed relative growth over the baseline (default: 0.1)"
+    )
+    check_parser.add_argument(
+        "--slack-ms", type=float, default=50.0,
+        help="Allowed absolute slowdown in ms, for short timings (default: 50)"
+    )
+    check_parser.set_defaults(func=check)
+
+    summary_parser = commands.add_parser("summary", help="Print a report")
+    summary_parser.add_argument("report", help="Report JSON")
+    summary_parser.set_defaults(func=summary)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,15 +4,25 @@ neutrino-new - Generate a new neutrino ecosystem project skeleton
 
 Usage:
     neutrino-new <project_name> [options]
+    neutrino-new presets [--update] [--directory <dir>]
 
 Examples:
     neutrino-new mylib --type=header-only --std=17
     neutrino-new myapp --type=executable --std=20
     neutrino-new mylib --type=compiled --with-tests --with-examples
+    neutrino-new mylib --type=compiled --std=20 --modules
+    neutrino-new presets --update --directory ../mylib
+
+Generated projects include a CMakePresets.json. The presets command writes
+it for an existing project, and with --update refreshes the presets
+neutrino-new owns while keeping any others in the file. No other file is
+touched.
 """
 
 import argparse
+import json
 import os
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -28,7 +38,7 @@ TEMPLATES = {}
 # -----------------------------------------------------------------------------
 
 TEMPLATES["CMakeLists.txt.header_only"] = '''\
-cmake_minimum_required(VERSION 3.20)
+cmake_minimum_required(VERSION {cmake_minimum})
 
 project({project_name}
     VERSION 0.1.0
@@ -91,6 +101,18 @@ if(NEUTRINO_{project_name_upper}_BUILD_EXAMPLES)
     add_subdirectory(examples)
 endif()
 
+# ============================================================================
+# Benchmarks
+# ============================================================================
+
+if(NEUTRINO_{project_name_upper}_BUILD_BENCHMARKS)
+    include(${{NEUTRINO_CMAKE_DIR}}/deps/benchmark.cmake)
+    neutrino_fetch_benchmark()
+
+    enable_testing()
+    add_subdirectory(benchmarks)
+endif()
+
 # ============================================================================
 # Installation
 # ============================================================================
@@ -129,10 +151,13 @@ target_include_directories({project_name} INTERFACE
     $<BUILD_INTERFACE:${{PROJECT_SOURCE_DIR}}/include>
     $<INSTALL_INTERFACE:${{CMAKE_INSTALL_INCLUDEDIR}}>
 )
-{link_libraries}'''
+{link_libraries}
+# Instrumentation: NEUTRINO_TRACE_* macros (no-ops unless NEUTRINO_ENABLE_TRACING=ON)
+neutrino_target_tracing({project_name})
+'''
 
 TEMPLATES["CMakeLists.txt.compiled"] = '''\
-cmake_minimum_required(VERSION 3.20)
+cmake_minimum_required(VERSION {cmake_minimum})
 
 project({project_name}
     VERSION 0.1.0
@@ -196,6 +221,18 @@ if(NEUTRINO_{project_name_upper}_BUILD_EXAMPLES)
     add_subdirectory(examples)
 endif()
 
+# ============================================================================
+# Benchmarks
+# ============================================================================
+
+if(NEUTRINO_{project_name_upper}_BUILD_BENCHMARKS)
+    include(${{NEUTRINO_CMAKE_DIR}}/deps/benchmark.cmake)
+    neutrino_fetch_benchmark()
+
+    enable_testing()
+    add_subdirectory(benchmarks)
+endif()
+
 # ============================================================================
 # Installation
 # ============================================================================
@@ -250,16 +287,21 @@ generate_export_header({project_name}
     EXPORT_FILE_NAME ${{PROJECT_BINARY_DIR}}/include/{project_name}/{project_name}_export.h
 )
 
+{modules}# Export only symbols marked with the export header macros
+neutrino_target_visibility({project_name})
+neutrino_target_link_profile({project_name})
+
 # ============================================================================
 # Compiler Warnings
 # ============================================================================
 
 neutrino_target_warnings({project_name})
 neutrino_target_sanitizers({project_name})
+neutrino_target_tracing({project_name})
 '''
 
 TEMPLATES["CMakeLists.txt.executable"] = '''\
-cmake_minimum_required(VERSION 3.20)
+cmake_minimum_required(VERSION {cmake_minimum})
 
 project({project_name}
     VERSION 0.1.0
@@ -306,6 +348,22 @@ target_compile_features({project_name} PRIVATE cxx_std_{std})
 
 neutrino_target_warnings({project_name})
 neutrino_target_sanitizers({project_name})
+neutrino_target_tracing({project_name})
+neutrino_target_allocator({project_name})
+neutrino_target_link_profile({project_name})
+neutrino_add_loader_stats({project_name})
+
+# ============================================================================
+# Benchmarks
+# ============================================================================
+
+option(NEUTRINO_{project_name_upper}_BUILD_BENCHMARKS "Build benchmarks" OFF)
+
+if(NEUTRINO_{project_name_upper}_BUILD_BENCHMARKS)
+    enable_testing()
+    # Cold and warm launch time, written to {project_name}.startup.json
+    neutrino_add_startup_benchmark({project_name})
+endif()
 
 # ============================================================================
 # Installation
@@ -326,7 +384,8 @@ TEMPLATES["header.hpp"] = '''\
 #ifndef {guard}
 #define {guard}
 
-{export_include}
+{export_include}#include <neutrino/trace.hh>
+
 namespace {namespace} {{
 
 // Your code here
@@ -346,10 +405,30 @@ namespace {namespace} {{
 }} // namespace {namespace}
 '''
 
+TEMPLATES["module.cppm"] = '''\
+// Module interface unit: consumers write `import {module_name};`
+module;
+
+#include <{project_name}/{project_name}_export.h>
+
+export module {module_name};
+
+export namespace {namespace} {{
+
+// Exported declarations; mark functions defined in .cc files with
+// {export_macro} so shared builds export them, e.g.:
+//     {export_macro} int answer();
+
+}} // namespace {namespace}
+'''
+
 TEMPLATES["main.cpp"] = '''\
+#include <neutrino/trace.hh>
+
 #include <iostream>
 
-int main(int argc, char* argv[]) {{
+int main() {{
+    NEUTRINO_TRACE_ZONE("main");
     std::cout << "{project_name} v0.1.0" << std::endl;
     return 0;
 }}
@@ -372,9 +451,11 @@ target_link_libraries({project_name}_tests PRIVATE
 
 neutrino_target_warnings({project_name}_tests)
 neutrino_target_sanitizers({project_name}_tests)
+neutrino_target_allocator({project_name}_tests)
 
 include(CTest)
-add_test(NAME {project_name}_tests COMMAND {project_name}_tests)
+# One ctest per TEST_CASE, so `ctest -j` runs them in parallel
+neutrino_add_doctest({project_name}_tests LABELS unit)
 '''
 
 TEMPLATES["test/test_main.cpp"] = '''\
@@ -417,6 +498,47 @@ int main() {{
 }}
 '''
 
+# -----------------------------------------------------------------------------
+# Benchmark Templates
+# -----------------------------------------------------------------------------
+
+TEMPLATES["benchmarks/CMakeLists.txt"] = '''\
+add_executable({project_name}_bench
+    bench_{project_name}.cc
+)
+
+target_link_libraries({project_name}_bench PRIVATE
+    {target_link}
+    benchmark::benchmark
+)
+
+neutrino_target_warnings({project_name}_bench)
+neutrino_target_allocator({project_name}_bench)
+
+# Run by the benchmark test preset; results go to {project_name}_bench.json
+add_test(NAME {project_name}_bench
+    COMMAND {project_name}_bench
+        --benchmark_out=${{CMAKE_CURRENT_BINARY_DIR}}/{project_name}_bench.json
+        --benchmark_out_format=json
+)
+set_tests_properties({project_name}_bench PROPERTIES LABELS benchmark)
+'''
+
+TEMPLATES["benchmarks/bench_project.cpp"] = '''\
+#include <benchmark/benchmark.h>
+#include <{project_name}/{project_name}.{ext}>
+
+static void bm_{namespace}_baseline(benchmark::State& state) {{
+    for (auto _ : state) {{
+        int value = 0;
+        benchmark::DoNotOptimize(value);
+    }}
+}}
+BENCHMARK(bm_{namespace}_baseline);
+
+BENCHMARK_MAIN();
+'''
+
 # -----------------------------------------------------------------------------
 # Config Templates
 # -----------------------------------------------------------------------------
@@ -530,28 +652,55 @@ TEMPLATES["README.md"] = '''\
 
 ## Requirements
 
-- CMake 3.20+
-- C++{std} compiler
+- CMake {cmake_minimum}+
+- C++{std} compiler{requirements_extra}
 
 ## Building
 
 ```bash
-cmake -B build
+cmake -B build{configure_args}
 cmake --build build
 ```
 
 ## Testing
 
 ```bash
-cmake -B build -DNEUTRINO_{project_name_upper}_BUILD_TESTS=ON
+cmake -B build{configure_args} -DNEUTRINO_{project_name_upper}_BUILD_TESTS=ON
 cmake --build build
 ctest --test-dir build
 ```
 
+## Presets
+
+`CMakePresets.json` (CMake 3.25+) has configure, build and test presets
+that build into `build/<preset>`:
+
+| Preset | Configuration |
+|--------|---------------|
+| `debug-fast` | Debug with `-Og`; FetchContent dependencies at `-O2` (`NEUTRINO_OPTIMIZE_DEPS`) |
+| `release` | Release |
+| `release-native` | Release for the host CPU (`-march=native`) with ThinLTO |
+| `profiling` | Optimized, with frame pointers and line tables |
+| `asan`, `tsan`, `msan` | Sanitizer builds (`asan` includes UBSan; `msan` uses Clang) |
+| `benchmark` | Release with Ninja and `NEUTRINO_{project_name_upper}_BUILD_BENCHMARKS`, runs the `benchmark` tests |
+
+```bash
+cmake --preset release
+cmake --build --preset release
+ctest --preset release
+cmake --workflow --preset benchmark
+```
+
+The benchmark tests run one at a time and each writes Google Benchmark
+JSON into its build directory; the run fails when there are none.
+
+Refresh the presets after updating neutrino-cmake with
+`neutrino-new presets --update`.
+
 ## Installation
 
 ```bash
-cmake -B build -DCMAKE_INSTALL_PREFIX=/usr/local
+cmake -B build{configure_args} -DCMAKE_INSTALL_PREFIX=/usr/local
 cmake --build build
 cmake --install build
 ```
@@ -779,6 +928,224 @@ def write_file(path: Path, content: str):
     print(f"  Created: {path}")
 
 
+# =============================================================================
+# CMake Presets
+# =============================================================================
+
+PRESETS_FILE = "CMakePresets.json"
+
+# Flag-based presets assume a GCC or Clang command line
+NOT_WINDOWS = {"type": "notEquals", "lhs": "${hostSystemName}", "rhs": "Windows"}
+
+
+def build_presets(project_name_upper: str, library: bool, ninja: bool) -> dict:
+    """CMakePresets.json content: configure, build, test and workflow presets."""
+    prefix = f"NEUTRINO_{project_name_upper}"
+    options = {f"{prefix}_BUILD_TESTS": "ON"} if library else {}
+
+    base = {
+        "name": "base",
+        "hidden": True,
+        "binaryDir": "${sourceDir}/build/${presetName}",
+        "cacheVariables": options,
+    }
+    if ninja:
+        base["generator"] = "Ninja"
+
+    configure = [
+        base,
+        {
+            "name": "debug-fast",
+            "displayName": "Debug (-Og)",
+            "description": "Debuggable build that is still fast enough to run real data",
+            "inherits": "base",
+            "condition": NOT_WINDOWS,
+            "cacheVariables": {
+                "CMAKE_BUILD_TYPE": "Debug",
+                "CMAKE_CXX_FLAGS_DEBUG": "-Og -g",
+                "CMAKE_C_FLAGS_DEBUG": "-Og -g",
+                "NEUTRINO_OPTIMIZE_DEPS": "ON",
+            },
+        },
+        {
+            "name": "release",
+            "displayName": "Release",
+            "inherits": "base",
+            "cacheVariables": {"CMAKE_BUILD_TYPE": "Release"},
+        },
+        {
+            "name": "release-native",
+            "displayName": "Release (host ISA, ThinLTO)",
+            "description": "Binaries only run on CPUs like the build host",
+            "inherits": "release",
+            "condition": NOT_WINDOWS,
+            "cacheVariables": {
+                "CMAKE_CXX_FLAGS": "-march=native",
+                "CMAKE_C_FLAGS": "-march=native",
+                "NEUTRINO_LTO_MODE": "thin",
+            },
+        },
+        {
+            "name": "profiling",
+            "displayName": "Profiling (frame pointers, line tables)",
+            "description": "Optimized build that perf and other sampling profilers can unwind",
+            "inherits": "base",
+            "condition": NOT_WINDOWS,
+            "cacheVariables": {
+                "CMAKE_BUILD_TYPE": "RelWithDebInfo",
+                "CMAKE_CXX_FLAGS": "-fno-omit-frame-pointer -mno-omit-leaf-frame-pointer",
+                "CMAKE_C_FLAGS": "-fno-omit-frame-pointer -mno-omit-leaf-frame-pointer",
+                "CMAKE_CXX_FLAGS_RELWITHDEBINFO": "-O2 -g1 -DNDEBUG",
+                "CMAKE_C_FLAGS_RELWITHDEBINFO": "-O2 -g1 -DNDEBUG",
+            },
+        },
+        {
+            "name": "asan",
+            "displayName": "AddressSanitizer + UndefinedBehaviorSanitizer",
+            "inherits": "base",
+            "condition": NOT_WINDOWS,
+            "cacheVariables": {
+                "CMAKE_BUILD_TYPE": "Debug",
+                "NEUTRINO_ENABLE_ASAN": "ON",
+                "NEUTRINO_ENABLE_UBSAN": "ON",
+            },
+        },
+        {
+            "name": "tsan",
+            "displayName": "ThreadSanitizer",
+            "inherits": "base",
+            "condition": NOT_WINDOWS,
+            "cacheVariables": {
+                "CMAKE_BUILD_TYPE": "Debug",
+                "NEUTRINO_ENABLE_TSAN": "ON",
+            },
+        },
+        {
+            "name": "msan",
+            "displayName": "MemorySanitizer (Clang)",
+            "inherits": "base",
+            "condition": {"type": "equals", "lhs": "${hostSystemName}", "rhs": "Linux"},
+            "cacheVariables": {
+                "CMAKE_BUILD_TYPE": "Debug",
+                "CMAKE_C_COMPILER": "clang",
+                "CMAKE_CXX_COMPILER": "clang++",
+                "NEUTRINO_ENABLE_MSAN": "ON",
+            },
+        },
+        {
+            "name": "benchmark",
+            "displayName": "Benchmarks (Release, Ninja)",
+            "inherits": "release",
+            "generator": "Ninja",
+            "cacheVariables": {f"{prefix}_BUILD_BENCHMARKS": "ON"},
+        },
+    ]
+
+    names = [preset["name"] for preset in configure if not preset.get("hidden")]
+    build = [{"name": name, "configurePreset": name} for name in names]
+
+    test = [
+        {
+            "name": "base",
+            "hidden": True,
+            "output": {"outputOnFailure": True},
+            "filter": {"exclude": {"label": "^benchmark$"}},
+        }
+    ]
+    test += [
+        {"name": name, "configurePreset": name, "inherits": "base"}
+        for name in names if name != "benchmark"
+    ]
+    test.append({
+        "name": "benchmark",
+        "configurePreset": "benchmark",
+        "description": "Benchmarks one at a time; each writes Google Benchmark JSON",
+        "environment": {"BENCHMARK_OUT_FORMAT": "json"},
+        "output": {
+            "verbosity": "verbose",
+            "outputLogFile": "${sourceDir}/build/benchmark/benchmark.log",
+        },
+        "filter": {"include": {"label": "^benchmark$"}},
+        "execution": {"jobs": 1, "noTestsAction": "error"},
+    })
+
+    workflow = [{
+        "name": "benchmark",
+        "displayName": "Configure, build and run the benchmarks",
+        "steps": [
+            {"type": "configure", "name": "benchmark"},
+            {"type": "build", "name": "benchmark"},
+            {"type": "test", "name": "benchmark"},
+        ],
+    }]
+
+    # Version 6 (CMake 3.25) is the first with workflow presets
+    return {
+        "version": 6,
+        "cmakeMinimumRequired": {"major": 3, "minor": 25, "patch": 0},
+        "configurePresets": configure,
+        "buildPresets": build,
+        "testPresets": test,
+        "workflowPresets": workflow,
+    }
+
+
+def merge_presets(existing: dict, generated: dict) -> dict:
+    """Replace the generated presets in an existing file, keeping the others."""
+    merged = dict(existing)
+    merged["version"] = max(existing.get("version", 0), generated["version"])
+    merged["cmakeMinimumRequired"] = generated["cmakeMinimumRequired"]
+    for kind in ("configurePresets", "buildPresets", "testPresets", "workflowPresets"):
+        ours = generated[kind]
+        names = {preset["name"] for preset in ours}
+        theirs = [preset for preset in existing.get(kind, []) if preset.get("name") not in names]
+        merged[kind] = ours + theirs
+    return merged
+
+
+def format_presets(presets: dict) -> str:
+    return json.dumps(presets, indent=2) + "\n"
+
+
+def update_presets(args):
+    """Write or refresh CMakePresets.json in an existing project."""
+    root = Path(args.directory)
+    cmake_lists = root / "CMakeLists.txt"
+    if not cmake_lists.is_file():
+        print(f"Error: No CMakeLists.txt in '{root}'.")
+        sys.exit(1)
+
+    content = cmake_lists.read_text()
+    match = re.search(r"^project\(\s*([A-Za-z0-9_.+-]+)", content, re.MULTILINE)
+    if not match:
+        print(f"Error: No project() call in '{cmake_lists}'.")
+        sys.exit(1)
+    project_name = match.group(1)
+    project_name_upper = project_name.upper().replace("-", "_").replace(" ", "_")
+    library = re.search(r"neutrino_define_(library_)?options\(", content) is not None
+    # Named modules need a generator with dependency scanning
+    ninja = any(
+        "neutrino_target_modules(" in path.read_text()
+        for path in [cmake_lists, *root.glob("src/*/CMakeLists.txt")]
+    )
+
+    generated = build_presets(project_name_upper, library, ninja)
+    path = root / PRESETS_FILE
+    if path.exists():
+        if not args.update:
+            print(f"Error: '{path}' already exists. Use --update to refresh it.")
+            sys.exit(1)
+        try:
+            existing = json.loads(path.read_text())
+        except json.JSONDecodeError as error:
+            print(f"Error: Cannot parse '{path}': {error}")
+            sys.exit(1)
+        path.write_text(format_presets(merge_presets(existing, generated)))
+        print(f"  Updated: {path}")
+    else:
+        write_file(path, format_presets(generated))
+
+
 def generate_project(args):
     """Generate project skeleton."""
     project_name = args.name
@@ -790,6 +1157,17 @@ def generate_project(args):
 
     root = Path(args.output) / project_name
 
+    if args.modules and project_type != "compiled":
+        print("Error: --modules requires --type=compiled (module interfaces must be compiled).")
+        sys.exit(1)
+    if args.modules and std < 20:
+        print("Error: --modules requires --std=20 or later.")
+        sys.exit(1)
+
+    # Named modules need CMake's dependency scanning (3.28, Ninja)
+    cmake_minimum = "3.28" if args.modules else "3.20"
+    configure_args = " -G Ninja" if args.modules else ""
+
     if root.exists() and not args.force:
         print(f"Error: Directory '{root}' already exists. Use --force to overwrite.")
         sys.exit(1)
@@ -797,6 +1175,8 @@ def generate_project(args):
     print(f"\nGenerating {project_type} project: {project_name}")
     print(f"  Location: {root}")
     print(f"  C++ Standard: C++{std}")
+    if args.modules:
+        print("  C++20 modules: yes")
     print()
 
     # Determine header extension
@@ -849,6 +1229,7 @@ def generate_project(args):
         project_name_upper=project_name_upper,
         description=description,
         std=std,
+        cmake_minimum=cmake_minimum,
         dependencies=deps_section,
         link_libraries=link_section.format(project_name) if link_section else "",
         install_dependencies=install_deps,
@@ -871,6 +1252,9 @@ def generate_project(args):
     if args.with_examples and project_type != "executable":
         create_directory(root / "examples")
 
+    if args.with_benchmarks and project_type != "executable":
+        create_directory(root / "benchmarks")
+
     # Write files
     write_file(root / "CMakeLists.txt", cmake_content)
 
@@ -883,10 +1267,19 @@ def generate_project(args):
         )
         write_file(root / "src" / project_name / "CMakeLists.txt", src_cmake_content)
     elif project_type == "compiled":
+        modules_section = ""
+        if args.modules:
+            modules_section = (
+                "# C++20 module interface: import {0};\n"
+                "neutrino_target_modules({1}\n"
+                "    FILES {1}.cppm\n"
+                ")\n\n"
+            ).format(project_name.replace("-", "_"), project_name)
         src_cmake_content = TEMPLATES["src/CMakeLists.txt.compiled"].format(
             project_name=project_name,
             std=std,
             link_libraries=link_section.format(project_name) if link_section else "",
+            modules=modules_section,
         )
         write_file(root / "src" / project_name / "CMakeLists.txt", src_cmake_content)
 
@@ -915,6 +1308,15 @@ def generate_project(args):
             ext=header_ext,
         )
         write_file(root / "src" / project_name / f"{project_name}.cc", source_content)
+
+        if args.modules:
+            module_content = TEMPLATES["module.cppm"].format(
+                project_name=project_name,
+                module_name=project_name.replace("-", "_"),
+                namespace=project_name.replace("-", "_"),
+                export_macro=f"{project_name_upper}_EXPORT",
+            )
+            write_file(root / "src" / project_name / f"{project_name}.cppm", module_content)
     elif project_type == "executable":
         main_content = TEMPLATES["main.cpp"].format(project_name=project_name)
         write_file(root / "src" / "main.cc", main_content)
@@ -953,9 +1355,29 @@ def generate_project(args):
         )
         write_file(root / "examples" / "example.cc", example_content)
 
+    # Benchmark files
+    if args.with_benchmarks and project_type != "executable":
+        target_link = f"neutrino::{project_name}" if project_type == "header-only" else project_name
+
+        bench_cmake = TEMPLATES["benchmarks/CMakeLists.txt"].format(
+            project_name=project_name,
+            target_link=target_link,
+        )
+        write_file(root / "benchmarks" / "CMakeLists.txt", bench_cmake)
+
+        bench_content = TEMPLATES["benchmarks/bench_project.cpp"].format(
+            project_name=project_name,
+            namespace=project_name.replace("-", "_"),
+            ext=header_ext,
+        )
+        write_file(root / "benchmarks" / f"bench_{project_name}.cc", bench_content)
+
     # Additional files
     write_file(root / ".gitignore", TEMPLATES[".gitignore"])
 
+    presets = build_presets(project_name_upper, project_type != "executable", args.modules)
+    write_file(root / PRESETS_FILE, format_presets(presets))
+
     clang_format = TEMPLATES[".clang-format"].format(std=std)
     write_file(root / ".clang-format", clang_format)
 
@@ -964,6 +1386,12 @@ def generate_project(args):
         project_name_upper=project_name_upper,
         description=description,
         std=std,
+        cmake_minimum=cmake_minimum,
+        configure_args=configure_args,
+        requirements_extra=(
+            "\n- Ninja 1.11+ and GCC 14+, Clang 16+ or MSVC 19.34+ (C++20 modules)"
+            if args.modules else ""
+        ),
     )
     write_file(root / "README.md", readme)
 
@@ -993,11 +1421,33 @@ def generate_project(args):
     print()
     print("Next steps:")
     print(f"  cd {root}")
-    print("  cmake -B build")
+    print(f"  cmake -B build{configure_args}")
     print("  cmake --build build")
 
 
+def presets_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="neutrino-new presets",
+        description="Write or refresh CMakePresets.json in an existing project",
+    )
+    parser.add_argument(
+        "--directory", "-C",
+        default=".",
+        help="Project directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--update", "-u",
+        action="store_true",
+        help="Refresh an existing CMakePresets.json"
+    )
+    update_presets(parser.parse_args(argv))
+
+
 def main():
+    if sys.argv[1:2] == ["presets"]:
+        presets_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description="Generate a new neutrino ecosystem project",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1005,8 +1455,10 @@ def main():
 Examples:
   %(prog)s mylib --type=header-only --std=17
   %(prog)s mylib --type=compiled --std=20 --with-tests --with-examples
+  %(prog)s mylib --type=compiled --std=20 --modules
   %(prog)s myapp --type=executable --std=20
   %(prog)s mylib --type=header-only --deps=failsafe,euler
+  %(prog)s presets --update
         """
     )
 
@@ -1071,12 +1523,32 @@ Examples:
         help="Don't include examples directory"
     )
 
+    parser.add_argument(
+        "--with-benchmarks",
+        action="store_true",
+        default=True,
+        help="Include benchmarks directory (default: yes)"
+    )
+
+    parser.add_argument(
+        "--no-benchmarks",
+        action="store_false",
+        dest="with_benchmarks",
+        help="Don't include benchmarks directory"
+    )
+
     parser.add_argument(
         "--deps",
         type=str,
         help="Comma-separated dependencies (e.g., failsafe,euler,mio)"
     )
 
+    parser.add_argument(
+        "--modules",
+        action="store_true",
+        help="Add a C++20 module interface unit (compiled libraries, --std=20+)"
+    )
+
     parser.add_argument(
         "--force", "-f",
         action="store_true",
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+neutrino-opt-report - Summarize compiler optimization records per target
+
+Reads the records written by -fsave-optimization-record (GCC JSON, Clang
+YAML) next to a target's object files, as set up by
+neutrino_target_optimization_report(), and reports which loops were not
+vectorized (or calls not inlined) and why.
+
+Usage:
+    neutrino-opt-report collect --target <name> --output <report.json>
+                                [--filter vectorize|inline|all] <objects...>
+    neutrino-opt-report summary <report.json> [--top N]
+    neutrino-opt-report diff <old.json> <new.json>
+
+Examples:
+    neutrino-opt-report summary build/src/scaler.opt-report.json
+    neutrino-opt-report diff baseline/scaler.opt-report.json build/src/scaler.opt-report.json
+
+diff exits with status 1 when a function has fewer vectorized loops or
+inlined calls than in the old report.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+# Generic conclusions that carry no reason of their own
+GENERIC_MESSAGES = {
+    "couldn't vectorize loop",
+    "loop not vectorized",
+}
+
+CLANG_PASS_CATEGORY = {
+    "loop-vectorize": "vectorize",
+    "slp-vectorizer": "vectorize",
+    "inline": "inline",
+}
+
+CLANG_KIND = {
+    "Passed": "passed",
+    "Missed": "missed",
+    "Failure": "missed",
+}
+
+
+# =============================================================================
+# Record Parsing
+# =============================================================================
+
+def gcc_message(parts) -> str:
+    """Flatten a GCC record message (strings and symbol/expression dicts)."""
+    text = ""
+    for part in parts:
+        if isinstance(part, str):
+            text += part
+        elif "symtab_node" in part:
+            text += part["symtab_node"].split("/")[0]
+        elif "expr" in part:
+            text += part["expr"]
+        elif "stmt" in part:
+            text += part["stmt"].strip()
+    return " ".join(text.split())
+
+
+def gcc_pass_groups(passes, table=None) -> dict:
+    """Map GCC pass ids to (name, optgroups), walking nested passes."""
+    table = {} if table is None else table
+    for entry in passes:
+        table[entry["id"]] = (entry["name"], entry.get("optgroups", []))
+        gcc_pass_groups(entry.get("children", []), table)
+    return table
+
+
+def parse_gcc(path: Path) -> list:
+    """Parse a GCC .opt-record.json.gz file."""
+    with gzip.open(path, "rt") as handle:
+        _, passes, records = json.load(handle)
+    groups = gcc_pass_groups(passes)
+
+    remarks = []
+    # Top-level records are the conclusions -fopt-info prints; children
+    # are the analysis that led there
+    for record in records:
+        kind = {"success": "passed", "failure": "missed"}.get(record.get("kind"))
+        message = gcc_message(record.get("message", []))
+        location = record.get("location")
+        if kind is None or not message or location is None:
+            continue
+        name, optgroups = groups.get(record.get("pass"), ("", []))
+        if "vec" in optgroups:
+            category = "vectorize"
+        elif "inline" in optgroups:
+            category = "inline"
+        else:
+            category = "other"
+        chain = record.get("inlining_chain") or [{}]
+        remarks.append({
+            "file": location["file"],
+            "line": location["line"],
+            "column": location.get("column", 0),
+            "function": chain[0].get("fndecl", record.get("function", "")),
+            "pass": name,
+            "kind": kind,
+            "category": category,
+            "message": message.rstrip("."),
+        })
+    return remarks
+
+
+def yaml_scalar(value: str) -> str:
+    """Unquote a scalar as written by LLVM's YAML output."""
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] == "'":
+        return value[1:-1].replace("''", "'")
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return bytes(value[1:-1], "utf-8").decode("unicode_escape")
+    return value
+
+
+DEBUG_LOC = re.compile(r"\{\s*File:\s*(.*?),\s*Line:\s*(\d+),\s*Column:\s*(\d+)\s*\}")
+
+
+def parse_clang(path: Path) -> list:
+    """Parse a Clang .opt.yaml file (no PyYAML needed)."""
+    remarks = []
+    current = None
+
+    def finish():
+        if current and current.get("file"):
+            remarks.append(current)
+
+    for line in path.read_text(errors="replace").splitlines():
+        header = re.match(r"^--- !(\w+)", line)
+        if header:
+            finish()
+            kind = header.group(1)
+            current = {
+                "kind": CLANG_KIND.get(kind, "analysis"),
+                "message": "",
+                "file": "",
+                "line": 0,
+                "column": 0,
+            }
+            continue
+        if current is None:
+            continue
+        field = re.match(r"^(\w+):\s*(.*)$", line)
+        if field:
+            key, value = field.groups()
+            if key == "Pass":
+                current["pass"] = yaml_scalar(value)
+                current["category"] = CLANG_PASS_CATEGORY.get(current["pass"], "other")
+            elif key == "Function":
+                current["function"] = yaml_scalar(value)
+            elif key == "DebugLoc":
+                loc = DEBUG_LOC.search(value)
+                if loc:
+                    current["file"] = yaml_scalar(loc.group(1))
+                    current["line"] = int(loc.group(2))
+                    current["column"] = int(loc.group(3))
+            continue
+        # Args entries: "  - String: '...'" / "  - Callee: foo"; nested
+        # DebugLoc lines of an argument are indented further and skipped
+        arg = re.match(r"^  - (\w+):\s*(.*)$", line)
+        if arg and arg.group(1) != "DebugLoc":
+            current["message"] += yaml_scalar(arg.group(2))
+    finish()
+
+    return [{
+        "file": r["file"],
+        "line": r["line"],
+        "column": r["column"],
+        "function": r.get("function", ""),
+        "pass": r.get("pass", ""),
+        "kind": r["kind"],
+        "category": r.get("category", "other"),
+        "message": " ".join(r["message"].split()).rstrip("."),
+    } for r in remarks]
+
+
+def records_for_object(obj: Path) -> list:
+    """Return the optimization record files written next to an object."""
+    stem = obj.name.rsplit(".", 1)[0]
+    # GCC: foo.cc.o -> foo.cc.cc.opt-record.json.gz; Clang: foo.cc.o -> foo.cc.opt.yaml
+    gcc = re.compile(re.escape(stem) + r"\.[^.]+\.opt-record\.json\.gz$")
+    found = []
+    if obj.parent.is_dir():
+        for candidate in obj.parent.iterdir():
+            if gcc.match(candidate.name) or candidate.name == stem + ".opt.yaml":
+                found.append(candidate)
+    return found
+
+
+def demangle(remarks: list):
+    """Demangle function names in place when c++filt is available."""
+    tool = shutil.which("c++filt") or shutil.which("llvm-cxxfilt")
+    names = sorted({r["function"] for r in remarks if r["function"].startswith("_Z")})
+    if not tool or not names:
+        return
+    result = subprocess.run([tool], input="\n".join(names), capture_output=True, text=True)
+    if result.returncode != 0:
+        return
+    mapping = dict(zip(names, result.stdout.splitlines()))
+    for remark in remarks:
+        remark["function"] = mapping.get(remark["function"], remark["function"])
+
+
+# =============================================================================
+# Commands
+# =============================================================================
+
+def collect(args) -> int:
+    """Gather the records of a target's objects into one JSON report."""
+    remarks = []
+    compilers = set()
+    for obj in args.objects:
+        for record in records_for_object(Path(obj)):
+            if record.name.endswith(".json.gz"):
+                remarks.extend(parse_gcc(record))
+                compilers.add("gcc")
+            else:
+                remarks.extend(parse_clang(record))
+                compilers.add("clang")
+
+    if not compilers:
+        print(f"neutrino-opt-report: no optimization records found for {args.target}", file=sys.stderr)
+
+    if args.filter != "all":
+        remarks = [r for r in remarks if r["category"] == args.filter]
+    demangle(remarks)
+
+    # Identical remarks from repeated inlined copies add nothing
+    unique = {json.dumps(r, sort_keys=True): r for r in remarks}
+    remarks = sorted(unique.values(), key=lambda r: (r["file"], r["line"], r["column"], r["kind"]))
+
+    report = {
+        "target": args.target,
+        "filter": args.filter,
+        "compiler": "/".join(sorted(compilers)),
+        "remarks": remarks,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+
+    missed = len(missed_locations(remarks))
+    print(f"neutrino-opt-report: {args.target}: {len(remarks)} remarks, {missed} missed locations")
+    return 0
+
+
+def load(path: str) -> dict:
+    """Load a report written by collect."""
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def missed_locations(remarks: list) -> dict:
+    """Map (file, line, column, category) to remark lists for optimizations that never succeeded there."""
+    by_location = defaultdict(list)
+    for remark in remarks:
+        by_location[(remark["file"], remark["line"], remark["column"], remark["category"])].append(remark)
+    return {
+        key: items for key, items in by_location.items()
+        if any(r["kind"] == "missed" for r in items) and not any(r["kind"] == "passed" for r in items)
+    }
+
+
+def reasons(items: list) -> list:
+    """Distinct explanations among the remarks of one location."""
+    messages = []
+    for remark in items:
+        if remark["kind"] == "passed":
+            continue
+        if remark["message"] not in messages:
+            messages.append(remark["message"])
+    specific = [m for m in messages if m not in GENERIC_MESSAGES]
+    return specific or messages
+
+
+def display_path(path: str) -> str:
+    """Show paths below the current directory relative to it."""
+    try:
+        relative = os.path.relpath(path)
+    except ValueError:
+        return path
+    return path if relative.startswith("..") else relative
+
+
+def summary(args) -> int:
+    """Print missed optimizations by location and by reason."""
+    report = load(args.report)
+    remarks = report["remarks"]
+    missed = missed_locations(remarks)
+    passed = {(r["file"], r["line"], r["column"], r["category"]) for r in remarks if r["kind"] == "passed"}
+
+    print(f"{report['target']} ({report['compiler'] or 'no records'}, filter: {report['filter']})")
+    print(f"  optimized locations: {len(passed)}")
+    print(f"  missed locations:    {len(missed)}")
+    if not missed:
+        return 0
+
+    print()
+    print("Missed, by location:")
+    by_reason = Counter()
+    for (file, line, column, category), items in sorted(missed.items())[:args.top]:
+        explanation = reasons(items)
+        function = items[0]["function"]
+        print(f"  {display_path(file)}:{line}:{column} [{category}] {function}")
+        for message in explanation:
+            print(f"      {message}")
+    for items in missed.values():
+        for message in reasons(items):
+            by_reason[message] += 1
+
+    print()
+    print("Missed, by reason:")
+    for message, count in by_reason.most_common(args.top):
+        print(f"  {count:5d}  {message}")
+    return 0
+
+
+def optimized_per_function(remarks: list) -> Counter:
+    """Count optimized locations per (file, function, category)."""
+    locations = {
+        (r["file"], r["function"], r["category"], r["line"], r["column"])
+        for r in remarks if r["kind"] == "passed"
+    }
+    return Counter((file, function, category) for file, function, category, _, _ in locations)
+
+
+def diff(args) -> int:
+    """Report functions that lost optimizations between two reports."""
+    old = load(args.old)
+    new = load(args.new)
+
+    # Functions rather than line numbers: edits elsewhere shift lines
+    before = optimized_per_function(old["remarks"])
+    after = optimized_per_function(new["remarks"])
+    lost = {key: before[key] - after[key] for key in before if after[key] < before[key]}
+    gained = {key: after[key] - before[key] for key in after if after[key] > before[key]}
+
+    new_missed = missed_locations(new["remarks"])
+    if lost:
+        print(f"Lost optimizations ({old['target']} -> {new['target']}):")
+        for (file, function, category), count in sorted(lost.items()):
+            verb = "stopped vectorizing" if category == "vectorize" else f"lost {category}"
+            print(f"  {display_path(file)}: {function}: {count} location(s) {verb}")
+            for (mfile, line, column, mcategory), items in sorted(new_missed.items()):
+                if mfile == file and mcategory == category and items[0]["function"] == function:
+                    print(f"      {line}:{column}: {'; '.join(reasons(items))}")
+    if gained:
+        print("Gained optimizations:")
+        for (file, function, category), count in sorted(gained.items()):
+            print(f"  {display_path(file)}: {function}: {count} more {category} location(s)")
+    if not lost and not gained:
+        print("No changes in optimized locations.")
+    return 1 if lost else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Summarize compiler optimization records",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    collect_parser = commands.add_parser("collect", help="Build a report from a target's objects")
+    collect_parser.add_argument("--target", required=True, help="Target name recorded in the report")
+    collect_parser.add_argument("--output", required=True, help="Report JSON to write")
+    collect_parser.add_argument(
+        "--filter",
+        choices=["vectorize", "inline", "all"],
+        default="vectorize",
+        help="Remarks to keep (default: vectorize)"
+    )
+    collect_parser.add_argument("objects", nargs="*", help="Object files of the target")
+    collect_parser.set_defaults(func=collect)
+
+    summary_parser = commands.add_parser("summary", help="Print missed optimizations")
+    summary_parser.add_argument("report", help="Report JSON")
+    summary_parser.add_argument("--top", type=int, default=50, help="Entries per section (default: 50)")
+    summary_parser.set_defaults(func=summary)
+
+    diff_parser = commands.add_parser("diff", help="Compare two reports")
+    diff_parser.add_argument("old", help="Baseline report JSON")
+    diff_parser.add_argument("new", help="Current report JSON")
+    diff_parser.set_defaults(func=diff)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
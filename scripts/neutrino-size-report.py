@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+neutrino-size-report - Attribute a binary's size to dependencies and code
+
+Reads the section table (readelf -S), the sized symbols (nm --size-sort) and,
+when available, the linker map of an executable or shared library, as set
+up by neutrino_target_size_report(), and breaks its size down by dependency,
+namespace and template.
+
+Usage:
+    neutrino-size-report collect --target <name> --binary <file> --output <report.json>
+                                 [--nm nm] [--readelf readelf] [--map <file>]
+                                 [--library <name>=<archive>...] [--budget <size>]
+                                 [<objects...>]
+    neutrino-size-report summary <report.json> [--top N]
+    neutrino-size-report diff <old.json> <new.json> [--max-growth <size>]
+    neutrino-size-report check <report.json> [--budget <size>]
+
+Examples:
+    neutrino-size-report summary build/apps/viewer.size-report.json
+    neutrino-size-report diff baseline/viewer.size-report.json build/apps/viewer.size-report.json
+
+The image size is what the loader maps from the file: allocated sections
+that occupy file space (.bss excluded). Budgets apply to the image size, so
+they are not affected by debug info. Sizes accept K, M and G suffixes.
+
+check exits with status 1 when the image size exceeds the budget; diff does
+when it grew by more than --max-growth.
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+# nm symbol types, folded into the section kind they live in
+NM_KIND = {
+    "t": "text", "w": "text", "i": "text",
+    "r": "rodata", "n": "rodata", "v": "data",
+    "d": "data", "g": "data", "u": "data",
+    "b": "bss", "s": "bss", "c": "bss",
+}
+
+# Demangler prefixes that describe compiler-generated data of a class
+SPECIAL_PREFIXES = (
+    "vtable for ", "VTT for ", "construction vtable for ", "typeinfo for ",
+    "typeinfo name for ", "guard variable for ", "non-virtual thunk to ",
+    "virtual thunk to ", "covariant return thunk to ", "reference temporary for ",
+    "TLS init function for ", "TLS wrapper function for ",
+)
+
+# Output sections the linker synthesizes (GNU ld books them on the first input)
+LINKER_SECTIONS = re.compile(
+    r"^\.(interp|note\..*|gnu\.hash|hash|dynsym|dynstr|gnu\.version.*|rela?\..*|dynamic|got.*|plt.*|eh_frame_hdr)$"
+)
+
+SYSTEM_PREFIXES = ("/usr/", "/lib/", "/lib64/", "/opt/", "/Library/", "/Applications/")
+
+GNU_MAP_INPUT = re.compile(r"^\s*(\.\S+)?\s+0x([0-9a-fA-F]+)\s+0x([0-9a-fA-F]+)\s+(\S.*)$")
+LLD_MAP_LINE = re.compile(r"^\s*[0-9a-fA-F]+\s+[0-9a-fA-F]+\s+([0-9a-fA-F]+)\s+\d+\s+(\S.*)$")
+
+
+def parse_size(text: str) -> int:
+    """Parse a size with an optional K/M/G suffix (powers of 1024)."""
+    match = re.fullmatch(r"([0-9]+(?:\.[0-9]+)?)([KMGkmg]?)", text.strip())
+    if not match:
+        raise SystemExit(f"neutrino-size-report: invalid size '{text}'")
+    scale = {"": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}[match.group(2).lower()]
+    return int(float(match.group(1)) * scale)
+
+
+def format_size(size: int) -> str:
+    """Human-readable size, signed when asked for a delta."""
+    value = abs(size)
+    for unit in ("B", "K", "M"):
+        if value < 1024 or unit == "M":
+            text = f"{value}{unit}" if unit == "B" else f"{value:.1f}{unit}"
+            return f"-{text}" if size < 0 else text
+        value /= 1024.0
+    return str(size)
+
+
+# =============================================================================
+# Binary Parsing
+# =============================================================================
+
+def run_tool(command: list) -> str:
+    """Run a binutils tool and return its output, or "" if it failed."""
+    try:
+        result = subprocess.run(command, capture_output=True, text=True)
+    except OSError:
+        return ""
+    return result.stdout if result.returncode == 0 else ""
+
+
+def parse_sections(readelf: str, binary: str) -> list:
+    """Return [(name, size, allocated, nobits)] from readelf -S -W."""
+    sections = []
+    for line in run_tool([readelf, "-S", "-W", binary]).splitlines():
+        match = re.match(r"^\s*\[\s*(\d+)\]\s+(.*)$", line)
+        if not match or match.group(1) == "0":
+            continue
+        fields = match.group(2).split()
+        if len(fields) < 6:
+            continue
+        name, kind, size = fields[0], fields[1], int(fields[4], 16)
+        # Name Type Address Off Size ES [Flg] Lk Inf Al
+        flags = fields[6] if len(fields) == 10 else ""
+        sections.append((name, size, "A" in flags, kind == "NOBITS"))
+    return sections
+
+
+def parse_symbols(nm: str, binary: str) -> list:
+    """Return [(mangled name, size, kind)] of sized symbols."""
+    symbols = []
+    for line in run_tool([nm, "--size-sort", "-S", "--defined-only", binary]).splitlines():
+        fields = line.split(maxsplit=3)
+        if len(fields) != 4:
+            continue
+        _, size, kind, name = fields
+        symbols.append((name, int(size, 16), NM_KIND.get(kind.lower(), "other")))
+    return symbols
+
+
+def defined_names(nm: str, paths: list) -> set:
+    """Names defined by a set of objects or archives."""
+    names = set()
+    for path in paths:
+        for line in run_tool([nm, "--defined-only", path]).splitlines():
+            fields = line.split()
+            if len(fields) == 3:
+                names.add(fields[2])
+    return names
+
+
+def demangle(names: list) -> dict:
+    """Map mangled names to demangled ones when c++filt is available."""
+    tool = shutil.which("c++filt") or shutil.which("llvm-cxxfilt")
+    mangled = sorted({name for name in names if name.startswith("_Z")})
+    if not tool or not mangled:
+        return {}
+    result = subprocess.run([tool], input="\n".join(mangled), capture_output=True, text=True)
+    if result.returncode != 0:
+        return {}
+    return dict(zip(mangled, result.stdout.splitlines()))
+
+
+# =============================================================================
+# Attribution
+# =============================================================================
+
+def input_owner(path: str, target: str) -> str:
+    """Name the dependency an input file of the link belongs to."""
+    if path.startswith("<internal>") or path == "linker stubs":
+        return "(linker)"
+    archive = re.match(r"^(.*?)\((.*)\)$", path)
+    if archive:
+        path = archive.group(1)
+    name = os.path.basename(path)
+    if archive or name.endswith((".a", ".lib")):
+        if path.startswith(SYSTEM_PREFIXES):
+            return "(runtime)"
+        name = re.sub(r"\.(a|lib)$", "", name)
+        return re.sub(r"^lib", "", name)
+    owner = re.search(r"CMakeFiles/([^/]+)\.dir/", path)
+    if owner:
+        return owner.group(1)
+    if path.startswith(SYSTEM_PREFIXES) or "crt" in name:
+        return "(runtime)"
+    return target
+
+
+def parse_map(path: str, target: str, counted: set) -> dict:
+    """Sum input section sizes per dependency from a GNU ld or lld map."""
+    sizes = defaultdict(int)
+    with open(path, errors="replace") as handle:
+        lines = handle.read().splitlines()
+
+    if lines and lines[0].split()[:3] == ["VMA", "LMA", "Size"]:
+        # lld: output sections, input sections and symbols start in the
+        # "Out", "In" and "Symbol" columns of the header
+        out_column = lines[0].index("Out")
+        in_column = lines[0].index("In")
+        output = None
+        for line in lines[1:]:
+            match = LLD_MAP_LINE.match(line)
+            if not match:
+                continue
+            size, rest, column = int(match.group(1), 16), match.group(2), match.start(2)
+            if column == out_column:
+                output = rest
+            elif column == in_column and output in counted and ":(" in rest:
+                owner = "(linker)" if LINKER_SECTIONS.match(output) else input_owner(rest.split(":(")[0], target)
+                sizes[owner] += size
+        return dict(sizes)
+
+    # GNU ld: output sections start in column 0, input sections are indented
+    # and may wrap their name onto a line of its own
+    started = False
+    output = None
+    for line in lines:
+        if line.startswith("Linker script and memory map"):
+            started = True
+            continue
+        if not started or not line.strip():
+            continue
+        if not line[0].isspace():
+            output = line.split()[0]
+            continue
+        match = GNU_MAP_INPUT.match(line)
+        if match and output in counted:
+            file = match.group(4).strip()
+            if file.startswith(("*", "(")) or "=" in file:
+                continue
+            owner = "(linker)" if LINKER_SECTIONS.match(output) else input_owner(file, target)
+            sizes[owner] += int(match.group(3), 16)
+    return dict(sizes)
+
+
+def split_scope(name: str) -> list:
+    """Split a demangled name on '::' outside template arguments and parentheses."""
+    parts, depth, current, i = [], 0, "", 0
+    while i < len(name):
+        c = name[i]
+        if c in "<(":
+            depth += 1
+        elif c in ">)":
+            depth -= 1
+        if depth == 0 and name.startswith("::", i):
+            parts.append(current)
+            current = ""
+            i += 2
+            continue
+        current += c
+        i += 1
+    parts.append(current)
+    return parts
+
+
+def strip_signature(name: str) -> str:
+    """Drop special prefixes, the return type, parameters and qualifiers of a function."""
+    for prefix in SPECIAL_PREFIXES:
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+            break
+    depth = 0
+    last_space = -1
+    for i, c in enumerate(name):
+        if c in "<(" and not (c == "(" and depth == 0 and i > 0 and not name.endswith("operator", 0, i)):
+            depth += 1
+        elif c in ">)":
+            depth -= 1
+        elif c == "(" and depth == 0:
+            name = name[:i]
+            break
+        elif c == " " and depth == 0 and not name.endswith("operator", 0, i):
+            last_space = i
+    # Function template instantiations carry their return type in front
+    return name[last_space + 1:] if last_space >= 0 else name
+
+
+def namespace_of(name: str) -> str:
+    """Leading namespace (or class) of a demangled name."""
+    scope = split_scope(strip_signature(name))
+    if len(scope) < 2:
+        return "(global)"
+    return scope[0].replace("(anonymous namespace)", "(anonymous)")
+
+
+def template_of(name: str):
+    """Template a symbol instantiates, with its arguments elided, or None."""
+    base = strip_signature(name)
+    if "<" not in base:
+        return None
+    collapsed, depth = "", 0
+    for c in base:
+        if c == "<":
+            if depth == 0:
+                collapsed += "<>"
+            depth += 1
+        elif c == ">":
+            depth -= 1
+        elif depth == 0:
+            collapsed += c
+    return collapsed
+
+
+# =============================================================================
+# Commands
+# =============================================================================
+
+def collect(args) -> int:
+    """Build a size report for one binary."""
+    binary = args.binary
+    target = args.target
+    sections = parse_sections(args.readelf, binary) if args.readelf else []
+    symbols = parse_symbols(args.nm, binary)
+
+    allocated = [s for s in sections if s[2]]
+    if allocated:
+        image_size = sum(size for _, size, _, nobits in allocated if not nobits)
+        bss_size = sum(size for _, size, _, nobits in allocated if nobits)
+    else:
+        # No ELF section table (Mach-O, PE): fall back to the file
+        image_size = os.path.getsize(binary)
+        bss_size = 0
+
+    # Which dependency defines each symbol: the target's own objects first
+    owners = {}
+    libraries = [(target, args.objects)] + [
+        (spec.split("=", 1)[0], [spec.split("=", 1)[1]]) for spec in args.library
+    ]
+    for name, paths in libraries:
+        for symbol in defined_names(args.nm, paths):
+            owners.setdefault(symbol, name)
+
+    demangled = demangle([name for name, _, _ in symbols])
+    entries = []
+    namespaces = defaultdict(int)
+    templates = defaultdict(lambda: {"size": 0, "instances": 0})
+    by_symbol = defaultdict(int)
+    for mangled, size, kind in symbols:
+        if kind == "bss":
+            continue
+        name = demangled.get(mangled, mangled)
+        dependency = owners.get(mangled, "(runtime)")
+        entries.append({"name": name, "size": size, "kind": kind, "dependency": dependency})
+        namespaces[namespace_of(name)] += size
+        by_symbol[dependency] += size
+        template = template_of(name)
+        if template:
+            templates[template]["size"] += size
+            templates[template]["instances"] += 1
+
+    if args.map and os.path.exists(args.map):
+        counted = {name for name, _, alloc, nobits in allocated if not nobits}
+        dependencies = parse_map(args.map, target, counted)
+        attribution = "map"
+    else:
+        dependencies = dict(by_symbol)
+        attribution = "symbols"
+
+    entries.sort(key=lambda e: (-e["size"], e["name"]))
+    report = {
+        "target": target,
+        "binary": os.path.abspath(binary),
+        "file_size": os.path.getsize(binary),
+        "image_size": image_size,
+        "bss_size": bss_size,
+        "budget": parse_size(args.budget) if args.budget else None,
+        "attribution": attribution,
+        "sections": {
+            name: size for name, size, _, nobits in sorted(allocated, key=lambda s: -s[1]) if not nobits
+        },
+        "dependencies": dict(sorted(dependencies.items(), key=lambda item: -item[1])),
+        "namespaces": dict(sorted(namespaces.items(), key=lambda item: -item[1])),
+        "templates": dict(sorted(templates.items(), key=lambda item: -item[1]["size"])),
+        "symbols": entries,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+
+    print(f"neutrino-size-report: {target}: image {format_size(image_size)}, "
+          f"{len(entries)} symbols, {len(dependencies)} dependencies")
+    return 0
+
+
+def load(path: str) -> dict:
+    """Load a report written by collect."""
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def print_table(title: str, items, top: int, total: int):
+    print()
+    print(f"{title}:")
+    for name, size in list(items)[:top]:
+        share = 100.0 * size / total if total else 0.0
+        print(f"  {format_size(size):>8}  {share:5.1f}%  {name}")
+
+
+def summary(args) -> int:
+    """Print the size breakdown of a report."""
+    report = load(args.report)
+    image = report["image_size"]
+    budget = report["budget"]
+    print(f"{report['target']}: image {format_size(image)}, file {format_size(report['file_size'])}, "
+          f"bss {format_size(report['bss_size'])}")
+    if budget:
+        print(f"  budget {format_size(budget)} ({100.0 * image / budget:.0f}% used)")
+
+    print_table("Sections", report["sections"].items(), args.top, image)
+    print_table(f"Dependencies (from {report['attribution']})", report["dependencies"].items(), args.top, image)
+    print_table("Namespaces", report["namespaces"].items(), args.top, image)
+    print_table(
+        "Templates",
+        ((f"{name} ({data['instances']} instances)", data["size"]) for name, data in report["templates"].items()),
+        args.top, image
+    )
+    print_table("Symbols", ((s["name"], s["size"]) for s in report["symbols"]), args.top, image)
+    return 0
+
+
+def print_deltas(title: str, old: dict, new: dict, top: int):
+    deltas = [(key, new.get(key, 0) - old.get(key, 0)) for key in set(old) | set(new)]
+    deltas = sorted((d for d in deltas if d[1]), key=lambda d: (-abs(d[1]), d[0]))
+    if not deltas:
+        return
+    print()
+    print(f"{title}:")
+    for key, delta in deltas[:top]:
+        sign = "+" if delta > 0 else ""
+        print(f"  {sign}{format_size(delta):>8}  {key}")
+
+
+def diff(args) -> int:
+    """Report where size changed between two reports."""
+    old = load(args.old)
+    new = load(args.new)
+    growth = new["image_size"] - old["image_size"]
+    sign = "+" if growth > 0 else ""
+    print(f"{old['target']} -> {new['target']}: image {format_size(old['image_size'])} -> "
+          f"{format_size(new['image_size'])} ({sign}{format_size(growth)})")
+
+    print_deltas("Sections", old["sections"], new["sections"], args.top)
+    print_deltas("Dependencies", old["dependencies"], new["dependencies"], args.top)
+    print_deltas("Namespaces", old["namespaces"], new["namespaces"], args.top)
+    print_deltas(
+        "Templates",
+        {k: v["size"] for k, v in old["templates"].items()},
+        {k: v["size"] for k, v in new["templates"].items()},
+        args.top
+    )
+
+    def symbol_sizes(report):
+        sizes = defaultdict(int)
+        for symbol in report["symbols"]:
+            sizes[symbol["name"]] += symbol["size"]
+        return sizes
+
+    print_deltas("Symbols", symbol_sizes(old), symbol_sizes(new), args.top)
+
+    if args.max_growth is not None and growth > parse_size(args.max_growth):
+        print(f"Image grew by {format_size(growth)}, more than {args.max_growth}")
+        return 1
+    return 0
+
+
+def check(args) -> int:
+    """Fail when the image size exceeds the budget."""
+    report = load(args.report)
+    budget = parse_size(args.budget) if args.budget else report["budget"]
+    if not budget:
+        print(f"neutrino-size-report: {report['target']}: no budget", file=sys.stderr)
+        return 1
+
+    image = report["image_size"]
+    if image > budget:
+        print(f"{report['target']}: image size {format_size(image)} ({image} bytes) "
+              f"exceeds budget {format_size(budget)} ({budget} bytes)")
+        print("Largest dependencies:")
+        for name, size in list(report["dependencies"].items())[:5]:
+            print(f"  {format_size(size):>8}  {name}")
+        return 1
+    print(f"{report['target']}: image size {format_size(image)} within budget {format_size(budget)}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Attribute binary size to dependencies, namespaces and templates",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    collect_parser = commands.add_parser("collect", help="Build a report for a binary")
+    collect_parser.add_argument("--target", required=True, help="Target name recorded in the report")
+    collect_parser.add_argument("--binary", required=True, help="Executable or shared library")
+    collect_parser.add_argument("--output", required=True, help="Report JSON to write")
+    collect_parser.add_argument("--nm", default="nm", help="nm executable (default: nm)")
+    collect_parser.add_argument("--readelf", default="readelf", help="readelf executable (default: readelf)")
+    collect_parser.add_argument("--map", help="Linker map file")
+    collect_parser.add_argument(
+        "--library", action="append", default=[], metavar="NAME=ARCHIVE",
+        help="Static library linked into the binary (repeatable)"
+    )
+    collect_parser.add_argument("--budget", help="Image size budget recorded in the report")
+    collect_parser.add_argument("objects", nargs="*", help="Object files of the target itself")
+    collect_parser.set_defaults(func=collect)
+
+    summary_parser = commands.add_parser("summary", help="Print the size breakdown")
+    summary_parser.add_argument("report", help="Report JSON")
+    summary_parser.add_argument("--top", type=int, default=20, help="Entries per section (default: 20)")
+    summary_parser.set_defaults(func=summary)
+
+    diff_parser = commands.add_parser("diff", help="Compare two reports")
+    diff_parser.add_argument("old", help="Previous report JSON")
+    diff_parser.add_argument("new", help="Current report JSON")
+    diff_parser.add_argument("--top", type=int, default=20, help="Entries per section (default: 20)")
+    diff_parser.add_argument("--max-growth", help="Fail when the image grew by more than this")
+    diff_parser.set_defaults(func=diff)
+
+    check_parser = commands.add_parser("check", help="Check the image size against a budget")
+    check_parser.add_argument("report", help="Report JSON")
+    check_parser.add_argument("--budget", help="Budget (default: the one recorded in the report)")
+    check_parser.set_defaults(func=check)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+neutrino-startup-bench - Measure process startup latency, cold and warm
+
+Launches a program repeatedly and measures the wall time until it exits or,
+with --ready-marker, until the marker appears on its stdout (the program is
+then terminated). Cold runs evict the program and its shared libraries from
+the page cache first; warm runs follow an unmeasured warm-up run. Results,
+including the dynamic loader statistics, are written in Google Benchmark's
+JSON format, as set up by neutrino_add_startup_benchmark().
+
+Usage:
+    neutrino-startup-bench --name <name> --output <results.json> [--runs N]
+                           [--ready-marker <text>] [--timeout <seconds>]
+                           -- <program> [<args>...]
+
+Examples:
+    neutrino-startup-bench --name player --output player.startup.json \\
+        --runs 10 --ready-marker "audio ready" -- build/bin/player song.mod
+
+Cold runs drop the page cache (/proc/sys/vm/drop_caches) when permitted,
+and otherwise evict the program and its libraries with posix_fadvise(); the
+method used is recorded in the context. Without either (non-Linux hosts)
+only warm runs are measured.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+LOADER_STATISTICS = {
+    "loader_cycles": r"total startup time in dynamic loader: ([0-9]+)",
+    "loader_load_cycles": r"time needed to load objects: ([0-9]+)",
+    "loader_relocation_cycles": r"time needed for relocation: ([0-9]+)",
+    "relocations": r"final number of relocations: ([0-9]+)",
+    "relative_relocations": r"number of relative relocations: ([0-9]+)",
+}
+
+
+# =============================================================================
+# Page Cache
+# =============================================================================
+
+def shared_objects(program: str) -> list:
+    """Shared libraries the loader maps for a program (glibc only)."""
+    env = dict(os.environ, LD_TRACE_LOADED_OBJECTS="1")
+    try:
+        result = subprocess.run([program], env=env, capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    paths = []
+    for line in result.stdout.splitlines():
+        match = re.search(r"(/\S+) \(0x", line)
+        if match and os.path.exists(match.group(1)):
+            paths.append(match.group(1))
+    return paths
+
+
+def drop_caches() -> bool:
+    """Drop the whole page cache; needs root."""
+    try:
+        os.sync()
+        with open("/proc/sys/vm/drop_caches", "w") as handle:
+            handle.write("1\n")
+        return True
+    except OSError:
+        return False
+
+
+def evict(paths: list) -> bool:
+    """Ask the kernel to drop the cached pages of some files."""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return True
+
+
+def cold_method(files: list) -> str:
+    """Pick how cold runs evict the page cache: drop_caches, fadvise or none."""
+    if sys.platform.startswith("linux") and drop_caches():
+        return "drop_caches"
+    if sys.platform.startswith("linux") and evict(files):
+        return "fadvise"
+    return "none"
+
+
+# =============================================================================
+# Runs
+# =============================================================================
+
+def launch(command: list, ready_marker, timeout: float, env=None, stderr=None) -> dict:
+    """Run the command once and return wall/cpu time (ms) and page faults."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        command,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE if ready_marker else subprocess.DEVNULL,
+        stderr=stderr,
+    )
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        process.kill()
+
+    watchdog = threading.Timer(timeout, kill)
+    watchdog.start()
+
+    elapsed = None
+    if ready_marker:
+        # Scan stdout as it arrives; the program may keep running
+        marker = ready_marker.encode()
+        seen = b""
+        while True:
+            chunk = os.read(process.stdout.fileno(), 65536)
+            if not chunk:
+                break
+            seen = (seen + chunk)[-(len(marker) + 65536):]
+            if marker in seen:
+                elapsed = time.perf_counter() - start
+                process.terminate()
+                break
+
+    _, status, usage = os.wait4(process.pid, 0)
+    if elapsed is None:
+        elapsed = time.perf_counter() - start
+    watchdog.cancel()
+    # wait4() reaped the child; keep Popen from trying again
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.stdout:
+        process.stdout.close()
+
+    if timed_out.is_set() and not (ready_marker and marker in seen):
+        raise RuntimeError(f"no {'ready marker' if ready_marker else 'exit'} within {timeout:g}s")
+    if ready_marker and marker not in seen:
+        raise RuntimeError(f"exited with {process.returncode} before printing '{ready_marker}'")
+    if not ready_marker and process.returncode != 0:
+        raise RuntimeError(f"exited with {process.returncode}")
+
+    return {
+        "real_ms": elapsed * 1000.0,
+        "cpu_ms": (usage.ru_utime + usage.ru_stime) * 1000.0,
+        "major_faults": usage.ru_majflt,
+        "minor_faults": usage.ru_minflt,
+    }
+
+
+def loader_statistics(command: list, ready_marker, timeout: float, files: list) -> dict:
+    """One extra run with LD_DEBUG=statistics (glibc only)."""
+    env = dict(os.environ, LD_DEBUG="statistics")
+    with tempfile.TemporaryFile(mode="w+") as stderr:
+        try:
+            launch(command, ready_marker, timeout, env=env, stderr=stderr)
+        except (OSError, RuntimeError):
+            return {}
+        stderr.seek(0)
+        output = stderr.read()
+
+    # The counts are printed at exit, so programs stopped at their ready
+    # marker only report the loader time
+    stats = {}
+    for key, pattern in LOADER_STATISTICS.items():
+        match = re.search(pattern, output)
+        if match:
+            stats[key] = int(match.group(1))
+    if stats:
+        stats["shared_objects"] = len(files) - 1
+    return stats
+
+
+def entries(name: str, samples: list, counters: dict) -> list:
+    """Google Benchmark entries: one per repetition plus aggregates."""
+    result = []
+    common = {
+        "family_index": 0,
+        "per_family_instance_index": 0,
+        "run_name": name,
+        "repetitions": len(samples),
+        "threads": 1,
+        "time_unit": "ms",
+    }
+    for index, sample in enumerate(samples):
+        result.append({
+            "name": name,
+            **common,
+            "run_type": "iteration",
+            "repetition_index": index,
+            "iterations": 1,
+            "real_time": round(sample["real_ms"], 3),
+            "cpu_time": round(sample["cpu_ms"], 3),
+            "major_faults": sample["major_faults"],
+            "minor_faults": sample["minor_faults"],
+            **counters,
+        })
+
+    aggregates = [("mean", statistics.mean), ("median", statistics.median)]
+    if len(samples) > 1:
+        aggregates.append(("stddev", statistics.stdev))
+    for aggregate, function in aggregates:
+        result.append({
+            "name": f"{name}_{aggregate}",
+            **common,
+            "run_type": "aggregate",
+            "aggregate_name": aggregate,
+            "aggregate_unit": "time",
+            "iterations": len(samples),
+            "real_time": round(function([s["real_ms"] for s in samples]), 3),
+            "cpu_time": round(function([s["cpu_ms"] for s in samples]), 3),
+            "major_faults": function([s["major_faults"] for s in samples]),
+            **(counters if aggregate != "stddev" else {}),
+        })
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure process startup latency",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--name", required=True, help="Benchmark name")
+    parser.add_argument("--output", required=True, help="Google Benchmark JSON to write")
+    parser.add_argument("--runs", type=int, default=10, help="Measured runs per mode (default: 10)")
+    parser.add_argument("--ready-marker", help="Stop the clock when this text appears on stdout")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait per run (default: 60)")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="-- <program> [<args>...]")
+    args = parser.parse_args()
+
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    if not command:
+        parser.error("no program given")
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    program = os.path.abspath(command[0])
+    files = [program] + shared_objects(program)
+    method = cold_method(files)
+
+    try:
+        cold = []
+        if method != "none":
+            for _ in range(args.runs):
+                if method == "drop_caches":
+                    drop_caches()
+                else:
+                    evict(files)
+                cold.append(launch(command, args.ready_marker, args.timeout))
+
+        launch(command, args.ready_marker, args.timeout)
+        warm = [launch(command, args.ready_marker, args.timeout) for _ in range(args.runs)]
+    except RuntimeError as error:
+        print(f"neutrino-startup-bench: {args.name}: {error}", file=sys.stderr)
+        return 1
+
+    counters = loader_statistics(command, args.ready_marker, args.timeout, files)
+    benchmarks = []
+    if cold:
+        benchmarks += entries(f"startup/{args.name}/cold", cold, counters)
+    benchmarks += entries(f"startup/{args.name}/warm", warm, counters)
+
+    report = {
+        "context": {
+            "date": datetime.now(timezone.utc).astimezone().isoformat(timespec="seconds"),
+            "host_name": socket.gethostname(),
+            "executable": program,
+            "num_cpus": os.cpu_count(),
+            "mhz_per_cpu": 0,
+            "cpu_scaling_enabled": False,
+            "caches": [],
+            "load_avg": list(os.getloadavg()) if hasattr(os, "getloadavg") else [],
+            "library_build_type": "release",
+            "system": platform.platform(),
+            "command": command,
+            "ready_marker": args.ready_marker,
+            "cold_method": method,
+        },
+        "benchmarks": benchmarks,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+
+    print(f"{args.name}: startup (median of {args.runs}, "
+          f"{'ready marker' if args.ready_marker else 'to exit'}):")
+    if cold:
+        print(f"  cold ({method}): {statistics.median(s['real_ms'] for s in cold):8.2f} ms, "
+              f"{statistics.median(s['major_faults'] for s in cold):g} major faults")
+    else:
+        print("  cold: not measured (page cache cannot be dropped on this host)")
+    print(f"  warm: {statistics.median(s['real_ms'] for s in warm):8.2f} ms")
+    if counters:
+        parts = [f"{counters['shared_objects']} shared objects"]
+        if "relocations" in counters:
+            parts.append(f"{counters['relocations']} relocations")
+        if "loader_cycles" in counters:
+            parts.append(f"{counters['loader_cycles']} cycles")
+        print(f"  loader: {', '.join(parts)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())